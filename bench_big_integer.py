@@ -0,0 +1,448 @@
+"""Benchmarks for big_integer module."""
+import argparse
+import json
+import platform
+import random
+import sys
+import timeit
+import tracemalloc
+
+import big_integer
+from big_integer import BigInteger
+from big_integer_profile import fit_exponent
+
+
+# Operations of the suite: BigInteger call and the same call on Python int.
+# Divisors and shift amounts are chosen so results stay about operand sized.
+OPERATIONS = {
+    "add": (lambda a, b: a + b, lambda a, b: a + b),
+    "sub": (lambda a, b: a - b, lambda a, b: a - b),
+    "mul": (lambda a, b: a * b, lambda a, b: a * b),
+    "floordiv": (lambda a, b: a // b, lambda a, b: a // b),
+    "mod": (lambda a, b: a % b, lambda a, b: a % b),
+    "or": (lambda a, b: a | b, lambda a, b: a | b),
+    "powmod": (lambda a, b: pow(a, 65537, b), lambda a, b: pow(a, 65537, b)),
+    "lshift": (lambda a, b: a << 1000, lambda a, b: a << 1000),
+    "to_bin": (lambda a, b: a.to_bin(), lambda a, b: format(a, "b")),
+    "str": (lambda a, b: str(a), lambda a, b: str(a)),
+}
+# Operations whose second operand has half of the digits.
+HALF_SIZED = {"floordiv", "mod"}
+
+
+def random_digits(digits: int, rng: random.Random) -> str:
+    """Build random string of decimal digits without leading zero
+
+    Args:
+        digits (int): Number of digits
+        rng (random.Random): Source of randomness
+
+    Returns:
+        str: Random digits
+    """
+    first = str(rng.randint(1, 9))
+    return first + "".join(rng.choices("0123456789", k=digits - 1))
+
+
+def random_integer(digits: int, rng: random.Random) -> BigInteger:
+    """Build random big integer with exact number of decimal digits
+
+    Args:
+        digits (int): Number of digits
+        rng (random.Random): Source of randomness
+
+    Returns:
+        BigInteger: Random big integer
+    """
+    return BigInteger(random_digits(digits, rng))
+
+
+def uncached(function) -> object:
+    """Wrap call so that every run starts with an empty conversion cache
+
+    Without it the warm-up run fills the cache and timed runs of radix
+    conversions, and of operators converting decimal operands, are cache
+    hits. Cached powers of limb bases are dropped as well, so every run
+    pays the full conversion.
+
+    Args:
+        function (callable): Call without arguments
+
+    Returns:
+        callable: Call clearing big_integer.conversion_cache first
+    """
+
+    def call():
+        big_integer.conversion_cache.clear()
+        return function()
+
+    return call
+
+
+def time_call(function, repeat: int = 3) -> float:
+    """Measure best time of a call
+
+    Args:
+        function (callable): Call without arguments to measure
+        repeat (int, optional): Number of measurements. Defaults to 3.
+
+    Returns:
+        float: Best time of one call in seconds
+    """
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+def tune_karatsuba(
+    sizes: list, thresholds: list, square: bool = False, seed: int = 0
+) -> dict:
+    """Measure multiplication time for candidate Karatsuba thresholds
+
+    Args:
+        sizes (list): Operand sizes in decimal digits
+        thresholds (list): Candidate thresholds in limbs
+        square (bool, optional): Tune squaring instead. Defaults to False.
+        seed (int, optional): Seed of operands. Defaults to 0.
+
+    Returns:
+        dict: Mapping of threshold to list of times per size
+    """
+    rng = random.Random(seed)
+    operands = [
+        (random_integer(size, rng), random_integer(size, rng)) for size in sizes
+    ]
+    name = "KARATSUBA_SQUARE_THRESHOLD" if square else "KARATSUBA_THRESHOLD"
+    saved = getattr(big_integer, name)
+    results = {}
+    try:
+        for threshold in thresholds:
+            setattr(big_integer, name, threshold)
+            results[threshold] = [
+                time_call((lambda a=a: a * a) if square else (lambda a=a, b=b: a * b))
+                for a, b in operands
+            ]
+    finally:
+        setattr(big_integer, name, saved)
+    return results
+
+
+def best_threshold(results: dict) -> int:
+    """Pick threshold with the least total time
+
+    Args:
+        results (dict): Output of tune_karatsuba
+
+    Returns:
+        int: Best threshold
+    """
+    return min(results, key=lambda threshold: sum(results[threshold]))
+
+
+def print_tuning(title: str, sizes: list, results: dict) -> None:
+    """Print tuning results as a table
+
+    Args:
+        title (str): Title of the table
+        sizes (list): Operand sizes in decimal digits
+        results (dict): Output of tune_karatsuba
+    """
+    print(title)
+    print("threshold " + " ".join(f"{size:>10}" for size in sizes))
+    for threshold, times in results.items():
+        print(f"{threshold:>9} " + " ".join(f"{time * 1000:>8.3f}ms" for time in times))
+    print(f"best: {best_threshold(results)}")
+
+
+def bench_radix_conversion(sizes: list, seed: int = 0) -> dict:
+    """Measure to_bin and from_bin times over operand sizes
+
+    Args:
+        sizes (list): Operand sizes in decimal digits
+        seed (int, optional): Seed of operands. Defaults to 0.
+
+    Returns:
+        dict: Mapping of conversion name to list of times per size
+    """
+    rng = random.Random(seed)
+    results = {"to_bin": [], "from_bin": []}
+    for size in sizes:
+        integer = random_integer(size, rng)
+        binary = integer.to_bin()
+        results["to_bin"].append(time_call(uncached(integer.to_bin), repeat=1))
+        results["from_bin"].append(time_call(uncached(binary.from_bin), repeat=1))
+    return results
+
+
+def print_scaling(title: str, sizes: list, results: dict) -> None:
+    """Print times over sizes with fitted complexity exponents
+
+    Args:
+        title (str): Title of the table
+        sizes (list): Operand sizes in decimal digits
+        results (dict): Mapping of operation name to list of times per size
+    """
+    print(title)
+    print("operation " + " ".join(f"{size:>10}" for size in sizes) + "   exponent")
+    for name, times in results.items():
+        print(
+            f"{name:>9} "
+            + " ".join(f"{time * 1000:>8.2f}ms" for time in times)
+            + f"   {fit_exponent(sizes, times):>8.2f}"
+        )
+
+
+def peak_memory(function) -> int:
+    """Measure peak memory allocated by one call
+
+    Args:
+        function (callable): Call without arguments to measure
+
+    Returns:
+        int: Peak of traced allocations in bytes
+    """
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def make_operands(size: int, mode: str, signs: str, half: bool, rng) -> tuple:
+    """Build operands of the suite as big integers and Python ints
+
+    Args:
+        size (int): Digits of the first operand
+        mode (str): "decimal" or "binary"
+        signs (str): Signs of operands, like "+-"
+        half (bool): Whether the second operand has half of the digits
+        rng (random.Random): Source of randomness
+
+    Returns:
+        tuple: Two big integers and two Python ints
+    """
+    texts = [
+        random_digits(size, rng),
+        random_digits(max(size // 2, 1) if half else size, rng),
+    ]
+    texts = [text if sign == "+" else "-" + text for text, sign in zip(texts, signs)]
+    integers = [BigInteger(text) for text in texts]
+    if mode == "binary":
+        integers = [integer.to_bin() for integer in integers]
+    return integers[0], integers[1], int(texts[0]), int(texts[1])
+
+
+def run_suite(
+    sizes: list,
+    operations: list,
+    modes: list,
+    signs: list,
+    max_time: float = 1.0,
+    seed: int = 0,
+) -> list:
+    """Measure every operation over operand sizes, modes and signs
+
+    A series stops growing once a single call takes longer than max_time,
+    so quadratic operations do not stall the whole run at large sizes.
+
+    Args:
+        sizes (list): Operand sizes in decimal digits
+        operations (list): Names from OPERATIONS
+        modes (list): "decimal" and/or "binary"
+        signs (list): Sign patterns like "++" or "+-"
+        max_time (float, optional): Time limit of one call in seconds.
+            Defaults to 1.0.
+        seed (int, optional): Seed of operands. Defaults to 0.
+
+    Returns:
+        list: One record per measured case
+    """
+    rng = random.Random(seed)
+    records = []
+    for name in operations:
+        call, baseline = OPERATIONS[name]
+        for mode in modes:
+            for sign in signs:
+                for size in sorted(sizes):
+                    a, b, int_a, int_b = make_operands(
+                        size, mode, sign, name in HALF_SIZED, rng
+                    )
+                    measured = uncached(lambda: call(a, b))
+                    seconds = time_call(measured, repeat=1)
+                    records.append(
+                        {
+                            "operation": name,
+                            "mode": mode,
+                            "signs": sign,
+                            "size": size,
+                            "ops_per_sec": 1 / seconds,
+                            "int_ops_per_sec": 1
+                            / time_call(lambda: baseline(int_a, int_b), repeat=1),
+                            "peak_memory": peak_memory(measured),
+                        }
+                    )
+                    if seconds > max_time:
+                        break
+    return records
+
+
+def fit_exponents(records: list) -> dict:
+    """Fit complexity exponent of every measured series
+
+    Args:
+        records (list): Output of run_suite
+
+    Returns:
+        dict: Mapping of "operation/mode/signs" to fitted exponent
+    """
+    series = {}
+    for record in records:
+        key = f"{record['operation']}/{record['mode']}/{record['signs']}"
+        series.setdefault(key, []).append(record)
+    return {
+        key: fit_exponent(
+            [record["size"] for record in cases],
+            [1 / record["ops_per_sec"] for record in cases],
+        )
+        for key, cases in series.items()
+        if len(cases) > 1
+    }
+
+
+def save_results(path: str, records: list) -> None:
+    """Save suite results as JSON
+
+    Args:
+        path (str): Output file name
+        records (list): Output of run_suite
+    """
+    document = {
+        "python": sys.version,
+        "platform": platform.platform(),
+        "results": records,
+        "exponents": fit_exponents(records),
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(document, file, indent=2)
+
+
+def print_suite(records: list) -> None:
+    """Print suite results with comparison to Python int
+
+    Args:
+        records (list): Output of run_suite
+    """
+    print(
+        f"{'operation':>9} {'mode':>7} {'signs':>5} {'digits':>8} "
+        f"{'ops/sec':>12} {'int ops/sec':>12} {'slowdown':>9} {'peak KiB':>9}"
+    )
+    for record in records:
+        print(
+            f"{record['operation']:>9} {record['mode']:>7} {record['signs']:>5} "
+            f"{record['size']:>8} {record['ops_per_sec']:>12.1f} "
+            f"{record['int_ops_per_sec']:>12.1f} "
+            f"{record['int_ops_per_sec'] / record['ops_per_sec']:>8.1f}x "
+            f"{record['peak_memory'] / 1024:>9.1f}"
+        )
+    print()
+    for key, exponent in fit_exponents(records).items():
+        print(f"{key:>24}  exponent {exponent:.2f}")
+
+
+def compare_results(old_path: str, new_path: str, tolerance: float = 0.1) -> int:
+    """Print per case speed ratio between two saved runs
+
+    Args:
+        old_path (str): JSON of the reference run
+        new_path (str): JSON of the run to check
+        tolerance (float, optional): Allowed relative slowdown.
+            Defaults to 0.1.
+
+    Returns:
+        int: Number of cases slower than tolerance allows
+    """
+    with open(old_path, encoding="utf-8") as file:
+        old = json.load(file)["results"]
+    with open(new_path, encoding="utf-8") as file:
+        new = json.load(file)["results"]
+
+    def key(record):
+        return record["operation"], record["mode"], record["signs"], record["size"]
+
+    reference = {key(record): record for record in old}
+    regressions = 0
+    for record in new:
+        if key(record) not in reference:
+            continue
+        ratio = record["ops_per_sec"] / reference[key(record)]["ops_per_sec"]
+        flag = ""
+        if ratio < 1 - tolerance:
+            flag = "  REGRESSION"
+            regressions += 1
+        print("{:>9} {:>7} {:>5} {:>8}".format(*key(record)) + f" {ratio:>7.2f}x{flag}")
+    return regressions
+
+
+def main() -> None:
+    """Run benchmarks selected from command line"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+    tune = commands.add_parser("tune", help="tune Karatsuba thresholds")
+    tune.add_argument(
+        "--sizes", type=int, nargs="+", default=[500, 1000, 2000, 5000, 10000]
+    )
+    tune.add_argument(
+        "--thresholds", type=int, nargs="+", default=[8, 16, 24, 32, 48, 64, 96, 128]
+    )
+    radix = commands.add_parser("radix", help="scaling of to_bin and from_bin")
+    radix.add_argument(
+        "--sizes", type=int, nargs="+", default=[1000, 2000, 4000, 8000, 16000, 32000]
+    )
+    suite = commands.add_parser("suite", help="every operator against Python int")
+    suite.add_argument(
+        "--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000, 100000]
+    )
+    suite.add_argument(
+        "--operations", nargs="+", choices=list(OPERATIONS), default=list(OPERATIONS)
+    )
+    suite.add_argument(
+        "--modes", nargs="+", choices=["decimal", "binary"], default=["decimal"]
+    )
+    suite.add_argument("--signs", nargs="+", default=["++", "+-"])
+    suite.add_argument("--max-time", type=float, default=1.0)
+    suite.add_argument("--output", help="save results to JSON file")
+    compare = commands.add_parser("compare", help="diff two saved suite runs")
+    compare.add_argument("old")
+    compare.add_argument("new")
+    compare.add_argument("--tolerance", type=float, default=0.1)
+    args = parser.parse_args()
+    sys.set_int_max_str_digits(0)
+    if args.command == "tune":
+        print_tuning(
+            "multiplication",
+            args.sizes,
+            tune_karatsuba(args.sizes, args.thresholds),
+        )
+        print_tuning(
+            "squaring",
+            args.sizes,
+            tune_karatsuba(args.sizes, args.thresholds, square=True),
+        )
+    elif args.command == "radix":
+        print_scaling(
+            "radix conversion", args.sizes, bench_radix_conversion(args.sizes)
+        )
+    elif args.command == "suite":
+        records = run_suite(
+            args.sizes, args.operations, args.modes, args.signs, args.max_time
+        )
+        print_suite(records)
+        if args.output:
+            save_results(args.output, records)
+    elif args.command == "compare":
+        sys.exit(1 if compare_results(args.old, args.new, args.tolerance) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,197 @@
 """BigInteger implementation for representing and manipulating large integers."""
-from dataclasses import dataclass
+import itertools
+import math
+import operator
+import struct
+import sys
+import weakref
+from array import array
+from collections import OrderedDict
 
 VARIANT = 70
 # 70 Кривень Павло ['<=', '<'] ['*', '//'] ['|', '<<']
+
+# Magnitudes are stored as arrays of machine-word limbs, least significant
+# limb first. Decimal numbers pack 9 digits per limb, binary ones 32 bits.
+LIMB_TYPECODE = "I"
+DECIMAL_LIMB_DIGITS = 9
+DECIMAL_BASE = 10**DECIMAL_LIMB_DIGITS
+BINARY_LIMB_DIGITS = 32
+BINARY_BASE = 1 << BINARY_LIMB_DIGITS
+
+# Operand sizes in limbs from which multiplication switches from schoolbook
+# to Karatsuba. Tuned with bench_big_integer.py.
+KARATSUBA_THRESHOLD = 64
+KARATSUBA_SQUARE_THRESHOLD = 64
+# Divisor size in limbs from which division multiplies by a Newton
+# reciprocal instead of running long division.
+NEWTON_DIVISION_THRESHOLD = 800
+# Size in limbs below which radix conversion runs Horner's scheme instead of
+# splitting the number on a power of the source base.
+RADIX_CONVERSION_THRESHOLD = 32
+
+# Number of radix conversions and powers of limb bases kept by the
+# least recently used conversion cache.
+CONVERSION_CACHE_SIZE = 128
+# Integer operands in this range are coerced to shared big integers.
+SMALL_INTEGER_RANGE = range(-5, 257)
+# Bit length up to which ints and decimal limbs are converted with native
+# divmod and Horner's scheme instead of splitting them in halves.
+INT_CONVERSION_BITS = RADIX_CONVERSION_THRESHOLD * BINARY_LIMB_DIGITS
+
+# Packed binary format of a number: flags, three pad bytes and limb count,
+# followed by 32-bit little-endian limbs, least significant first.
+PACKED_HEADER = struct.Struct("<B3xQ")
+PACKED_NEGATIVE = 1
+PACKED_BINARY = 2
+
+# Shared big integers of small values, built on first use.
+_small_integers = {}
+# Size of an array of limbs without items.
+_EMPTY_LIMBS_SIZE = array(LIMB_TYPECODE).__sizeof__()
+
+
 class BigInteger:
     """BigInteger implementation for representing and manipulating large integers."""
 
+    __slots__ = (
+        "_limbs",
+        "_length",
+        "_binary",
+        "_version",
+        "_shared",
+        "_hash",
+        "positive",
+        "__weakref__",
+    )
+
     def __init__(self, init_value: object = None) -> None:
-        self._head = None
-        self._tail = None
+        self._limbs = array(LIMB_TYPECODE)
+        self._length = 0
+        self._binary = False
+        self._version = 0
+        # Whether limbs may be referenced by another number or the cache.
+        self._shared = False
+        # Hash of magnitude, computed on first use.
+        self._hash = None
         self.positive = True
-        self.is_binary = False
-        init_value = init_value or None
-
         if isinstance(init_value, int):
-            init_value = str(init_value)
+            self.positive = init_value >= 0
+            self._limbs = _limbs_from_int(abs(init_value), False)
+            self._length = _significant_digits(self._limbs, False)
+            return
+        init_value = init_value or None
 
         if init_value is not None:
-            if '-' in init_value:
+            if init_value.startswith("-"):
                 self.positive = False
                 init_value = init_value.lstrip("-")
-            for digit in init_value:
-                self._add_digit(int(digit))
+            _check_digits(init_value, 10)
+            self._limbs = _limbs_from_string(init_value, DECIMAL_LIMB_DIGITS, 10)
+            self._length = len(init_value)
+
+    @classmethod
+    def _from_limbs(
+        cls, limbs: array, positive: bool = True, binary: bool = False
+    ) -> "BigInteger":
+        """Build big integer directly from normalized limbs
+
+        Args:
+            limbs (array): Limbs of magnitude, least significant first
+            positive (bool, optional): Sign of the number. Defaults to True.
+            binary (bool, optional): Whether limbs hold bits. Defaults to False.
+
+        Returns:
+            BigInteger: Big integer owning the given limbs
+        """
+        integer = cls()
+        integer._limbs = limbs
+        integer._binary = binary
+        integer._length = _significant_digits(limbs, binary)
+        integer.positive = positive or not limbs
+        return integer
+
+    def __getstate__(self) -> tuple:
+        limbs = self._limbs
+        if isinstance(limbs, array):
+            # The state holds the live limbs, so whoever builds a number of
+            # it shares them and this one copies them before changing.
+            self._shared = True
+        else:
+            limbs = array(LIMB_TYPECODE, limbs)
+        return limbs, self._length, self._binary, self.positive
+
+    def __setstate__(self, state: tuple) -> None:
+        self._limbs, self._length, self._binary, self.positive = state
+        self._version = 0
+        # The limbs may still belong to the number the state was taken from.
+        self._shared = True
+        self._hash = None
+
+    def _begin_mutation(self) -> None:
+        """Prepare big integer for changing its value in place
+
+        Shared limbs are copied first, and the cached hash and conversions
+        of the old value are dropped.
+        """
+        if self._shared:
+            self._limbs = array(LIMB_TYPECODE, self._limbs)
+            self._shared = False
+        self._version += 1
+        self._hash = None
+
+    def _share(self, positive: bool) -> "BigInteger":
+        """Build big integer sharing limbs with this one in constant time
+
+        Args:
+            positive (bool): Sign of the new number
+
+        Returns:
+            BigInteger: Big integer that copies limbs on its first mutation
+        """
+        integer = BigInteger._from_limbs(self._limbs, positive, self._binary)
+        integer._length = self._length
+        integer._hash = self._hash
+        integer._shared = self._shared = True
+        return integer
+
+    def freeze(self) -> "FrozenBigInteger":
+        """Immutable big integer with the value of this one
+
+        Returns:
+            FrozenBigInteger: Frozen number sharing limbs with this one
+        """
+        return FrozenBigInteger(self)
+
+    @property
+    def is_binary(self) -> bool:
+        """Whether digits of the number are bits"""
+        return self._binary
+
+    @is_binary.setter
+    def is_binary(self, value: bool) -> None:
+        value = bool(value)
+        if value == self._binary:
+            return
+        digits = self._digit_string()
+        radix, limb_digits = (
+            (2, BINARY_LIMB_DIGITS) if value else (10, DECIMAL_LIMB_DIGITS)
+        )
+        if value:
+            _check_digits(digits, 2)
+        self._begin_mutation()
+        self._limbs = _limbs_from_string(digits, limb_digits, radix)
+        self._binary = value
+
+    def _radix(self) -> tuple:
+        """Return radix parameters of the number
+
+        Returns:
+            tuple: radix of a digit, digits per limb and limb base
+        """
+        if self._binary:
+            return 2, BINARY_LIMB_DIGITS, BINARY_BASE
+        return 10, DECIMAL_LIMB_DIGITS, DECIMAL_BASE
 
     def _add_digit(self, digit: int, right: bool = True) -> None:
         """Add digit in the head of the list
@@ -30,27 +200,24 @@ class BigInteger:
             digit (int): Digit to add
             right (bool, optional): Place to inplace digit. Defaults to True.
         """
+        radix, limb_digits, base = self._radix()
+        self._begin_mutation()
         if right:
-            self._head, self._head.next = DecimalDigitNode(digit), self._head
-            if self._head.next is not None:
-                self._head.next.previous = self._head
-            else:
-                self._tail = self._head
-        else:
-            self._tail, self._tail.previous = DecimalDigitNode(digit), self._tail
-            if self._tail.previous is not None:
-                self._tail.previous.next = self._tail
-            else:
-                self._head = self._tail
+            _limbs_imuladd_small(self._limbs, radix, digit, base)
+        elif digit:
+            index, offset = divmod(self._length, limb_digits)
+            if len(self._limbs) <= index:
+                self._limbs.extend([0] * (index + 1 - len(self._limbs)))
+            self._limbs[index] += digit * radix**offset
+        self._length += 1
 
     def _remove_digit(self) -> None:
         """Remove digit from the head of the list"""
-        if self._head is not None:
-            self._head = self._head.next
-            if self._head is not None:
-                self._head.previous = None
-            else:
-                self._tail = None
+        if self._length:
+            radix, _, base = self._radix()
+            self._begin_mutation()
+            _limbs_idivmod_small(self._limbs, radix, base)
+            self._length -= 1
 
     def _digits(self) -> list:
         """Return list of digits
@@ -58,19 +225,103 @@ class BigInteger:
         Returns:
             list: list of digits from tail to head(in default left to right order)
         """
-        digits = []
-        current = self._tail
-        while current is not None:
-            digits.append(current.digit)
-            current = current.previous
-        return digits
+        return [int(digit) for digit in self._digit_string()]
+
+    def _digit_string(self) -> str:
+        """Return digits of magnitude as a string, keeping leading zeros
+
+        Returns:
+            str: digits from the most significant to the least significant
+        """
+        return "".join(self._digit_chunks(max(len(self._limbs), 1)))
+
+    def _digit_chunks(
+        self, chunk_limbs: int, binary: bool = None, reverse: bool = False
+    ) -> object:
+        """Yield digits of magnitude in chunks
+
+        Digits in the radix of the number keep leading zeros. Digits in the
+        other radix come from a conversion that yields its top or bottom
+        limbs first, so they are streamed while the conversion goes on.
+
+        Args:
+            chunk_limbs (int): Number of limbs formatted per chunk
+            binary (bool, optional): Whether to yield binary digits.
+                Defaults to None, the radix of the number.
+            reverse (bool, optional): Whether to yield the least significant
+                digits first, each chunk in that order too. Defaults to False.
+
+        Yields:
+            str: digits from the most significant to the least significant
+        """
+        if binary is None or binary == self._binary:
+            binary, blocks = self._binary, (self._limbs,)
+            leading = self._length - _significant_digits(self._limbs, binary)
+        else:
+            blocks = _limbs_radix_blocks(self._limbs, binary, 0, reverse)
+            leading = 0
+        if not self._limbs:
+            yield "0" * (leading + 1)
+        elif reverse:
+            yield from _format_reversed_chunks(blocks, binary, chunk_limbs, leading)
+        else:
+            yield from _format_chunks(blocks, binary, chunk_limbs, leading)
+
+    def iter_chunks(
+        self,
+        binary: bool = None,
+        reverse: bool = False,
+        chunk_limbs: int = 1 << 10,
+        encoded: bool = False,
+    ) -> object:
+        """Yield string form of big integer in chunks
+
+        Chunks joined together give str() of the number, or its reverse
+        with reverse set, without building the whole string. Binary digits
+        of a decimal number are produced while it is converted, so the
+        first chunks come after one division instead of a full to_bin.
+
+        Args:
+            binary (bool, optional): Whether to yield binary digits.
+                Defaults to None, the radix of the number.
+            reverse (bool, optional): Whether to start from the least
+                significant digit. Defaults to False.
+            chunk_limbs (int, optional): Limbs formatted per chunk.
+                Defaults to 1024.
+            encoded (bool, optional): Whether to yield ASCII bytes for
+                sockets, binary files or hashlib. Defaults to False.
+
+        Yields:
+            str | bytes: Chunks of digits, with the sign on the first chunk
+                or with reverse on the last one
+        """
+        chunks = self._digit_chunks(chunk_limbs, binary, reverse)
+        if not self.positive:
+            if reverse:
+                chunks = itertools.chain(chunks, ("-",))
+            else:
+                chunks = itertools.chain(("-",), chunks)
+        if encoded:
+            chunks = (chunk.encode("ascii") for chunk in chunks)
+        yield from chunks
+
+    def iter_digits(self, binary: bool = None, reverse: bool = False) -> object:
+        """Yield digits of magnitude one by one
+
+        Args:
+            binary (bool, optional): Whether to yield bits. Defaults to None,
+                the radix of the number.
+            reverse (bool, optional): Whether to start from the least
+                significant digit. Defaults to False.
+
+        Yields:
+            int: Digits, leading zeros included in the radix of the number
+        """
+        for chunk in self._digit_chunks(1 << 10, binary, reverse):
+            yield from map(int, chunk)
 
     def __str__(self) -> str:
-        represent = ''
-        current = self._tail
-        while current is not None:
-            represent +=str(current)
-            current = current.previous
+        represent = self._digit_string()
         return represent if self.positive else '-'+represent
 
     def to_string(self):
@@ -81,10 +332,295 @@ class BigInteger:
         """
         return str(self)
 
+    def __int__(self) -> int:
+        """Convert big integer to Python int
+
+        Returns:
+            int: Value of big integer
+        """
+        value = _limbs_to_int(self._limbs, self._binary)
+        return value if self.positive else -value
+
+    __index__ = __int__
+
+    def to_file(self, file: object, chunk_limbs: int = 1 << 14) -> None:
+        """Write big integer to a text file without building the whole string
+
+        Args:
+            file (io.TextIOBase): File-like object with write method
+            chunk_limbs (int, optional): Limbs formatted per write.
+                Defaults to 16384.
+        """
+        for chunk in self.iter_chunks(chunk_limbs=chunk_limbs):
+            file.write(chunk)
+
+    @classmethod
+    def from_file(
+        cls, file: object, binary: bool = False, chunk_size: int = 1 << 20
+    ) -> "BigInteger":
+        """Read big integer from a text file chunk by chunk
+
+        Digits are grouped into limbs from the most significant one while
+        reading, and the grouping is realigned with one short division at
+        the end, so the text is never held in memory as a whole.
+
+        Args:
+            file (io.IOBase): File-like object with read method
+            binary (bool, optional): Whether the file holds bits.
+                Defaults to False.
+            chunk_size (int, optional): Characters read at once.
+                Defaults to 1048576.
+
+        Raises:
+            ValueError: File does not hold a number
+
+        Returns:
+            BigInteger: Big integer from the file
+        """
+        radix, limb_digits, base = (
+            (2, BINARY_LIMB_DIGITS, BINARY_BASE)
+            if binary
+            else (10, DECIMAL_LIMB_DIGITS, DECIMAL_BASE)
+        )
+        integer = BigInteger()
+        groups = []
+        pending = ""
+        # Trailing whitespace of a chunk is held back, since only the end of
+        # the input tells whether it ends the number or precedes more digits.
+        spaces = ""
+        first = True
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            if isinstance(chunk, bytes):
+                chunk = chunk.decode("ascii")
+            if first:
+                chunk = chunk.lstrip()
+                if chunk.startswith("-"):
+                    integer.positive = False
+                    chunk = chunk.lstrip("-")
+                first = not chunk
+            chunk = spaces + chunk
+            stripped = chunk.rstrip()
+            spaces = chunk[len(stripped):]
+            chunk = stripped
+            _check_digits(chunk, radix)
+            integer._length += len(chunk)
+            text = pending + chunk
+            full = len(text) - len(text) % limb_digits
+            groups.extend(
+                int(text[start:start + limb_digits], radix)
+                for start in range(0, full, limb_digits)
+            )
+            pending = text[full:]
+        if integer._length == 0:
+            raise ValueError("file does not contain a number")
+        limbs = array(LIMB_TYPECODE, reversed(groups))
+        if pending:
+            padding = limb_digits - len(pending)
+            limbs.insert(0, int(pending, radix) * radix**padding)
+            _limbs_idivmod_small(limbs, radix**padding, base)
+        integer._limbs = _limbs_normalize(limbs)
+        integer._binary = binary
+        return integer if cls is BigInteger else cls(integer)
+
+    def to_bytes(self) -> bytes:
+        """Pack big integer into the binary format
+
+        The format is PACKED_HEADER with sign and radix flags and the limb
+        count, followed by the limbs as 32-bit little-endian words.
+
+        Returns:
+            bytes: Packed big integer
+        """
+        return self._packed_header() + _limbs_bytes(self._limbs)
+
+    def write_bytes(self, file: object) -> None:
+        """Write big integer to a binary file in the packed format
+
+        Limbs are written straight from memory without building bytes.
+
+        Args:
+            file (io.BufferedIOBase): File-like object with write method
+        """
+        file.write(self._packed_header())
+        if sys.byteorder == "little":
+            with memoryview(self._limbs) as view, view.cast("B") as chunk:
+                file.write(chunk)
+        else:
+            file.write(_limbs_bytes(self._limbs))
+
+    def _packed_header(self) -> bytes:
+        """Return header of the packed format for this number
+
+        Returns:
+            bytes: Packed flags and limb count
+        """
+        flags = (0 if self.positive else PACKED_NEGATIVE) | (
+            PACKED_BINARY if self._binary else 0
+        )
+        return PACKED_HEADER.pack(flags, len(self._limbs))
+
+    @classmethod
+    def from_bytes(cls, data: object, copy: bool = True) -> "BigInteger":
+        """Unpack big integer from the binary format
+
+        Without copying, the number keeps a read-only view of the limbs in
+        data, which must not change while the number is in use; its limbs
+        are copied on its first in-place change.
+
+        Args:
+            data (bytes-like): bytes, bytearray, memoryview or mmap
+            copy (bool, optional): Whether to copy limbs out of data.
+                Defaults to True.
+
+        Raises:
+            ValueError: Data does not hold exactly one packed number
+
+        Returns:
+            BigInteger: Unpacked big integer
+        """
+        view = memoryview(data).cast("B")
+        integer, end = _unpack_integer(view, 0, copy)
+        if end != len(view):
+            raise ValueError("trailing data after packed integer")
+        return integer if cls is BigInteger else cls(integer)
+
+    @classmethod
+    def iter_bytes(cls, source: object, copy: bool = True) -> object:
+        """Lazily unpack consecutive packed big integers
+
+        Args:
+            source (io.BufferedIOBase | bytes-like): Binary file, or data
+                such as an mmap holding packed numbers back to back
+            copy (bool, optional): Whether numbers unpacked from data copy
+                their limbs. Numbers read from a file always own them.
+                Defaults to True.
+
+        Raises:
+            ValueError: Source ends in the middle of a number
+
+        Yields:
+            BigInteger: Unpacked big integers in order
+        """
+        if hasattr(source, "read"):
+            while True:
+                header = source.read(PACKED_HEADER.size)
+                if not header:
+                    return
+                if len(header) < PACKED_HEADER.size:
+                    raise ValueError("truncated packed integer")
+                flags, count = PACKED_HEADER.unpack(header)
+                limbs = array(LIMB_TYPECODE)
+                try:
+                    limbs.fromfile(source, count)
+                except EOFError as error:
+                    raise ValueError("truncated packed integer") from error
+                if sys.byteorder != "little":
+                    limbs.byteswap()
+                integer = _packed_integer(flags, limbs, False)
+                yield integer if cls is BigInteger else cls(integer)
+        view = memoryview(source).cast("B")
+        offset = 0
+        while offset < len(view):
+            integer, offset = _unpack_integer(view, offset, copy)
+            yield integer if cls is BigInteger else cls(integer)
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """Read-only view of the limbs, least significant first
+
+        Args:
+            flags (int): Requested buffer flags
+
+        Returns:
+            memoryview: Limbs as native 32-bit words
+        """
+        # The exported array must not be resized or changed, so the next
+        # in-place change of the number works on a copy.
+        self._shared = True
+        return memoryview(self._limbs).toreadonly()
+
     def dump_integer(self) -> None:
         """Dump integer to the head of the list"""
-        while self._tail.digit == 0 and self._tail.previous is not None:
-            self._tail = self._tail.previous
+        if self._length:
+            self._length = _significant_digits(self._limbs, self._binary)
+
+    def __sizeof__(self) -> int:
+        """Memory held by the number
+
+        Returns:
+            int: Bytes of the object and of the storage of its limbs
+        """
+        return object.__sizeof__(self) + _limbs_storage(self._limbs)[0].__sizeof__()
+
+    def sizeof(self) -> dict:
+        """Report memory held by the number
+
+        Returns:
+            dict: Bytes of the object, bytes allocated for limbs, bytes used
+                by them, spare bytes of over-allocation or of a loaded buffer
+                the limbs are a view of, bytes of cached radix conversions,
+                whether limbs may be shared and count of leading zero digits
+        """
+        _, allocated = _limbs_storage(self._limbs)
+        used = len(self._limbs) * self._limbs.itemsize
+        significant = _significant_digits(self._limbs, self._binary)
+        return {
+            "object": object.__sizeof__(self),
+            "allocated": allocated,
+            "used": used,
+            "spare": allocated - used,
+            "cached": sum(
+                limbs.__sizeof__() for limbs in conversion_cache.conversions(self)
+            ),
+            "shared": self._shared,
+            "leading_zeros": max(self._length - significant, 0),
+        }
+
+    def compact(self) -> "BigInteger":
+        """Drop storage the value does not need
+
+        Leading zero digits are dropped as by dump_integer, limbs move to an
+        exactly sized array of the number's own when they have spare room or
+        are a view of a loaded buffer, and cached radix conversions of the
+        number are evicted.
+
+        Returns:
+            BigInteger: This big integer
+        """
+        conversion_cache.discard(self)
+        self.dump_integer()
+        limbs = self._limbs
+        if isinstance(limbs, memoryview):
+            limbs = array(LIMB_TYPECODE, limbs)
+        limbs = _limbs_trim(limbs)
+        if limbs is not self._limbs:
+            self._limbs = limbs
+            self._shared = False
+        return self
+
+    def _common_limbs(self, __o: object) -> tuple:
+        """Return magnitudes of two big integers in a common radix
+
+        Binary numbers stay binary when both operands are binary, otherwise
+        the binary operand is converted to decimal.
+
+        Args:
+            __o (BigInteger): Another big integer
+
+        Returns:
+            tuple: limbs of self, limbs of another, limb base and binary flag
+        """
+        if self._binary == __o._binary:
+            base = BINARY_BASE if self._binary else DECIMAL_BASE
+            return self._limbs, __o._limbs, base, self._binary
+        return (
+            _converted_limbs(self, False),
+            _converted_limbs(__o, False),
+            DECIMAL_BASE,
+            False,
+        )
 
     def __add__(self, __o: object) -> object:
         """Add two big integers
@@ -95,55 +631,13 @@ class BigInteger:
         Returns:
             BigInteger: sum of two big integers
         """
-        integer_sum = BigInteger()
-        sum_carry = 0
-        if isinstance(__o, int) or (isinstance(__o, str) and __o.isdigit()):
-            __o = BigInteger(str(__o))
-        current, another_current = (
-            (self._head, __o._head) if __o._abs_lt(self) else (__o._head, self._head)
-        )
-        while current is not None:
-            if another_current is not None:
-                if (self.positive and __o.positive) or (
-                    not self.positive and not __o.positive
-                ):
-                    digit_sum, sum_carry = (
-                        current.digit + another_current.digit + sum_carry
-                    ) % 10, (current.digit + another_current.digit + sum_carry) // 10
-                else:
-                    digit_sum = (current.digit - another_current.digit + sum_carry) % 10
-                    sum_carry = (
-                        -1
-                        if current.digit - another_current.digit + sum_carry < 0
-                        else 0
-                    )
-                integer_sum._add_digit(digit_sum, False)
-                current = current.next
-                another_current = another_current.next
-            else:
-                if (self.positive and __o.positive) or (
-                    not self.positive and not __o.positive
-                ):
-                    integer_sum._add_digit(current.digit + sum_carry, False)
-                    sum_carry = 0
-                else:
-                    integer_sum._add_digit(current.digit + sum_carry, False)
-                    sum_carry = -1 if current.digit + sum_carry < 0 else 0
-                current = current.next
-
-        integer_sum._add_digit(sum_carry, False)
-        integer_sum.dump_integer()
-        if (
-            (self.positive and __o.positive)
-            or (self._abs_lt(__o) and __o.positive)
-            or (__o._abs_lt(self) and self.positive)
-        ):
-            integer_sum.positive = True
-        else:
-            integer_sum.positive = False
-        if integer_sum._digits() == [0]:
-            integer_sum.positive = True
-        return integer_sum
+        if _small_int(__o):
+            return self._add_small(__o)
+        __o = _coerce(__o)
+        return self._add(__o, __o.positive)
+
+    def __radd__(self, __o: object) -> object:
+        return self + __o
 
     def __sub__(self, __o: object) -> object:
         """Subtract two big integers
@@ -154,7 +648,119 @@ class BigInteger:
         Returns:
             BigInteger: Difference of two big integers
         """
-        return self + (__o * -1)
+        if _small_int(__o):
+            return self._add_small(-__o)
+        __o = _coerce(__o)
+        return self._add(__o, not __o.positive)
+
+    def __rsub__(self, __o: object) -> object:
+        difference = self - __o
+        difference.positive = not difference.positive or not difference._limbs
+        return difference
+
+    def _add(self, __o: object, positive: bool) -> object:
+        """Add another big integer taken with the given sign
+
+        Args:
+            __o (BigInteger): Another big integer
+            positive (bool): Sign to use for another big integer
+
+        Returns:
+            BigInteger: Sum of two big integers
+        """
+        return self._add_limbs(*self._common_limbs(__o), positive)
+
+    def _add_small(self, value: int) -> object:
+        """Add int fitting one limb without coercing it to big integer
+
+        Args:
+            value (int): Integer with magnitude below the decimal limb base
+
+        Returns:
+            BigInteger: Decimal sum, as if value was a decimal big integer
+        """
+        second = array(LIMB_TYPECODE, [abs(value)] if value else [])
+        return self._add_limbs(
+            _converted_limbs(self, False), second, DECIMAL_BASE, False, value >= 0
+        )
+
+    def _add_limbs(
+        self, first: array, second: array, base: int, binary: bool, positive: bool
+    ) -> object:
+        """Add magnitude taken with the given sign to magnitude of this number
+
+        Args:
+            first (array): Magnitude of this number in the common radix
+            second (array): Magnitude of another number in the common radix
+            base (int): Limb base
+            binary (bool): Whether the common radix is binary
+            positive (bool): Sign of another number
+
+        Returns:
+            BigInteger: Sum of two numbers, holding no spare limb capacity
+        """
+        if self.positive == positive:
+            limbs, positive = _limbs_add(first, second, base), self.positive
+        elif _limbs_cmp(first, second) >= 0:
+            limbs, positive = _limbs_sub(first, second, base), self.positive
+        else:
+            limbs = _limbs_sub(second, first, base)
+        return BigInteger._from_limbs(_limbs_trim(limbs), positive, binary)
+
+    def __iadd__(self, __o: object) -> object:
+        """Add another integer to big integer in place
+
+        Args:
+            __o (BigInteger&quot; | int | str): Another integer
+
+        Returns:
+            BigInteger: This big integer holding the sum
+        """
+        __o = _coerce(__o)
+        self._iadd(__o, __o.positive)
+        return self
+
+    def __isub__(self, __o: object) -> object:
+        """Subtract another integer from big integer in place
+
+        Args:
+            __o (BigInteger&quot; | int | str): Another integer
+
+        Returns:
+            BigInteger: This big integer holding the difference
+        """
+        __o = _coerce(__o)
+        self._iadd(__o, not __o.positive)
+        return self
+
+    def _iadd(self, __o: object, positive: bool) -> None:
+        """Add another big integer taken with the given sign in place
+
+        Limbs of this number are updated without allocating a new number;
+        a fresh array appears only when the radix of the number changes.
+
+        Args:
+            __o (BigInteger): Another big integer
+            positive (bool): Sign to use for another big integer
+        """
+        first, second, base, binary = self._common_limbs(__o)
+        self._begin_mutation()
+        if binary != self._binary:
+            first = array(LIMB_TYPECODE, first)
+        else:
+            first = self._limbs
+        if second is first:
+            second = array(LIMB_TYPECODE, second)
+        self._limbs, self._binary = first, binary
+        if self.positive == positive:
+            _limbs_iadd(first, second, base)
+        elif _limbs_cmp(first, second) >= 0:
+            _limbs_isub(first, second, base)
+        else:
+            _limbs_irsub(first, second, base)
+            self.positive = positive
+        self.positive = self.positive or not first
+        self._length = _significant_digits(first, binary)
 
     def __mul__(self, __o: object) -> object:
         """Multiply two big integers
@@ -165,26 +771,43 @@ class BigInteger:
         Returns:
             BigInteger: Product of two big integers
         """
-        if str(self) == "0" or str(__o) == "0":
-            return BigInteger("0")
-        else:
-            product = BigInteger("0")
-            if isinstance(__o, int) or (isinstance(__o, str) and __o.isdigit()):
-                __o = BigInteger(str(__o))
-            times = (
-                int(str(self).lstrip("-"))
-                if self._abs_lt(__o)
-                else int(str(__o).lstrip("-"))
+        if _small_int(__o):
+            limbs = _converted_limbs(self, False)
+            return BigInteger._from_limbs(
+                _limbs_muladd_small(limbs, abs(__o), 0, DECIMAL_BASE),
+                self.positive == (__o >= 0),
             )
-            increment = self if not self._abs_lt(__o) else __o
-            for _ in range(times):
-                product = product + increment
+        __o = _coerce(__o)
+        first, second, base, binary = self._common_limbs(__o)
+        if __o is self:
+            second = first
+        return BigInteger._from_limbs(
+            _limbs_mul(first, second, base), self.positive == __o.positive, binary
+        )
 
-        if (self.positive and not __o.positive) or (not self.positive and __o.positive):
-            product.positive = False
-        else:
-            product.positive = True
-        return product
+    def __rmul__(self, __o: object) -> object:
+        return self * __o
+
+    def __imul__(self, __o: object) -> object:
+        """Multiply big integer by another integer in place
+
+        Args:
+            __o (BigInteger&quot; | str | int): Another integer
+
+        Returns:
+            BigInteger: This big integer holding the product
+        """
+        __o = _coerce(__o)
+        first, second, base, binary = self._common_limbs(__o)
+        if __o is self:
+            second = first
+        limbs = _limbs_mul(first, second, base)
+        self._begin_mutation()
+        self._limbs = limbs
+        self._binary = binary
+        self.positive = self.positive == __o.positive or not self._limbs
+        self._length = _significant_digits(self._limbs, binary)
+        return self
 
     def __floordiv__(self, __o: object) -> object:
         """Integer division of two big integers
@@ -198,25 +821,10 @@ class BigInteger:
         Returns:
             BigInteger: Integer division of two big integers
         """
-        if isinstance(__o, int) or (isinstance(__o, str) and __o.isdigit()):
-            __o = BigInteger(str(__o))
-        first = self.copy()
-        second = __o.copy()
-        if str(second) == "0":
-            raise ZeroDivisionError
-        count = 0
-        if (first.positive and second.positive) or (
-            not first.positive and not second.positive
-        ):
-            while not first._abs_lt(second):
-                first = first - second
-                count += 1
-        else:
-            while not first._abs_lt(second) or first.positive != second.positive:
-                first = first + second
-                count -= 1
-        result = BigInteger(str(count))
-        return result
+        return divmod(self, __o)[0]
+
+    def __rfloordiv__(self, __o: object) -> object:
+        return divmod(_coerce(__o), self)[0]
 
     def __mod__(self, __o: object) -> object:
         """Modulo of two big integers
@@ -230,168 +838,594 @@ class BigInteger:
         Returns:
             BigInteger: Remainder of two big integers
         """
-        if isinstance(__o, int) or (isinstance(__o, str) and __o.isdigit()):
-            __o = BigInteger(str(__o))
-        __o.dump_integer()
-        if str(__o) == "0":
-            raise ZeroDivisionError
-        result = (
-            self - ((self // __o) * __o).abs()
-            if self.positive
-            else self + ((self // __o) * __o).abs()
-        )
-        if result < 0:
-            result = result + __o.abs()
+        if _small_int(__o):
+            if not __o:
+                raise ZeroDivisionError
+            _, remainder = _limbs_divmod_small(
+                _converted_limbs(self, False), abs(__o), DECIMAL_BASE
+            )
+            if not self.positive and remainder:
+                remainder = abs(__o) - remainder
+            return BigInteger._from_limbs(_limbs_from_int(remainder, False))
+        __o = _coerce(__o)
+        result = divmod(self, __o)[1]
+        if not result.positive:
+            return result + __o.abs()
+        result._limbs = _limbs_trim(result._limbs)
         return result
 
-    def __or__(self, __o: object) -> object:
-        """Bitwise OR of two big integers
+    def __divmod__(self, __o: object) -> tuple:
+        """Quotient and remainder of two big integers in one division
 
         Args:
-            __o (BigInteger): Another big integer
+            __o (BigInteger&quot; | str | int): Another integer
+
+        Raises:
+            ZeroDivisionError: Division by zero
 
         Returns:
-            BigInteger: Bitwise OR of two big integers
+            tuple: Floor quotient and remainder with the sign of the divisor
         """
-        first = self.to_bin() if not self.is_binary else self.abs()
-        second = __o.to_bin() if not __o.is_binary else __o.abs()
-        first_current = first._head
-        second_current = second._head
-        or_bin_integer = BigInteger()
-        while first_current is not None or second_current is not None:
-            if first_current is None:
-                or_bin_integer._add_digit(second_current.digit, False)
-                second_current = second_current.next
-            elif second_current is None:
-                or_bin_integer._add_digit(first_current.digit, False)
-                first_current = first_current.next
-            else:
-                or_bin_integer._add_digit(
-                    first_current.digit | second_current.digit, False
-                )
-                first_current = first_current.next
-                second_current = second_current.next
-        or_bin_integer.is_binary = True
-        return or_bin_integer
+        if _small_int(__o):
+            return self._divmod_small(__o)
+        __o = _coerce(__o)
+        dividend, divisor, base, binary = self._common_limbs(__o)
+        if not divisor:
+            raise ZeroDivisionError
+        quotient, remainder = _limbs_divmod(dividend, divisor, base)
+        if self.positive != __o.positive and remainder:
+            quotient = _limbs_add(quotient, array(LIMB_TYPECODE, [1]), base)
+            remainder = _limbs_sub(divisor, remainder, base)
+        return (
+            BigInteger._from_limbs(quotient, self.positive == __o.positive, binary),
+            BigInteger._from_limbs(remainder, __o.positive, binary),
+        )
 
-    def __lshift__(self, shift: object) -> object:
-        """Left bit shift of big integer
+    def _divmod_small(self, divisor: int) -> tuple:
+        """Divide by int fitting one limb without coercing it to big integer
 
         Args:
-            shift (int|BigInteger): Shift amount
+            divisor (int): Integer with magnitude below the decimal limb base
+
+        Raises:
+            ZeroDivisionError: Division by zero
 
         Returns:
-            BigInteger: Bitwise left shift of big integer
+            tuple: Decimal floor quotient and remainder with the sign of the
+                divisor
         """
-        converted = self.copy()
-        if not self.is_binary:
-            converted = self.to_bin()
-        if isinstance(shift, BigInteger):
-            shift = int(str(shift))
-        if shift < 0:
-            return self >> -shift
-        for _ in range(shift):
-            converted._add_digit(0)
-        converted.dump_integer()
-        return converted
+        if not divisor:
+            raise ZeroDivisionError
+        positive = divisor > 0
+        quotient, remainder = _limbs_divmod_small(
+            _converted_limbs(self, False), abs(divisor), DECIMAL_BASE
+        )
+        if self.positive != positive and remainder:
+            quotient = _limbs_add(quotient, array(LIMB_TYPECODE, [1]), DECIMAL_BASE)
+            remainder = abs(divisor) - remainder
+        return (
+            BigInteger._from_limbs(quotient, self.positive == positive),
+            BigInteger._from_limbs(_limbs_from_int(remainder, False), positive),
+        )
 
-    def __rshift__(self, shift: int) -> object:
-        """Right bit shift of big integer
+    def __rdivmod__(self, __o: object) -> tuple:
+        return divmod(_coerce(__o), self)
+
+    def __rmod__(self, __o: object) -> object:
+        return _coerce(__o) % self
+
+    def __pow__(self, exponent: object, modulus: object = None) -> object:
+        """Power of big integer, optionally reduced by a modulus
+
+        Exponentiation runs a sliding window over bits of the exponent. With
+        a modulus every step is reduced by a Montgomery context for odd
+        moduli and by a Barrett context otherwise, so no step divides. A
+        negative exponent with a modulus raises the modular inverse.
 
         Args:
-            shift (int): Shift amount
+            exponent (BigInteger&quot; | int): Exponent, negative only with a
+                modulus
+            modulus (BigInteger&quot; | str | int, optional): Modulus.
+                Defaults to None.
+
+        Raises:
+            ValueError: Negative exponent without a modulus, zero modulus or
+                integer not invertible modulo the modulus
 
         Returns:
-            BigInteger: Right bit shift of big integer
+            BigInteger: Power, in range [0, |modulus|) when modulus is given
         """
-        converted = self.copy()
-        if not self.is_binary:
-            converted = self.to_bin()
-        if shift < 0:
-            return self << -shift
-        for _ in range(shift):
-            converted._remove_digit()
-        converted.dump_integer()
-        return converted
+        if modulus is not None:
+            modulus = _coerce(modulus)
+            exponent = _coerce(exponent)
+            if not exponent.positive and modulus._limbs:
+                return pow(self.inverse(modulus), exponent.abs(), modulus)
+            if modulus._limbs and modulus._limbs[0] & 1:
+                return MontgomeryContext(modulus).pow(self, exponent)
+            return BarrettContext(modulus).pow(self, exponent)
+        _, _, base = self._radix()
+        exponent = _exponent_limbs(exponent)
+        limbs = _limbs_sliding_window(
+            self._limbs,
+            exponent,
+            array(LIMB_TYPECODE, [1]),
+            lambda first, second: _limbs_mul(first, second, base),
+        )
+        odd = bool(exponent) and exponent[0] & 1
+        return BigInteger._from_limbs(limbs, self.positive or not odd, self._binary)
 
-    def __lt__(self, __o: object) -> bool:
-        """Less than comparison of two big integers
+    def gcd(self, __o: object) -> object:
+        """Greatest common divisor of two big integers
+
+        Lehmer's algorithm runs Euclid on the leading two limbs in machine
+        precision and applies the collected quotients to whole numbers at
+        once, so most steps cost a few linear passes instead of a division.
 
         Args:
             __o (BigInteger&quot; | str | int): Another integer
 
         Returns:
-            bool: Less than comparison of two big integers
+            BigInteger: Non-negative greatest common divisor
         """
-        if isinstance(__o, int) or (isinstance(__o, str) and __o.isdigit()):
-            __o = BigInteger(str(__o))
+        __o = _coerce(__o)
+        first, second, base, binary = self._common_limbs(__o)
+        limbs = _limbs_gcd(first, second, base, False)[0]
+        return BigInteger._from_limbs(limbs, True, binary)
 
-        if not self.positive and __o.positive:
-            return True
-        elif self.positive and not __o.positive:
-            return False
-        elif self._abs_lt(__o) and self.positive:
-            return True
-        else:
-            return False
+    def xgcd(self, __o: object) -> tuple:
+        """Greatest common divisor with Bezout coefficients
 
-    def copy(self) -> object:
-        """Copy of big integer
+        Args:
+            __o (BigInteger&quot; | str | int): Another integer
 
         Returns:
-            BigInteger: Copy of big integer
+            tuple: Non-negative gcd and coefficients x and y such that
+                self * x + __o * y == gcd
         """
-        return BigInteger(str(self))
+        __o = _coerce(__o)
+        first, second, base, binary = self._common_limbs(__o)
+        limbs, cofactor, negative = _limbs_gcd(first, second, base, True)
+        divisor = BigInteger._from_limbs(limbs, True, binary)
+        x = BigInteger._from_limbs(cofactor, self.positive != negative, binary)
+        if not second:
+            zero = BigInteger._from_limbs(array(LIMB_TYPECODE), True, binary)
+            return divisor, x, zero
+        return divisor, x, (divisor - self * x) // __o
+
+    def inverse(self, modulus: object) -> object:
+        """Modular multiplicative inverse
 
-    def abs(self) -> object:
-        """Absolute value of big integer
+        Args:
+            modulus (BigInteger&quot; | str | int): Modulus
+
+        Raises:
+            ZeroDivisionError: Zero modulus
+            ValueError: Integer and modulus are not coprime
 
         Returns:
-            BigInteger: Big integer with absolute value
+            BigInteger: Inverse in range [0, |modulus|)
         """
-        if self.positive:
-            return BigInteger(str(self))
-        else:
-            return BigInteger(str(self).lstrip("-"))
+        modulus = _coerce(modulus)
+        residue = self % modulus
+        first, second, base, binary = residue._common_limbs(modulus)
+        limbs, cofactor, negative = _limbs_gcd(first, second, base, True)
+        if len(limbs) != 1 or limbs[0] != 1:
+            raise ValueError("base is not invertible for the given modulus")
+        if negative and cofactor:
+            cofactor = _limbs_sub(second, cofactor, base)
+        return BigInteger._from_limbs(cofactor, True, binary)
+
+    def isqrt(self) -> object:
+        """Integer square root
+
+        Newton's iteration doubles the number of correct bits at every step
+        while working on operands of the same precision, so the root costs
+        about as much as two full size divisions.
 
-    def _abs_lt(self, __o: object) -> bool:
-        """Less than comparison of absolute values of two big integers
+        Raises:
+            ValueError: Negative number
 
-        Args:
+        Returns:
+            BigInteger: Largest integer whose square does not exceed the number
+        """
+        if not self.positive:
+            raise ValueError("square root of negative number")
+        limbs = _limbs_isqrt(_converted_limbs(self, True))
+        if not self._binary:
+            limbs = _limbs_to_radix(limbs, False)
+        return BigInteger._from_limbs(limbs, True, self._binary)
+
+    def muladd_small(self, multiplier: int, addend: int) -> "BigInteger":
+        """Multiply big integer by an int and add another int in place
+
+        One pass over the limbs computes the result without coercing the
+        ints to big integers, so Horner-style accumulation allocates
+        nothing but the limbs it grows by. The number keeps its radix.
+
+        Args:
+            multiplier (int): Factor, best kept below the limb base
+            addend (int): Term, best kept below the limb base
+
+        Returns:
+            BigInteger: This big integer holding self * multiplier + addend
+        """
+        multiplier, addend = operator.index(multiplier), operator.index(addend)
+        _, _, base = self._radix()
+        self._begin_mutation()
+        limbs = self._limbs
+        positive = self.positive == (multiplier >= 0)
+        if positive == (addend >= 0):
+            _limbs_imuladd_small(limbs, abs(multiplier), abs(addend), base)
+        else:
+            _limbs_imuladd_small(limbs, abs(multiplier), 0, base)
+            term = _limbs_from_int(abs(addend), self._binary)
+            if _limbs_cmp(limbs, term) >= 0:
+                _limbs_isub(limbs, term, base)
+            else:
+                _limbs_irsub(limbs, term, base)
+                positive = not positive
+        self.positive = positive or not limbs
+        self._length = _significant_digits(limbs, self._binary)
+        return self
+
+    def mul_small(self, multiplier: int) -> "BigInteger":
+        """Multiply big integer by an int in place
+
+        Args:
+            multiplier (int): Factor, best kept below the limb base
+
+        Returns:
+            BigInteger: This big integer holding the product
+        """
+        return self.muladd_small(multiplier, 0)
+
+    def add_small(self, addend: int) -> "BigInteger":
+        """Add an int to big integer in place
+
+        Args:
+            addend (int): Term, best kept below the limb base
+
+        Returns:
+            BigInteger: This big integer holding the sum
+        """
+        return self.muladd_small(1, addend)
+
+    def divmod_small(self, divisor: int) -> tuple:
+        """Divide big integer by an int in place
+
+        Args:
+            divisor (int): Divisor, best kept below the limb base
+
+        Raises:
+            ZeroDivisionError: Division by zero
+
+        Returns:
+            tuple: This big integer holding the floor quotient and the int
+                remainder with the sign of the divisor
+        """
+        divisor = operator.index(divisor)
+        if not divisor:
+            raise ZeroDivisionError
+        _, _, base = self._radix()
+        self._begin_mutation()
+        limbs = self._limbs
+        remainder = _limbs_idivmod_small(limbs, abs(divisor), base)
+        positive = divisor > 0
+        if self.positive != positive and remainder:
+            _limbs_iadd(limbs, array(LIMB_TYPECODE, [1]), base)
+            remainder = abs(divisor) - remainder
+        self.positive = self.positive == positive or not limbs
+        self._length = _significant_digits(limbs, self._binary)
+        return self, remainder if positive else -remainder
+
+    def _bitwise(self, __o: object, operation: object) -> object:
+        """Apply bitwise operation to two's complement forms of two big integers
+
+        Args:
+            __o (BigInteger&quot; | str | int): Another integer
+            operation (callable): Bitwise operation on two limbs
+
+        Returns:
+            BigInteger: Binary big integer with the result
+        """
+        __o = _coerce(__o)
+        first = self.to_bin()
+        second = __o.to_bin()
+        limbs, positive = _limbs_bitwise(
+            first._limbs, first.positive, second._limbs, second.positive, operation
+        )
+        return BigInteger._from_limbs(limbs, positive, binary=True)
+
+    def __or__(self, __o: object) -> object:
+        """Bitwise OR of two big integers
+
+        Args:
+            __o (BigInteger&quot; | str | int): Another integer
+
+        Returns:
+            BigInteger: Bitwise OR of two big integers
+        """
+        return self._bitwise(__o, operator.or_)
+
+    def __and__(self, __o: object) -> object:
+        """Bitwise AND of two big integers
+
+        Args:
+            __o (BigInteger&quot; | str | int): Another integer
+
+        Returns:
+            BigInteger: Bitwise AND of two big integers
+        """
+        return self._bitwise(__o, operator.and_)
+
+    def __xor__(self, __o: object) -> object:
+        """Bitwise XOR of two big integers
+
+        Args:
+            __o (BigInteger&quot; | str | int): Another integer
+
+        Returns:
+            BigInteger: Bitwise XOR of two big integers
+        """
+        return self._bitwise(__o, operator.xor)
+
+    def __invert__(self) -> object:
+        """Bitwise NOT of big integer, equal to -self - 1
+
+        Returns:
+            BigInteger: Bitwise inversion of big integer
+        """
+        binary = self.to_bin()
+        one = array(LIMB_TYPECODE, [1])
+        if binary.positive:
+            limbs = _limbs_add(binary._limbs, one, BINARY_BASE)
+        else:
+            limbs = _limbs_sub(binary._limbs, one, BINARY_BASE)
+        return BigInteger._from_limbs(limbs, not binary.positive, binary=True)
+
+    def __lshift__(self, shift: object) -> object:
+        """Left bit shift of big integer
+
+        Args:
+            shift (int|BigInteger): Shift amount
+
+        Returns:
+            BigInteger: Bitwise left shift of big integer
+        """
+        shift = operator.index(shift)
+        if shift < 0:
+            return self >> -shift
+        converted = self.to_bin()
+        return BigInteger._from_limbs(
+            _limbs_shift_left(converted._limbs, shift), converted.positive, True
+        )
+
+    def __rshift__(self, shift: object) -> object:
+        """Right bit shift of big integer
+
+        Negative numbers are shifted as two's complement ones, so the result
+        is rounded towards negative infinity. The result holds no spare limb
+        capacity.
+
+        Args:
+            shift (int|BigInteger): Shift amount
+
+        Returns:
+            BigInteger: Right bit shift of big integer
+        """
+        shift = operator.index(shift)
+        if shift < 0:
+            return self << -shift
+        converted = self.to_bin()
+        limbs = _limbs_shift_right(converted._limbs, shift)
+        if not converted.positive and _limbs_low_bits(converted._limbs, shift):
+            limbs = _limbs_add(limbs, array(LIMB_TYPECODE, [1]), BINARY_BASE)
+        return BigInteger._from_limbs(_limbs_trim(limbs), converted.positive, True)
+
+    def __ilshift__(self, shift: object) -> object:
+        """Left bit shift of big integer in place
+
+        Args:
+            shift (int|BigInteger): Shift amount
+
+        Returns:
+            BigInteger: This big integer, converted to binary and shifted
+        """
+        shift = operator.index(shift)
+        if shift < 0:
+            return self.__irshift__(-shift)
+        self._to_bin_inplace()
+        self._begin_mutation()
+        _limbs_ishift_left(self._limbs, shift)
+        self._length = _significant_digits(self._limbs, True)
+        return self
+
+    def __irshift__(self, shift: object) -> object:
+        """Right bit shift of big integer in place
+
+        Args:
+            shift (int|BigInteger): Shift amount
+
+        Returns:
+            BigInteger: This big integer, converted to binary and shifted
+        """
+        shift = operator.index(shift)
+        if shift < 0:
+            return self.__ilshift__(-shift)
+        self._to_bin_inplace()
+        self._begin_mutation()
+        round_down = not self.positive and _limbs_low_bits(self._limbs, shift)
+        _limbs_ishift_right(self._limbs, shift)
+        if round_down:
+            _limbs_iadd(self._limbs, array(LIMB_TYPECODE, [1]), BINARY_BASE)
+        self.positive = self.positive or not self._limbs
+        self._length = _significant_digits(self._limbs, True)
+        return self
+
+    def _to_bin_inplace(self) -> None:
+        """Switch storage of big integer to binary limbs keeping its value"""
+        if not self._binary:
+            self._limbs = _converted_limbs(self, True)
+            self._binary = True
+            self._shared = True
+
+    def __lt__(self, __o: object) -> bool:
+        """Less than comparison of two big integers
+
+        Args:
+            __o (BigInteger&quot; | str | int): Another integer
+
+        Returns:
+            bool: Less than comparison of two big integers
+        """
+        return self._compare(__o) < 0
+
+    def __gt__(self, __o: object) -> bool:
+        """Greater than comparison of two big integers
+
+        Args:
+            __o (BigInteger&quot; | str | int): Another integer
+
+        Returns:
+            bool: Greater than comparison of two big integers
+        """
+        return self._compare(__o) > 0
+
+    def __ge__(self, __o: object) -> bool:
+        """Greater than or equal comparison of two big integers
+
+        Args:
+            __o (BigInteger&quot; | str | int): Another integer
+
+        Returns:
+            bool: Greater than or equal comparison of two big integers
+        """
+        return self._compare(__o) >= 0
+
+    def __eq__(self, __o: object) -> bool:
+        """Equality of values of two big integers
+
+        Strings are not equal to any big integer, as their hashes differ.
+
+        Args:
+            __o (BigInteger&quot; | int): Another integer
+
+        Returns:
+            bool: Whether the numbers are equal
+        """
+        if not isinstance(__o, (BigInteger, int)):
+            return NotImplemented
+        return self._compare(__o) == 0
+
+    def __ne__(self, __o: object) -> bool:
+        """Inequality of values of two big integers
+
+        Args:
+            __o (BigInteger&quot; | int): Another integer
+
+        Returns:
+            bool: Whether the numbers differ
+        """
+        equal = self.__eq__(__o)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self) -> int:
+        """Hash of the value, equal to the hash of the same Python int
+
+        The hash follows the value, and in-place methods such as +=,
+        muladd_small or add_small change the value. A mutable number changed
+        while it is a dictionary key or set member is lost in that container.
+        Keys, sets and deduplication should use freeze(), whose
+        FrozenBigInteger cannot change.
+
+        Returns:
+            int: Hash of big integer
+        """
+        if self._hash is None:
+            _, _, base = self._radix()
+            modulus = sys.hash_info.modulus
+            result = 0
+            for i in range(len(self._limbs) - 1, -1, -1):
+                result = (result * base + self._limbs[i]) % modulus
+            self._hash = result
+        result = self._hash
+        if not self.positive:
+            result = -result
+        return -2 if result == -1 else result
+
+    def _compare(self, __o: object) -> int:
+        """Three-way comparison of two big integers
+
+        Magnitudes are compared by limb count first and then from the most
+        significant limb, without building digit lists.
+
+        Args:
+            __o (BigInteger&quot; | str | int): Another integer
+
+        Returns:
+            int: -1, 0 or 1 if self is less, equal or greater than another
+        """
+        if _small_int(__o):
+            # Two limbs in either radix exceed any int fitting one limb.
+            if len(self._limbs) > 1:
+                return 1 if self.positive else -1
+            value = self._limbs[0] if self._limbs else 0
+            value = value if self.positive else -value
+            return (value > __o) - (value < __o)
+        __o = _coerce(__o)
+        first, second, _, _ = self._common_limbs(__o)
+        first_sign = (1 if self.positive else -1) if first else 0
+        second_sign = (1 if __o.positive else -1) if second else 0
+        if first_sign != second_sign:
+            return -1 if first_sign < second_sign else 1
+        return _limbs_cmp(first, second) * first_sign
+
+    def copy(self) -> object:
+        """Copy of big integer
+
+        The copy shares limbs with this number until one of them changes.
+
+        Returns:
+            BigInteger: Copy of big integer
+        """
+        return self._share(self.positive)
+
+    def __copy__(self) -> object:
+        return self.copy()
+
+    def __deepcopy__(self, memo: dict) -> object:
+        return self.copy()
+
+    def abs(self) -> object:
+        """Absolute value of big integer
+
+        Returns:
+            BigInteger: Big integer with absolute value
+        """
+        return self._share(True)
+
+    def _abs_lt(self, __o: object) -> bool:
+        """Less than comparison of absolute values of two big integers
+
+        Args:
             __o (BigInteger): Another big integer
 
         Returns:
             bool: Less than comparison of absolute values of two big integers
         """
-        if len(self._digits()) < len(__o._digits()):
-            return True
-        elif len(self._digits()) > len(__o._digits()):
-            return False
-        else:
-            current = self._tail
-            other_current = __o._tail
-            while current is not None:
-                if current.digit < other_current.digit:
-                    return True
-                elif current.digit > other_current.digit:
-                    return False
-                else:
-                    current = current.previous
-                    other_current = other_current.previous
-            return False
+        first, second, _, _ = self._common_limbs(__o)
+        return _limbs_cmp(first, second) < 0
 
     def __le__(self, __o: object) -> bool:
         """Less than or equal comparison of two big integers
 
         Args:
-            __o (_type_): Another big integer
+            __o (BigInteger&quot; | str | int): Another integer
 
         Returns:
             bool: Comparison of two big integers
         """
-        if self < __o or self._digits() == __o._digits():
-            return True
-        return False
+        return self._compare(__o) <= 0
 
     def to_bin(self) -> object:
         """Convert big integer to binary big integer
@@ -399,23 +1433,13 @@ class BigInteger:
         Returns:
             BigInteger: Binary big integer
         """
-        binary = ""
         if self.is_binary:
             return self
-
-        current = self.copy()
-        current.dump_integer()
-        if str(current) == "0":
-            bin_integer = BigInteger("0")
-            bin_integer.is_binary = True
-            return bin_integer
-
-        while current.abs() > BigInteger("0"):
-            binary += str(current % 2)
-            current = current // 2
-        bin_integer = BigInteger(binary[::-1])
-        bin_integer.is_binary = True
-        return bin_integer
+        integer = BigInteger._from_limbs(
+            _converted_limbs(self, True), self.positive, binary=True
+        )
+        integer._shared = True
+        return integer
 
     def from_bin(self) -> object:
         """Convert binary big integer to big integer
@@ -425,24 +1449,2016 @@ class BigInteger:
         """
         if not self.is_binary:
             return self
-        dec_integer = BigInteger("0")
-        current = self._head
-        count = 0
-        while current is not None:
-            dec_integer = dec_integer + current.digit * (2**count)
-            count += 1
-            current = current.next
-        return dec_integer
-
-@dataclass
-class DecimalDigitNode:
-    """Node of decimal digit list"""
-    digit: int
-    next: "DecimalDigitNode" = None
-    previous: "DecimalDigitNode" = None
+        integer = BigInteger._from_limbs(_converted_limbs(self, False), self.positive)
+        integer._shared = True
+        return integer
 
-    def __str__(self) -> str:
-        return str(self.digit)
+
+class FrozenBigInteger(BigInteger):
+    """Immutable big integer, safe to share and to use as a dictionary key
+
+    A frozen number shares limbs with the number it is made from. Methods
+    changing a number in place raise TypeError, while augmented assignments
+    rebind the name to a new frozen number as they do for int.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, init_value: object = None) -> None:
+        if not isinstance(init_value, BigInteger):
+            init_value = BigInteger(init_value)
+        init_value._shared = True
+        for name in ("_limbs", "_length", "_binary", "_hash", "positive"):
+            object.__setattr__(self, name, getattr(init_value, name))
+        object.__setattr__(self, "_version", 0)
+        object.__setattr__(self, "_shared", True)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if name not in ("_hash", "_shared"):
+            raise TypeError("FrozenBigInteger is immutable")
+        object.__setattr__(self, name, value)
+
+    def __reduce__(self) -> tuple:
+        return FrozenBigInteger, (self._share(self.positive),)
+
+    def freeze(self) -> "FrozenBigInteger":
+        return self
+
+    def copy(self) -> object:
+        return self
+
+    def compact(self) -> "FrozenBigInteger":
+        conversion_cache.discard(self)
+        limbs = _limbs_trim(array(LIMB_TYPECODE, self._limbs))
+        return FrozenBigInteger(
+            BigInteger._from_limbs(limbs, self.positive, self._binary)
+        )
+
+    def abs(self) -> object:
+        return self if self.positive else FrozenBigInteger(self._share(True))
+
+    def __iadd__(self, __o: object) -> object:
+        return FrozenBigInteger(self + __o)
+
+    def __isub__(self, __o: object) -> object:
+        return FrozenBigInteger(self - __o)
+
+    def __imul__(self, __o: object) -> object:
+        return FrozenBigInteger(self * __o)
+
+    def __ilshift__(self, shift: object) -> object:
+        return FrozenBigInteger(self << shift)
+
+    def __irshift__(self, shift: object) -> object:
+        return FrozenBigInteger(self >> shift)
+
+
+class _ModularContext:
+    """Modulus with precomputed constants for repeated modular arithmetic
+
+    Residues are kept in the form the context reduces fastest. Convert
+    numbers with to_residue, multiply residues with mul and convert back
+    with from_residue; pow does all three for a single power.
+    """
+
+    # Whether the working limbs of the context are binary.
+    _binary = False
+
+    def __init__(self, modulus: object) -> None:
+        modulus = _coerce(modulus)
+        if not modulus._limbs:
+            raise ValueError("modulus must not be zero")
+        self.modulus = modulus.abs()
+        self._base = BINARY_BASE if self._binary else DECIMAL_BASE
+        self._modulus = self._limbs_of(self.modulus)
+
+    def _limbs_of(self, value: object) -> array:
+        """Return magnitude of integer in working radix of the context
+
+        Args:
+            value (BigInteger&quot; | str | int): Integer
+
+        Returns:
+            array: Normalized limbs of magnitude
+        """
+        return _converted_limbs(_coerce(value), self._binary)
+
+    def _residue_limbs(self, value: object) -> array:
+        """Return value modulo the modulus in ordinary form
+
+        Args:
+            value (BigInteger&quot; | str | int): Integer
+
+        Returns:
+            array: Normalized limbs in range [0, modulus)
+        """
+        value = _coerce(value)
+        limbs = self._limbs_of(value)
+        if _limbs_cmp(limbs, self._modulus) >= 0:
+            limbs = _limbs_divmod(limbs, self._modulus, self._base)[1]
+        if not value.positive and limbs:
+            return _limbs_sub(self._modulus, limbs, self._base)
+        return array(LIMB_TYPECODE, limbs)
+
+    def _result(self, limbs: array, binary: bool) -> object:
+        """Build big integer from working limbs in the requested radix
+
+        Args:
+            limbs (array): Normalized limbs in working radix
+            binary (bool): Whether the result is binary
+
+        Returns:
+            BigInteger: Non-negative big integer
+        """
+        if binary != self._binary:
+            limbs = _limbs_to_radix(limbs, binary)
+        return BigInteger._from_limbs(limbs, True, binary)
+
+    def _reduce(self, limbs: array) -> array:
+        """Reduce product of two residues
+
+        Args:
+            limbs (array): Normalized limbs below modulus squared
+
+        Returns:
+            array: Normalized limbs of the reduced residue
+        """
+        raise NotImplementedError
+
+    def _enter(self, limbs: array) -> array:
+        """Convert ordinary limbs below modulus to residue form"""
+        return limbs
+
+    def _leave(self, limbs: array) -> array:
+        """Convert residue form limbs to ordinary limbs below modulus"""
+        return limbs
+
+    def _mul(self, first: array, second: array) -> array:
+        """Multiply two residues in working limbs
+
+        Args:
+            first (array): Limbs of the first residue
+            second (array): Limbs of the second residue
+
+        Returns:
+            array: Normalized limbs of the residue of the product
+        """
+        return self._reduce(_limbs_mul(first, second, self._base))
+
+    def to_residue(self, value: object) -> object:
+        """Convert integer to residue form of the context
+
+        Args:
+            value (BigInteger&quot; | str | int): Integer
+
+        Returns:
+            BigInteger: Residue to pass to mul
+        """
+        return BigInteger._from_limbs(
+            self._enter(self._residue_limbs(value)), True, self._binary
+        )
+
+    def from_residue(self, residue: object) -> object:
+        """Convert residue form back to integer
+
+        Args:
+            residue (BigInteger): Residue from to_residue or mul
+
+        Returns:
+            BigInteger: Integer in range [0, modulus), in radix of the modulus
+        """
+        limbs = self._leave(self._limbs_of(residue))
+        return self._result(array(LIMB_TYPECODE, limbs), self.modulus._binary)
+
+    def mul(self, first: object, second: object) -> object:
+        """Multiply two residues modulo the modulus
+
+        Args:
+            first (BigInteger): Residue from to_residue or mul
+            second (BigInteger): Residue from to_residue or mul
+
+        Returns:
+            BigInteger: Residue of the product
+        """
+        first_limbs = self._limbs_of(first)
+        second_limbs = first_limbs if first is second else self._limbs_of(second)
+        return BigInteger._from_limbs(
+            self._mul(first_limbs, second_limbs), True, self._binary
+        )
+
+    def pow(self, value: object, exponent: object) -> object:
+        """Power of integer modulo the modulus
+
+        Args:
+            value (BigInteger&quot; | str | int): Base of the power
+            exponent (BigInteger&quot; | int): Non-negative exponent
+
+        Raises:
+            ValueError: Negative exponent
+
+        Returns:
+            BigInteger: Power in range [0, modulus), binary if both the value
+                and the modulus are binary
+        """
+        binary = isinstance(value, BigInteger) and value._binary
+        one = self._enter(self._residue_limbs(1))
+        limbs = _limbs_sliding_window(
+            self._enter(self._residue_limbs(value)),
+            _exponent_limbs(exponent),
+            one,
+            self._mul,
+        )
+        return self._result(self._leave(limbs), binary and self.modulus._binary)
+
+
+class MontgomeryContext(_ModularContext):
+    """Montgomery arithmetic modulo an odd modulus
+
+    Residues are kept multiplied by R = 2**(32 * limbs of modulus), so a
+    product is reduced by clearing its low limbs with multiples of the
+    modulus instead of dividing.
+    """
+
+    _binary = True
+
+    def __init__(self, modulus: object) -> None:
+        """Precompute Montgomery constants of the modulus
+
+        Args:
+            modulus (BigInteger&quot; | str | int): Odd modulus
+
+        Raises:
+            ValueError: Modulus is even or zero
+        """
+        super().__init__(modulus)
+        if not self._modulus[0] & 1:
+            raise ValueError("Montgomery modulus must be odd")
+        size = len(self._modulus)
+        self._inverse = -pow(self._modulus[0], -1, BINARY_BASE) % BINARY_BASE
+        power = _limbs_shift_limbs(array(LIMB_TYPECODE, [1]), 2 * size)
+        self._r2 = _limbs_divmod(power, self._modulus, BINARY_BASE)[1]
+
+    def _reduce(self, limbs: array) -> array:
+        return _limbs_montgomery_reduce(limbs, self._modulus, self._inverse)
+
+    def _enter(self, limbs: array) -> array:
+        return self._mul(limbs, self._r2)
+
+    def _leave(self, limbs: array) -> array:
+        return self._reduce(limbs)
+
+
+class BarrettContext(_ModularContext):
+    """Barrett arithmetic modulo any non-zero modulus
+
+    A product is reduced by multiplying its high limbs by a precomputed
+    reciprocal of the modulus, which leaves at most two subtractions.
+    Residues are ordinary numbers in the radix of the modulus.
+    """
+
+    def __init__(self, modulus: object) -> None:
+        """Precompute Barrett reciprocal of the modulus
+
+        Args:
+            modulus (BigInteger&quot; | str | int): Non-zero modulus
+
+        Raises:
+            ValueError: Modulus is zero
+        """
+        if isinstance(modulus, BigInteger):
+            self._binary = modulus._binary
+        super().__init__(modulus)
+        size = len(self._modulus)
+        power = _limbs_shift_limbs(array(LIMB_TYPECODE, [1]), 2 * size)
+        self._reciprocal = _limbs_divmod(power, self._modulus, self._base)[0]
+
+    def _reduce(self, limbs: array) -> array:
+        return _limbs_barrett_reduce(
+            limbs, self._modulus, self._reciprocal, self._base
+        )
+
+
+class ConversionCache:
+    """Bounded least recently used cache of radix conversions
+
+    Conversions of big integers are keyed by identity and version of the
+    number, so mutating a number makes its old entries unreachable. Entries
+    refer to their number weakly, and a finalizer drops them when the number
+    is collected, before its identity can be reused.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._entries = OrderedDict()
+        self._finalizers = {}
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> object:
+        """Return cached value and mark it as recently used
+
+        Args:
+            key (tuple): Key of the entry
+
+        Returns:
+            object: Cached value or None
+        """
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: tuple, value: object) -> None:
+        """Store value evicting the least recently used entries
+
+        Args:
+            key (tuple): Key of the entry
+            value (object): Value to cache
+        """
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def put_conversion(self, integer: object, key: tuple, limbs: array) -> None:
+        """Store conversion of a big integer without keeping the number alive
+
+        Args:
+            integer (BigInteger): Converted big integer
+            key (tuple): Key of the entry, holding the identity of the number
+            limbs (array): Converted limbs
+        """
+        if self.maxsize <= 0:
+            return
+        identity = id(integer)
+        if identity not in self._finalizers:
+            finalizer = weakref.finalize(integer, self._forget, identity)
+            finalizer.atexit = False
+            self._finalizers[identity] = finalizer
+        self.put(key, (weakref.ref(integer), limbs))
+
+    def _forget(self, identity: int) -> None:
+        """Drop conversions of a collected or discarded big integer
+
+        Args:
+            identity (int): Identity the number had
+        """
+        finalizer = self._finalizers.pop(identity, None)
+        if finalizer is not None:
+            finalizer.detach()
+        for key in [
+            key
+            for key in self._entries
+            if key[0] == "convert" and key[1] == identity
+        ]:
+            del self._entries[key]
+
+    def resize(self, maxsize: int) -> None:
+        """Change capacity of the cache, evicting entries over it
+
+        Args:
+            maxsize (int): Maximum number of entries, 0 disables caching
+        """
+        self.maxsize = maxsize
+        while len(self._entries) > max(maxsize, 0):
+            self._entries.popitem(last=False)
+
+    def conversions(self, integer: object) -> list:
+        """Return cached conversions of a big integer
+
+        Args:
+            integer (BigInteger): Big integer
+
+        Returns:
+            list: Limbs of every cached conversion of the number
+        """
+        return [
+            value[1]
+            for key, value in self._entries.items()
+            if key[0] == "convert" and value[0]() is integer
+        ]
+
+    def discard(self, integer: object) -> None:
+        """Drop cached conversions of a big integer
+
+        Args:
+            integer (BigInteger): Big integer
+        """
+        self._forget(id(integer))
+
+    def clear(self) -> None:
+        """Drop every entry and reset statistics"""
+        for finalizer in self._finalizers.values():
+            finalizer.detach()
+        self._finalizers.clear()
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        """Return usage statistics of the cache
+
+        Returns:
+            dict: hits, misses, current size and maximum size
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+
+conversion_cache = ConversionCache(CONVERSION_CACHE_SIZE)
+
+
+def _coerce(value: object) -> object:
+    """Convert int or digit string operand to big integer
+
+    Small ints share one big integer per value, which must not be mutated.
+
+    Args:
+        value (BigInteger&quot; | str | int): Operand
+
+    Returns:
+        BigInteger: Big integer, or value itself when it is not convertible
+    """
+    if isinstance(value, int):
+        if value in SMALL_INTEGER_RANGE:
+            integer = _small_integers.get(value)
+            if integer is None:
+                integer = _small_integers[value] = BigInteger(int(value))
+            return integer
+        return BigInteger(value)
+    if isinstance(value, str) and value.isdigit():
+        return BigInteger(value)
+    return value
+
+
+def _converted_limbs(integer: object, binary: bool) -> array:
+    """Return magnitude of big integer in a radix, caching conversions
+
+    Args:
+        integer (BigInteger): Big integer
+        binary (bool): Whether binary limbs are requested
+
+    Returns:
+        array: Normalized limbs, shared with the number or the cache and
+            not to be mutated
+    """
+    if integer._binary == binary:
+        return integer._limbs
+    key = ("convert", id(integer), integer._version, binary)
+    entry = conversion_cache.get(key)
+    if entry is not None:
+        return entry[1]
+    limbs = _limbs_to_radix(integer._limbs, binary)
+    conversion_cache.put_conversion(integer, key, limbs)
+    return limbs
+
+
+def _significant_digits(limbs: array, binary: bool) -> int:
+    """Count digits of magnitude without leading zeros
+
+    Args:
+        limbs (array): Normalized limbs, least significant first
+        binary (bool): Whether limbs hold bits
+
+    Returns:
+        int: Number of significant digits, 1 for zero
+    """
+    if not limbs:
+        return 1
+    if binary:
+        return (len(limbs) - 1) * BINARY_LIMB_DIGITS + limbs[-1].bit_length()
+    return (len(limbs) - 1) * DECIMAL_LIMB_DIGITS + len(str(limbs[-1]))
+
+
+def _limbs_normalize(limbs: array) -> array:
+    """Drop zero limbs from the most significant end in place
+
+    Read-only views of limbs are sliced instead.
+
+    Args:
+        limbs (array | memoryview): Limbs to normalize
+
+    Returns:
+        array | memoryview: The same limbs without leading zero limbs
+    """
+    if isinstance(limbs, memoryview):
+        size = len(limbs)
+        while size and limbs[size - 1] == 0:
+            size -= 1
+        return limbs[:size]
+    while limbs and limbs[-1] == 0:
+        limbs.pop()
+    return limbs
+
+
+def _limbs_storage(limbs: object) -> tuple:
+    """Return storage holding limbs
+
+    Args:
+        limbs (array | memoryview): Limbs
+
+    Returns:
+        tuple: Object owning the storage and bytes allocated in it
+    """
+    if isinstance(limbs, memoryview):
+        return limbs.obj, memoryview(limbs.obj).nbytes
+    return limbs, limbs.__sizeof__() - _EMPTY_LIMBS_SIZE
+
+
+def _limbs_trim(limbs: array) -> array:
+    """Drop spare capacity of limbs
+
+    Args:
+        limbs (array): Normalized limbs
+
+    Returns:
+        array: The same limbs, copied into an exactly sized array when
+            the array holds room for more
+    """
+    if limbs.__sizeof__() - _EMPTY_LIMBS_SIZE > len(limbs) * limbs.itemsize:
+        return array(LIMB_TYPECODE, limbs)
+    return limbs
+
+
+def _check_digits(digits: str, radix: int) -> None:
+    """Validate string of digits in one pass
+
+    Args:
+        digits (str): Digits to check
+        radix (int): Radix of digits, 2 or 10
+
+    Raises:
+        ValueError: String contains anything but digits of the radix
+    """
+    valid = (
+        digits.isascii() and digits.isdigit()
+        if radix == 10
+        else not digits.strip("01")
+    )
+    if digits and not valid:
+        raise ValueError(f"invalid literal for BigInteger: {digits[:50]!r}")
+
+
+def _format_limbs(limbs: array, start: int, stop: int, binary: bool) -> str:
+    """Format limbs as zero padded digits from the most significant one
+
+    Args:
+        limbs (array): Limbs of magnitude
+        start (int): Index of the least significant limb to format
+        stop (int): Index past the most significant limb to format
+        binary (bool): Whether limbs hold bits
+
+    Returns:
+        str: Digits of limbs[start:stop]
+    """
+    if binary:
+        limb_format = "0" + str(BINARY_LIMB_DIGITS) + "b"
+        return "".join(
+            format(limbs[i], limb_format) for i in range(stop - 1, start - 1, -1)
+        )
+    limb_format = "%0" + str(DECIMAL_LIMB_DIGITS) + "d"
+    return (limb_format * (stop - start)) % tuple(reversed(limbs[start:stop]))
+
+
+def _format_chunks(
+    blocks: object, binary: bool, chunk_limbs: int, leading: int
+) -> object:
+    """Format blocks of limbs as digits from the most significant one
+
+    Args:
+        blocks (iterable): Arrays of limbs, most significant block first, the
+            first one normalized and not empty
+        binary (bool): Whether limbs hold bits
+        chunk_limbs (int): Number of limbs formatted per chunk
+        leading (int): Number of zeros to put before the digits
+
+    Yields:
+        str: Chunks of digits
+    """
+    top = True
+    for block in blocks:
+        stop = len(block)
+        if top:
+            stop -= 1
+            yield "0" * leading + format(block[stop], "b" if binary else "d")
+            top = False
+        for i in range(stop, 0, -chunk_limbs):
+            yield _format_limbs(block, max(i - chunk_limbs, 0), i, binary)
+
+
+def _format_reversed_chunks(
+    blocks: object, binary: bool, chunk_limbs: int, leading: int
+) -> object:
+    """Format blocks of limbs as digits from the least significant one
+
+    Args:
+        blocks (iterable): Arrays of limbs, least significant block first, the
+            last one normalized and not empty
+        binary (bool): Whether limbs hold bits
+        chunk_limbs (int): Number of limbs formatted per chunk
+        leading (int): Number of zeros to put after the digits
+
+    Yields:
+        str: Chunks of reversed digits
+    """
+    previous = None
+    for block in blocks:
+        if previous is not None:
+            for i in range(0, len(previous), chunk_limbs):
+                stop = min(i + chunk_limbs, len(previous))
+                yield _format_limbs(previous, i, stop, binary)[::-1]
+        previous = block
+    top = len(previous) - 1
+    for i in range(0, top, chunk_limbs):
+        yield _format_limbs(previous, i, min(i + chunk_limbs, top), binary)[::-1]
+    yield format(previous[top], "b" if binary else "d")[::-1] + "0" * leading
+
+
+def _limbs_bytes(limbs: array) -> bytes:
+    """Return limbs as 32-bit little-endian words
+
+    Args:
+        limbs (array | memoryview): Limbs
+
+    Returns:
+        bytes: Limbs of the packed format
+    """
+    if sys.byteorder == "little":
+        return memoryview(limbs).tobytes()
+    swapped = array(LIMB_TYPECODE, limbs)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def _unpack_integer(view: memoryview, offset: int, copy: bool) -> tuple:
+    """Unpack one big integer of the packed format
+
+    Args:
+        view (memoryview): Bytes holding packed numbers
+        offset (int): Position of the header of the number
+        copy (bool): Whether to copy limbs out of view
+
+    Raises:
+        ValueError: Truncated or malformed packed number
+
+    Returns:
+        tuple: Big integer and position past its limbs
+    """
+    if len(view) - offset < PACKED_HEADER.size:
+        raise ValueError("truncated packed integer")
+    flags, count = PACKED_HEADER.unpack_from(view, offset)
+    start = offset + PACKED_HEADER.size
+    end = start + count * (BINARY_LIMB_DIGITS // 8)
+    if end > len(view):
+        raise ValueError("truncated packed integer")
+    chunk = view[start:end]
+    if copy or sys.byteorder != "little":
+        limbs = array(LIMB_TYPECODE)
+        limbs.frombytes(chunk)
+        if sys.byteorder != "little":
+            limbs.byteswap()
+        return _packed_integer(flags, limbs, False), end
+    return _packed_integer(flags, chunk.toreadonly().cast(LIMB_TYPECODE), True), end
+
+
+def _packed_integer(flags: int, limbs: object, shared: bool) -> object:
+    """Build big integer from unpacked flags and limbs
+
+    Args:
+        flags (int): Flags of the packed format
+        limbs (array | memoryview): Limbs in native byte order
+        shared (bool): Whether limbs belong to a buffer of the caller
+
+    Raises:
+        ValueError: Unknown flags or decimal limb out of range
+
+    Returns:
+        BigInteger: Big integer holding the limbs
+    """
+    if flags & ~(PACKED_NEGATIVE | PACKED_BINARY):
+        raise ValueError("unknown flags of packed integer")
+    binary = bool(flags & PACKED_BINARY)
+    if not binary and limbs and max(limbs) >= DECIMAL_BASE:
+        raise ValueError("decimal limb out of range in packed integer")
+    integer = BigInteger._from_limbs(
+        _limbs_normalize(limbs), not flags & PACKED_NEGATIVE, binary
+    )
+    integer._shared = shared
+    return integer
+
+
+def _limbs_from_string(digits: str, limb_digits: int, radix: int) -> array:
+    """Pack string of digits into limbs
+
+    Args:
+        digits (str): Digits from the most significant one
+        limb_digits (int): Number of digits per limb
+        radix (int): Radix of digits
+
+    Returns:
+        array: Normalized limbs, least significant first
+    """
+    limbs = array(
+        LIMB_TYPECODE,
+        (
+            int(digits[max(end - limb_digits, 0):end], radix)
+            for end in range(len(digits), 0, -limb_digits)
+        ),
+    )
+    return _limbs_normalize(limbs)
+
+
+def _limbs_from_int(value: int, binary: bool) -> array:
+    """Split non-negative int into limbs
+
+    Bits are copied with int.to_bytes. Decimal limbs of short values are
+    peeled off with native divmod, longer values are split in halves on
+    powers of the decimal limb base first.
+
+    Args:
+        value (int): Non-negative integer
+        binary (bool): Whether binary limbs are requested
+
+    Returns:
+        array: Normalized limbs, least significant first
+    """
+    if value < DECIMAL_BASE:
+        return array(LIMB_TYPECODE, [value] if value else [])
+    if binary:
+        limbs = array(LIMB_TYPECODE)
+        limbs.frombytes(value.to_bytes(-(-value.bit_length() // 32) * 4, "little"))
+        if sys.byteorder != "little":
+            limbs.byteswap()
+        return limbs
+    if value.bit_length() <= INT_CONVERSION_BITS:
+        limbs = array(LIMB_TYPECODE)
+        while value:
+            value, limb = divmod(value, DECIMAL_BASE)
+            limbs.append(limb)
+        return limbs
+    # Lower bound of the number of limbs less one, so the high half is
+    # never zero.
+    size = int((value.bit_length() - 1) * 0.0334)
+    count = 1 << (size.bit_length() - 1)
+    high, low = divmod(value, _int_decimal_power(count))
+    limbs = _limbs_from_int(low, False)
+    limbs.extend(array(LIMB_TYPECODE, [0]) * (count - len(limbs)))
+    limbs.extend(_limbs_from_int(high, False))
+    return limbs
+
+
+def _limbs_to_int(limbs: array, binary: bool) -> int:
+    """Join limbs into non-negative int
+
+    Bits are read with int.from_bytes. Short decimal magnitudes run
+    Horner's scheme, longer ones are joined from halves.
+
+    Args:
+        limbs (array | memoryview): Limbs, least significant first
+        binary (bool): Whether limbs hold bits
+
+    Returns:
+        int: Magnitude
+    """
+    if len(limbs) <= 1:
+        return limbs[0] if limbs else 0
+    if binary:
+        return int.from_bytes(_limbs_bytes(limbs), "little")
+    if len(limbs) * BINARY_LIMB_DIGITS <= INT_CONVERSION_BITS:
+        value = 0
+        for i in range(len(limbs) - 1, -1, -1):
+            value = value * DECIMAL_BASE + limbs[i]
+        return value
+    count = 1 << ((len(limbs) - 1).bit_length() - 1)
+    high = _limbs_to_int(limbs[count:], False)
+    return high * _int_decimal_power(count) + _limbs_to_int(limbs[:count], False)
+
+
+def _int_decimal_power(count: int) -> int:
+    """Return power of decimal limb base as int
+
+    Args:
+        count (int): Power of two exponent in decimal limbs
+
+    Returns:
+        int: DECIMAL_BASE**count
+    """
+    key = ("int power", count)
+    power = conversion_cache.get(key)
+    if power is None:
+        power = DECIMAL_BASE if count == 1 else _int_decimal_power(count // 2) ** 2
+        conversion_cache.put(key, power)
+    return power
+
+
+def _small_int(value: object) -> bool:
+    """Check whether operand is an int whose magnitude fits one decimal limb
+
+    Args:
+        value (object): Operand
+
+    Returns:
+        bool: Whether arithmetic with the operand may skip coercion
+    """
+    return isinstance(value, int) and -DECIMAL_BASE < value < DECIMAL_BASE
+
+
+def _limbs_cmp(first: array, second: array) -> int:
+    """Compare two magnitudes
+
+    Args:
+        first (array): Normalized limbs of the first magnitude
+        second (array): Normalized limbs of the second magnitude
+
+    Returns:
+        int: -1, 0 or 1 if first is less, equal or greater than second
+    """
+    if len(first) != len(second):
+        return -1 if len(first) < len(second) else 1
+    for i in range(len(first) - 1, -1, -1):
+        if first[i] != second[i]:
+            return -1 if first[i] < second[i] else 1
+    return 0
+
+
+def _limbs_add(first: array, second: array, base: int) -> array:
+    """Add two magnitudes
+
+    Args:
+        first (array): Limbs of the first magnitude
+        second (array): Limbs of the second magnitude
+        base (int): Limb base
+
+    Returns:
+        array: Limbs of the sum
+    """
+    if len(first) < len(second):
+        first, second = second, first
+    result = array(LIMB_TYPECODE, first)
+    _limbs_iadd(result, second, base)
+    return result
+
+
+def _limbs_sub(first: array, second: array, base: int) -> array:
+    """Subtract smaller magnitude from the greater one
+
+    Args:
+        first (array): Limbs of the minuend, not less than subtrahend
+        second (array): Limbs of the subtrahend
+        base (int): Limb base
+
+    Returns:
+        array: Normalized limbs of the difference
+    """
+    result = array(LIMB_TYPECODE, first)
+    _limbs_isub(result, second, base)
+    return result
+
+
+def _limbs_iadd(target: array, limbs: array, base: int) -> None:
+    """Add magnitude to target limbs in place
+
+    Args:
+        target (array): Limbs of the first magnitude, updated with the sum
+        limbs (array): Limbs of the second magnitude
+        base (int): Limb base
+    """
+    if len(target) < len(limbs):
+        target.extend(array(LIMB_TYPECODE, [0]) * (len(limbs) - len(target)))
+    carry = 0
+    for i, limb in enumerate(limbs):
+        carry, target[i] = divmod(target[i] + limb + carry, base)
+    i = len(limbs)
+    while carry:
+        if i == len(target):
+            target.append(carry)
+            break
+        carry, target[i] = divmod(target[i] + carry, base)
+        i += 1
+
+
+def _limbs_isub(target: array, limbs: array, base: int) -> None:
+    """Subtract magnitude from target limbs in place
+
+    Args:
+        target (array): Limbs of the minuend, updated with the difference
+        limbs (array): Limbs of the subtrahend, not greater than minuend
+        base (int): Limb base
+    """
+    borrow = 0
+    for i, limb in enumerate(limbs):
+        difference = target[i] - limb - borrow
+        borrow = difference < 0
+        target[i] = difference + base if borrow else difference
+    i = len(limbs)
+    while borrow:
+        difference = target[i] - 1
+        borrow = difference < 0
+        target[i] = difference + base if borrow else difference
+        i += 1
+    _limbs_normalize(target)
+
+
+def _limbs_irsub(target: array, limbs: array, base: int) -> None:
+    """Subtract target limbs from a greater magnitude in place
+
+    Args:
+        target (array): Limbs of the subtrahend, updated with the difference
+        limbs (array): Limbs of the minuend, not less than subtrahend
+        base (int): Limb base
+    """
+    target.extend(array(LIMB_TYPECODE, [0]) * (len(limbs) - len(target)))
+    borrow = 0
+    for i, limb in enumerate(limbs):
+        difference = limb - target[i] - borrow
+        borrow = difference < 0
+        target[i] = difference + base if borrow else difference
+    _limbs_normalize(target)
+
+
+def _limbs_imuladd_small(
+    limbs: array, multiplier: int, addend: int, base: int
+) -> None:
+    """Multiply magnitude by a small number and add another one in place
+
+    Args:
+        limbs (array): Normalized limbs of magnitude, updated with the result
+        multiplier (int): Non-negative machine-size factor
+        addend (int): Non-negative machine-size term
+        base (int): Limb base
+    """
+    carry = addend
+    for i, limb in enumerate(limbs):
+        carry, limbs[i] = divmod(limb * multiplier + carry, base)
+    while carry:
+        carry, limb = divmod(carry, base)
+        limbs.append(limb)
+    if not multiplier:
+        _limbs_normalize(limbs)
+
+
+def _limbs_idivmod_small(limbs: array, divisor: int, base: int) -> int:
+    """Divide magnitude by a small number in place
+
+    Args:
+        limbs (array): Limbs of magnitude, updated with the quotient
+        divisor (int): Positive machine-size divisor
+        base (int): Limb base
+
+    Returns:
+        int: Remainder
+    """
+    remainder = 0
+    for i in range(len(limbs) - 1, -1, -1):
+        limbs[i], remainder = divmod(remainder * base + limbs[i], divisor)
+    _limbs_normalize(limbs)
+    return remainder
+
+
+def _limbs_muladd_small(limbs: array, multiplier: int, addend: int, base: int) -> array:
+    """Multiply magnitude by a small number and add another small number
+
+    Args:
+        limbs (array): Limbs of magnitude
+        multiplier (int): Non-negative machine-size factor
+        addend (int): Non-negative machine-size term
+        base (int): Limb base
+
+    Returns:
+        array: Normalized limbs of limbs * multiplier + addend
+    """
+    result = array(LIMB_TYPECODE, limbs)
+    _limbs_imuladd_small(result, multiplier, addend, base)
+    return result
+
+
+def _limbs_divmod_small(limbs: array, divisor: int, base: int) -> tuple:
+    """Divide magnitude by a small number
+
+    Args:
+        limbs (array): Limbs of magnitude
+        divisor (int): Positive machine-size divisor
+        base (int): Limb base
+
+    Returns:
+        tuple: Normalized limbs of the quotient and the remainder
+    """
+    quotient = array(LIMB_TYPECODE, limbs)
+    remainder = _limbs_idivmod_small(quotient, divisor, base)
+    return quotient, remainder
+
+
+def _limbs_carry(columns: list, base: int) -> array:
+    """Propagate carries through columns of unbounded limb sums
+
+    Args:
+        columns (list): Non-negative column sums, least significant first
+        base (int): Limb base
+
+    Returns:
+        array: Normalized limbs of the represented magnitude
+    """
+    result = array(LIMB_TYPECODE, [0]) * len(columns)
+    carry = 0
+    for i, column in enumerate(columns):
+        carry, result[i] = divmod(column + carry, base)
+    while carry:
+        carry, limb = divmod(carry, base)
+        result.append(limb)
+    return _limbs_normalize(result)
+
+
+def _limbs_mul_schoolbook(first: array, second: array, base: int) -> array:
+    """Multiply two magnitudes limb by limb
+
+    Args:
+        first (array): Limbs of the first magnitude
+        second (array): Limbs of the second magnitude
+        base (int): Limb base
+
+    Returns:
+        array: Normalized limbs of the product
+    """
+    if not first or not second:
+        return array(LIMB_TYPECODE)
+    if len(first) < len(second):
+        first, second = second, first
+    columns = [0] * (len(first) + len(second))
+    first = list(first)
+    for i, limb in enumerate(second):
+        if limb:
+            for j, other in enumerate(first, i):
+                columns[j] += limb * other
+    return _limbs_carry(columns, base)
+
+
+def _limbs_square_schoolbook(limbs: array, base: int) -> array:
+    """Square magnitude computing every cross product once
+
+    Args:
+        limbs (array): Limbs of magnitude
+        base (int): Limb base
+
+    Returns:
+        array: Normalized limbs of the square
+    """
+    if not limbs:
+        return array(LIMB_TYPECODE)
+    columns = [0] * (2 * len(limbs))
+    limbs = list(limbs)
+    for i, limb in enumerate(limbs):
+        if limb:
+            doubled = 2 * limb
+            for j in range(i + 1, len(limbs)):
+                columns[i + j] += doubled * limbs[j]
+            columns[2 * i] += limb * limb
+    return _limbs_carry(columns, base)
+
+
+def _limbs_add_into(columns: list, limbs: array, offset: int) -> None:
+    """Add magnitude to column sums at a limb offset without carrying
+
+    Args:
+        columns (list): Column sums to update in place
+        limbs (array): Limbs of the term
+        offset (int): Limb position of the least significant limb of the term
+    """
+    for i, limb in enumerate(limbs, offset):
+        columns[i] += limb
+
+
+def _limbs_drive(steps: object, multiply: object, base: int) -> object:
+    """Run step generator computing the products it asks for
+
+    Step generators hold the recursions of fast algorithms. They yield lists
+    of operand pairs whose products they need, receive the list of products
+    and return their result, so the same algorithm runs synchronously, in
+    chunks on an event loop or with products spread over a pool.
+
+    Args:
+        steps (generator): Step generator of an algorithm
+        multiply (callable): Product of two magnitudes in base
+        base (int): Limb base
+
+    Returns:
+        object: Result of the step generator
+    """
+    try:
+        pairs = next(steps)
+        while True:
+            pairs = steps.send(
+                [multiply(first, second, base) for first, second in pairs]
+            )
+    except StopIteration as stop:
+        return stop.value
+
+
+def _limbs_karatsuba_steps(first: array, second: array, base: int) -> object:
+    """Split product of two magnitudes into Karatsuba sub-products
+
+    Args:
+        first (array): Limbs of the first magnitude
+        second (array): Non-empty limbs of the second magnitude
+        base (int): Limb base
+
+    Yields:
+        list: Operand pairs of the sub-products, asked for once
+
+    Returns:
+        array: Normalized limbs of the product
+    """
+    if len(first) < len(second):
+        first, second = second, first
+    columns = [0] * (len(first) + len(second))
+    if 2 * len(second) <= len(first):
+        # Unbalanced operands: multiply the shorter one by slices of the
+        # longer one so every sub-product stays balanced.
+        step = len(second)
+        offsets = range(0, len(first), step)
+        products = yield [
+            (_limbs_normalize(first[offset:offset + step]), second)
+            for offset in offsets
+        ]
+        for offset, product in zip(offsets, products):
+            _limbs_add_into(columns, product, offset)
+        return _limbs_carry(columns, base)
+    half = len(first) // 2
+    first_low = _limbs_normalize(first[:half])
+    first_high = first[half:]
+    second_low = _limbs_normalize(second[:half])
+    second_high = second[half:]
+    low, high, middle = yield [
+        (first_low, second_low),
+        (first_high, second_high),
+        (
+            _limbs_add(first_low, first_high, base),
+            _limbs_add(second_low, second_high, base),
+        ),
+    ]
+    middle = _limbs_sub(_limbs_sub(middle, low, base), high, base)
+    _limbs_add_into(columns, low, 0)
+    _limbs_add_into(columns, middle, half)
+    _limbs_add_into(columns, high, 2 * half)
+    return _limbs_carry(columns, base)
+
+
+def _limbs_karatsuba(first: array, second: array, base: int) -> array:
+    """Multiply two magnitudes with Karatsuba splitting
+
+    Args:
+        first (array): Limbs of the first magnitude
+        second (array): Limbs of the second magnitude
+        base (int): Limb base
+
+    Returns:
+        array: Normalized limbs of the product
+    """
+    if min(len(first), len(second)) < KARATSUBA_THRESHOLD:
+        return _limbs_mul_schoolbook(first, second, base)
+    return _limbs_drive(
+        _limbs_karatsuba_steps(first, second, base), _limbs_karatsuba, base
+    )
+
+
+def _limbs_square(limbs: array, base: int) -> array:
+    """Square magnitude with Karatsuba splitting
+
+    Args:
+        limbs (array): Limbs of magnitude
+        base (int): Limb base
+
+    Returns:
+        array: Normalized limbs of the square
+    """
+    if len(limbs) < KARATSUBA_SQUARE_THRESHOLD:
+        return _limbs_square_schoolbook(limbs, base)
+    half = len(limbs) // 2
+    low_limbs = _limbs_normalize(limbs[:half])
+    high_limbs = limbs[half:]
+    low = _limbs_square(low_limbs, base)
+    high = _limbs_square(high_limbs, base)
+    middle = _limbs_square(_limbs_add(low_limbs, high_limbs, base), base)
+    middle = _limbs_sub(_limbs_sub(middle, low, base), high, base)
+    columns = [0] * (2 * len(limbs))
+    _limbs_add_into(columns, low, 0)
+    _limbs_add_into(columns, middle, half)
+    _limbs_add_into(columns, high, 2 * half)
+    return _limbs_carry(columns, base)
+
+
+def _limbs_mul(first: array, second: array, base: int) -> array:
+    """Multiply two magnitudes choosing the algorithm by operand sizes
+
+    Args:
+        first (array): Limbs of the first magnitude
+        second (array): Limbs of the second magnitude
+        base (int): Limb base
+
+    Returns:
+        array: Normalized limbs of the product
+    """
+    if first is second:
+        return _limbs_square(first, base)
+    return _limbs_karatsuba(first, second, base)
+
+
+def _limbs_shift_limbs(limbs: array, count: int) -> array:
+    """Multiply magnitude by a power of limb base
+
+    Args:
+        limbs (array): Normalized limbs of magnitude
+        count (int): Number of zero limbs to prepend
+
+    Returns:
+        array: Normalized limbs of limbs * base**count
+    """
+    result = array(LIMB_TYPECODE)
+    if limbs:
+        result.extend([0] * count)
+        result.extend(limbs)
+    return result
+
+
+def _limbs_divmod_long(first: array, second: array, base: int) -> tuple:
+    """Divide magnitudes with long division (Knuth, Algorithm D)
+
+    Args:
+        first (array): Normalized limbs of the dividend
+        second (array): Normalized limbs of the divisor with two limbs or more
+        base (int): Limb base
+
+    Returns:
+        tuple: Normalized limbs of the quotient and the remainder
+    """
+    size = len(second)
+    factor = base // (second[-1] + 1)
+    dividend = list(_limbs_muladd_small(first, factor, 0, base))
+    dividend.extend([0] * (len(first) + 1 - len(dividend)))
+    divisor = list(_limbs_muladd_small(second, factor, 0, base))
+    top, next_top = divisor[-1], divisor[-2]
+    quotient = array(LIMB_TYPECODE, [0]) * (len(first) - size + 1)
+    for j in range(len(first) - size, -1, -1):
+        estimate, rest = divmod(
+            dividend[j + size] * base + dividend[j + size - 1], top
+        )
+        while estimate >= base or (
+            estimate * next_top > rest * base + dividend[j + size - 2]
+        ):
+            estimate -= 1
+            rest += top
+            if rest >= base:
+                break
+        if not estimate:
+            continue
+        carry = borrow = 0
+        for i, limb in enumerate(divisor):
+            carry, product = divmod(estimate * limb + carry, base)
+            difference = dividend[i + j] - product - borrow
+            borrow = difference < 0
+            dividend[i + j] = difference + base if borrow else difference
+        difference = dividend[j + size] - carry - borrow
+        if difference < 0:
+            # The estimate was one too large: add the divisor back.
+            estimate -= 1
+            carry = 0
+            for i, limb in enumerate(divisor):
+                carry, dividend[i + j] = divmod(dividend[i + j] + limb + carry, base)
+            difference += carry
+        dividend[j + size] = difference
+        quotient[j] = estimate
+    remainder, _ = _limbs_divmod_small(
+        _limbs_normalize(array(LIMB_TYPECODE, dividend[:size])), factor, base
+    )
+    return _limbs_normalize(quotient), remainder
+
+
+def _limbs_reciprocal_steps(limbs: array, base: int) -> object:
+    """Compute reciprocal of magnitude with Newton iteration
+
+    Args:
+        limbs (array): Normalized limbs with the top limb at least base / 2
+        base (int): Limb base
+
+    Yields:
+        list: Operand pairs of products, see _limbs_drive
+
+    Returns:
+        array: Normalized limbs of base**(2 * len(limbs)) // limbs
+    """
+    size = len(limbs)
+    power = _limbs_shift_limbs(array(LIMB_TYPECODE, [1]), 2 * size)
+    if size < 8:
+        return _limbs_divmod_long(power, limbs, base)[0]
+    # Reciprocal of the top limbs is accurate to about half of the limbs,
+    # one Newton step x + x * (B**2n - d * x) / B**2n doubles that.
+    top = size // 2 + 1
+    estimate = _limbs_shift_limbs(
+        (yield from _limbs_reciprocal_steps(limbs[size - top:], base)), size - top
+    )
+    product = (yield [(limbs, estimate)])[0]
+    if _limbs_cmp(product, power) <= 0:
+        error = _limbs_sub(power, product, base)
+        correction = (yield [(estimate, error)])[0][2 * size:]
+        estimate = _limbs_add(estimate, correction, base)
+    else:
+        error = _limbs_sub(product, power, base)
+        correction = (yield [(estimate, error)])[0][2 * size:]
+        correction = _limbs_add(correction, array(LIMB_TYPECODE, [1]), base)
+        estimate = _limbs_sub(estimate, correction, base)
+    estimate = _limbs_normalize(estimate)
+    # Bring the estimate to the exact floor with a few cheap corrections.
+    product = (yield [(limbs, estimate)])[0]
+    while _limbs_cmp(product, power) > 0:
+        estimate = _limbs_sub(estimate, array(LIMB_TYPECODE, [1]), base)
+        product = _limbs_sub(product, limbs, base)
+    rest = _limbs_sub(power, product, base)
+    while _limbs_cmp(rest, limbs) >= 0:
+        estimate = _limbs_add(estimate, array(LIMB_TYPECODE, [1]), base)
+        rest = _limbs_sub(rest, limbs, base)
+    return estimate
+
+
+def _limbs_divmod_newton_steps(first: array, second: array, base: int) -> object:
+    """Divide magnitudes multiplying by Newton reciprocal of the divisor
+
+    Args:
+        first (array): Normalized limbs of the dividend
+        second (array): Normalized limbs of the divisor
+        base (int): Limb base
+
+    Yields:
+        list: Operand pairs of products, see _limbs_drive
+
+    Returns:
+        tuple: Normalized limbs of the quotient and the remainder
+    """
+    size = len(second)
+    factor = base // (second[-1] + 1)
+    dividend = _limbs_muladd_small(first, factor, 0, base)
+    divisor = _limbs_muladd_small(second, factor, 0, base)
+    reciprocal = yield from _limbs_reciprocal_steps(divisor, base)
+    # Every block is below divisor * B**size, so its quotient fits in size
+    # limbs and is computed from the reciprocal up to a small correction.
+    blocks = -(-len(dividend) // size)
+    quotient = array(LIMB_TYPECODE, [0]) * (blocks * size)
+    remainder = array(LIMB_TYPECODE)
+    for block in range(blocks - 1, -1, -1):
+        current = _limbs_normalize(dividend[block * size:(block + 1) * size])
+        current = _limbs_add(_limbs_shift_limbs(remainder, size), current, base)
+        part = (yield [(current, reciprocal)])[0][2 * size:]
+        product = (yield [(part, divisor)])[0]
+        remainder = _limbs_sub(current, product, base)
+        while _limbs_cmp(remainder, divisor) >= 0:
+            part = _limbs_add(part, array(LIMB_TYPECODE, [1]), base)
+            remainder = _limbs_sub(remainder, divisor, base)
+        quotient[block * size:block * size + len(part)] = part
+    remainder, _ = _limbs_divmod_small(remainder, factor, base)
+    return _limbs_normalize(quotient), remainder
+
+
+def _limbs_divmod_newton(
+    first: array, second: array, base: int, multiply: object = _limbs_mul
+) -> tuple:
+    """Divide magnitudes multiplying by Newton reciprocal of the divisor
+
+    Args:
+        first (array): Normalized limbs of the dividend
+        second (array): Normalized limbs of the divisor
+        base (int): Limb base
+        multiply (callable, optional): Product of two magnitudes in base.
+            Defaults to _limbs_mul.
+
+    Returns:
+        tuple: Normalized limbs of the quotient and the remainder
+    """
+    return _limbs_drive(_limbs_divmod_newton_steps(first, second, base), multiply, base)
+
+
+def _limbs_divmod(first: array, second: array, base: int) -> tuple:
+    """Divide magnitudes choosing the algorithm by operand sizes
+
+    Args:
+        first (array): Normalized limbs of the dividend
+        second (array): Normalized non-zero limbs of the divisor
+        base (int): Limb base
+
+    Returns:
+        tuple: Normalized limbs of the quotient and the remainder
+    """
+    if _limbs_cmp(first, second) < 0:
+        return array(LIMB_TYPECODE), array(LIMB_TYPECODE, first)
+    if len(second) == 1:
+        quotient, remainder = _limbs_divmod_small(first, second[0], base)
+        return quotient, _limbs_normalize(array(LIMB_TYPECODE, [remainder]))
+    if len(second) < NEWTON_DIVISION_THRESHOLD:
+        return _limbs_divmod_long(first, second, base)
+    return _limbs_divmod_newton(first, second, base)
+
+
+def _limbs_radix_power_steps(binary: bool, count: int) -> object:
+    """Return power of source limb base written in target radix
+
+    Args:
+        binary (bool): Whether target radix is binary
+        count (int): Power of two exponent in source limbs
+
+    Yields:
+        list: Operand pairs of products, see _limbs_drive
+
+    Returns:
+        array: Limbs of source_base**count in target limb base
+    """
+    key = ("power", binary, count)
+    power = conversion_cache.get(key)
+    if power is None:
+        if count == 1:
+            base = BINARY_BASE if binary else DECIMAL_BASE
+            source_base = DECIMAL_BASE if binary else BINARY_BASE
+            power = _limbs_muladd_small(array(LIMB_TYPECODE), 0, source_base, base)
+        else:
+            half = yield from _limbs_radix_power_steps(binary, count // 2)
+            power = (yield [(half, half)])[0]
+        conversion_cache.put(key, power)
+    return power
+
+
+def _limbs_radix_power(binary: bool, count: int) -> array:
+    """Return power of source limb base written in target radix
+
+    Args:
+        binary (bool): Whether target radix is binary
+        count (int): Power of two exponent in source limbs
+
+    Returns:
+        array: Limbs of source_base**count in target limb base
+    """
+    base = BINARY_BASE if binary else DECIMAL_BASE
+    return _limbs_drive(_limbs_radix_power_steps(binary, count), _limbs_mul, base)
+
+
+def _limbs_radix_reciprocal(binary: bool, count: int) -> array:
+    """Return Barrett reciprocal of cached power of source limb base
+
+    Args:
+        binary (bool): Whether radix of the power is binary
+        count (int): Power of two exponent in source limbs
+
+    Returns:
+        array: Limbs of base**(2 * len(power)) // power
+    """
+    key = ("reciprocal", binary, count)
+    reciprocal = conversion_cache.get(key)
+    if reciprocal is None:
+        base = BINARY_BASE if binary else DECIMAL_BASE
+        power = _limbs_radix_power(binary, count)
+        scale = _limbs_shift_limbs(array(LIMB_TYPECODE, [1]), 2 * len(power))
+        reciprocal = _limbs_divmod(scale, power, base)[0]
+        conversion_cache.put(key, reciprocal)
+    return reciprocal
+
+
+def _limbs_radix_leaf(limbs: array, binary: bool) -> array:
+    """Convert short magnitude between radixes limb by limb
+
+    Args:
+        limbs (array): Normalized limbs in source radix
+        binary (bool): Whether target radix is binary
+
+    Returns:
+        array: Normalized limbs in target radix
+    """
+    base = BINARY_BASE if binary else DECIMAL_BASE
+    source_base = DECIMAL_BASE if binary else BINARY_BASE
+    result = array(LIMB_TYPECODE)
+    for i in range(len(limbs) - 1, -1, -1):
+        _limbs_imuladd_small(result, source_base, limbs[i], base)
+    return result
+
+
+def _limbs_radix_split(limbs: array) -> tuple:
+    """Split magnitude on a power of two count of limbs for conversion
+
+    Args:
+        limbs (array): Normalized limbs in source radix
+
+    Returns:
+        tuple: Count of low limbs, high limbs and normalized low limbs
+    """
+    count = 1 << ((len(limbs) - 1).bit_length() - 1)
+    return count, limbs[count:], _limbs_normalize(limbs[:count])
+
+
+def _limbs_radix_join_steps(
+    high: array, low: array, count: int, binary: bool
+) -> object:
+    """Join converted parts of a split with a cached power of source base
+
+    Args:
+        high (array): Converted high limbs
+        low (array): Converted low limbs
+        count (int): Count of low limbs of the split
+        binary (bool): Whether target radix is binary
+
+    Yields:
+        list: Operand pairs of products, see _limbs_drive
+
+    Returns:
+        array: Normalized limbs in target radix
+    """
+    base = BINARY_BASE if binary else DECIMAL_BASE
+    power = yield from _limbs_radix_power_steps(binary, count)
+    product = (yield [(high, power)])[0]
+    return _limbs_add(product, low, base)
+
+
+def _limbs_to_radix_steps(limbs: array, binary: bool) -> object:
+    """Convert magnitude between decimal and binary limbs
+
+    Args:
+        limbs (array): Normalized limbs in source radix
+        binary (bool): Whether target radix is binary
+
+    Yields:
+        list: Operand pairs of products, see _limbs_drive
+
+    Returns:
+        array: Normalized limbs in target radix
+    """
+    if len(limbs) <= RADIX_CONVERSION_THRESHOLD:
+        return _limbs_radix_leaf(limbs, binary)
+    count, high, low = _limbs_radix_split(limbs)
+    high = yield from _limbs_to_radix_steps(high, binary)
+    low = yield from _limbs_to_radix_steps(low, binary)
+    return (yield from _limbs_radix_join_steps(high, low, count, binary))
+
+
+def _limbs_to_radix(limbs: array, binary: bool) -> array:
+    """Convert magnitude between decimal and binary limbs
+
+    Splits the number on a power of two count of source limbs, converts both
+    halves recursively and joins them with one multiplication by a cached
+    power of source base, so conversion costs a few multiplications.
+
+    Args:
+        limbs (array): Normalized limbs in source radix
+        binary (bool): Whether target radix is binary
+
+    Returns:
+        array: Normalized limbs in target radix
+    """
+    if len(limbs) <= RADIX_CONVERSION_THRESHOLD:
+        return _limbs_radix_leaf(limbs, binary)
+    base = BINARY_BASE if binary else DECIMAL_BASE
+    return _limbs_drive(_limbs_to_radix_steps(limbs, binary), _limbs_mul, base)
+
+
+def _limbs_radix_blocks(
+    limbs: array, binary: bool, width: int, reverse: bool
+) -> object:
+    """Convert magnitude between decimal and binary limbs block by block
+
+    Divides the number by a cached power of the target base close to its
+    square root and converts the quotient and the remainder recursively, so
+    the outermost blocks are ready after one division.
+
+    Args:
+        limbs (array): Normalized limbs in source radix
+        binary (bool): Whether target radix is binary
+        width (int): Number of target limbs to fill with leading zeros
+        reverse (bool): Whether to yield the least significant block first
+
+    Yields:
+        array: Blocks of target limbs, each least significant limb first
+    """
+    if len(limbs) <= RADIX_CONVERSION_THRESHOLD:
+        block = _limbs_to_radix(limbs, binary)
+        if len(block) < width:
+            block.extend(array(LIMB_TYPECODE, [0]) * (width - len(block)))
+        yield block
+        return
+    # Largest power of two count of target limbs whose power of target base
+    # does not exceed the number, so that both parts are shorter than it.
+    ratio = math.log2(DECIMAL_BASE) / BINARY_LIMB_DIGITS
+    size = int((len(limbs) - 1) * (ratio if binary else 1 / ratio))
+    count = 1 << (size.bit_length() - 1)
+    base = DECIMAL_BASE if binary else BINARY_BASE
+    power = _limbs_radix_power(not binary, count)
+    size = len(power)
+    if len(limbs) > 2 * size:
+        high, low = _limbs_divmod(limbs, power, base)
+    else:
+        # Barrett division by the cached reciprocal of the power.
+        reciprocal = _limbs_radix_reciprocal(not binary, count)
+        high = _limbs_mul(limbs[size - 1:], reciprocal, base)[size + 1:]
+        low = _limbs_sub(limbs, _limbs_mul(high, power, base), base)
+        while _limbs_cmp(low, power) >= 0:
+            _limbs_isub(low, power, base)
+            high = _limbs_add(high, array(LIMB_TYPECODE, [1]), base)
+    parts = [(high, max(width - count, 0)), (low, count)]
+    if reverse:
+        parts.reverse()
+    for part, part_width in parts:
+        if part or part_width:
+            yield from _limbs_radix_blocks(part, binary, part_width, reverse)
+
+
+def _exponent_limbs(exponent: object) -> array:
+    """Return binary limbs of a non-negative exponent
+
+    Args:
+        exponent (BigInteger&quot; | int): Exponent
+
+    Raises:
+        ValueError: Negative exponent
+
+    Returns:
+        array: Normalized binary limbs of the exponent
+    """
+    if isinstance(exponent, int):
+        if exponent < 0:
+            raise ValueError("negative exponent")
+        return _limbs_from_int(exponent, True)
+    exponent = _coerce(exponent)
+    if not exponent.positive:
+        raise ValueError("negative exponent")
+    return _converted_limbs(exponent, True)
+
+
+def _limbs_sliding_window(
+    limbs: array, exponent: array, one: array, multiply: object
+) -> array:
+    """Raise magnitude to a power scanning exponent bits in windows
+
+    Odd powers up to the window size are precomputed, so a run of k bits
+    costs k squarings and at most one multiplication.
+
+    Args:
+        limbs (array): Limbs of the base
+        exponent (array): Normalized binary limbs of the exponent
+        one (array): Limbs of the unit in the representation of the base
+        multiply (callable): Product of two limb arrays, squaring when both
+            arguments are the same array
+
+    Returns:
+        array: Limbs of the power
+    """
+    bits = len(exponent) * BINARY_LIMB_DIGITS
+    while bits and not exponent[(bits - 1) // BINARY_LIMB_DIGITS] >> (
+        (bits - 1) % BINARY_LIMB_DIGITS
+    ) & 1:
+        bits -= 1
+    if not bits:
+        return one
+
+    def bit(index):
+        limb, offset = divmod(index, BINARY_LIMB_DIGITS)
+        return exponent[limb] >> offset & 1
+
+    window = 1
+    for size, limit in ((2, 24), (3, 80), (4, 240), (5, 672), (6, 1792)):
+        if bits > limit:
+            window = size
+    powers = [limbs]
+    if window > 1:
+        square = multiply(limbs, limbs)
+        for _ in range((1 << (window - 1)) - 1):
+            powers.append(multiply(powers[-1], square))
+    result = None
+    index = bits - 1
+    while index >= 0:
+        if not bit(index):
+            result = multiply(result, result)
+            index -= 1
+            continue
+        low = max(index - window + 1, 0)
+        while not bit(low):
+            low += 1
+        value = 0
+        for position in range(index, low - 1, -1):
+            value = value << 1 | bit(position)
+        if result is None:
+            result = powers[value >> 1]
+        else:
+            for _ in range(index - low + 1):
+                result = multiply(result, result)
+            result = multiply(result, powers[value >> 1])
+        index = low - 1
+    return array(LIMB_TYPECODE, result) if result is limbs else result
+
+
+def _limbs_montgomery_reduce(limbs: array, modulus: array, inverse: int) -> array:
+    """Divide magnitude by R modulo an odd modulus (Montgomery reduction)
+
+    Args:
+        limbs (array): Normalized binary limbs below modulus * R
+        modulus (array): Normalized binary limbs of the odd modulus
+        inverse (int): -1 / modulus modulo limb base
+
+    Returns:
+        array: Normalized limbs of limbs / R modulo modulus, below modulus
+    """
+    size = len(modulus)
+    mask = BINARY_BASE - 1
+    columns = list(limbs)
+    columns.extend([0] * (2 * size + 1 - len(columns)))
+    # Every step adds the multiple of the modulus that clears the lowest
+    # column; carries of the cleared column move up without normalizing.
+    for i in range(size):
+        factor = columns[i] * inverse & mask
+        if factor:
+            for j, limb in enumerate(modulus, i):
+                columns[j] += factor * limb
+        columns[i + 1] += columns[i] >> BINARY_LIMB_DIGITS
+    result = _limbs_carry(columns[size:], BINARY_BASE)
+    if _limbs_cmp(result, modulus) >= 0:
+        _limbs_isub(result, modulus, BINARY_BASE)
+    return result
+
+
+def _limbs_barrett_reduce(
+    limbs: array, modulus: array, reciprocal: array, base: int
+) -> array:
+    """Reduce magnitude by a modulus with Barrett reduction
+
+    Args:
+        limbs (array): Normalized limbs below base**(2 * len(modulus))
+        modulus (array): Normalized limbs of the modulus
+        reciprocal (array): Limbs of base**(2 * len(modulus)) // modulus
+        base (int): Limb base
+
+    Returns:
+        array: Normalized limbs of limbs modulo modulus
+    """
+    size = len(modulus)
+    estimate = _limbs_mul(limbs[size - 1:], reciprocal, base)[size + 1:]
+    result = _limbs_sub(limbs, _limbs_mul(estimate, modulus, base), base)
+    while _limbs_cmp(result, modulus) >= 0:
+        _limbs_isub(result, modulus, base)
+    return result
+
+
+def _limbs_combine(first: array, second: array, x: int, y: int, base: int) -> array:
+    """Linear combination of magnitudes with coefficients of opposite signs
+
+    Args:
+        first (array): Normalized limbs of the first magnitude
+        second (array): Normalized limbs of the second magnitude
+        x (int): Coefficient of the first magnitude
+        y (int): Coefficient of the second magnitude, x * y <= 0
+
+    Returns:
+        array: Normalized limbs of x * first + y * second, which must not be
+            negative
+    """
+    if y <= 0:
+        return _limbs_sub(
+            _limbs_muladd_small(first, x, 0, base),
+            _limbs_muladd_small(second, -y, 0, base),
+            base,
+        )
+    return _limbs_sub(
+        _limbs_muladd_small(second, y, 0, base),
+        _limbs_muladd_small(first, -x, 0, base),
+        base,
+    )
+
+
+def _limbs_gcd(first: array, second: array, base: int, cofactor: bool) -> tuple:
+    """Greatest common divisor of magnitudes by Lehmer's algorithm
+
+    Remainders of Euclid are advanced in batches found by running Euclid on
+    the leading two limbs for as long as the quotients agree with those of
+    the whole numbers (Knuth's Algorithm L). Cofactors alternate in sign,
+    so only their magnitudes are tracked together with the step count.
+
+    Args:
+        first (array): Normalized limbs of the first magnitude
+        second (array): Normalized limbs of the second magnitude
+        base (int): Limb base
+        cofactor (bool): Whether to compute the cofactor of first
+
+    Returns:
+        tuple: Normalized limbs of the gcd, limbs of the magnitude of u such
+            that u * first == gcd modulo second and whether u is negative
+    """
+    first, second = array(LIMB_TYPECODE, first), array(LIMB_TYPECODE, second)
+    u, v = array(LIMB_TYPECODE, [1]), array(LIMB_TYPECODE)
+    steps = 0
+    while second:
+        size = len(first)
+        if size > 1 and size == len(second):
+            high = first[-1] * base + first[-2]
+            low = second[-1] * base + second[-2]
+            a, b, c, d = 1, 0, 0, 1
+            count = 0
+            while low + c and low + d:
+                quotient = (high + a) // (low + c)
+                if quotient != (high + b) // (low + d):
+                    break
+                a, c = c, a - quotient * c
+                b, d = d, b - quotient * d
+                high, low = low, high - quotient * low
+                count += 1
+            if count:
+                first, second = (
+                    _limbs_combine(first, second, a, b, base),
+                    _limbs_combine(first, second, c, d, base),
+                )
+                if cofactor:
+                    u, v = (
+                        _limbs_add(
+                            _limbs_muladd_small(u, abs(a), 0, base),
+                            _limbs_muladd_small(v, abs(b), 0, base),
+                            base,
+                        ),
+                        _limbs_add(
+                            _limbs_muladd_small(u, abs(c), 0, base),
+                            _limbs_muladd_small(v, abs(d), 0, base),
+                            base,
+                        ),
+                    )
+                steps += count
+                continue
+        quotient, remainder = _limbs_divmod(first, second, base)
+        first, second = second, remainder
+        if cofactor:
+            u, v = v, _limbs_add(u, _limbs_mul(quotient, v, base), base)
+        steps += 1
+    return first, u, bool(steps & 1)
+
+
+def _limbs_shift_left(limbs: array, shift: int) -> array:
+    """Shift binary magnitude left
+
+    Args:
+        limbs (array): Normalized binary limbs
+        shift (int): Non-negative number of bits
+
+    Returns:
+        array: Normalized limbs of limbs << shift
+    """
+    result = array(LIMB_TYPECODE, limbs)
+    _limbs_ishift_left(result, shift)
+    return result
+
+
+def _limbs_shift_right(limbs: array, shift: int) -> array:
+    """Shift binary magnitude right dropping the low bits
+
+    Args:
+        limbs (array): Normalized binary limbs
+        shift (int): Non-negative number of bits
+
+    Returns:
+        array: Normalized limbs of limbs >> shift
+    """
+    result = limbs[shift // BINARY_LIMB_DIGITS:]
+    if not isinstance(result, array):
+        result = array(LIMB_TYPECODE, result)
+    _limbs_ishift_right(result, shift % BINARY_LIMB_DIGITS)
+    return result
+
+
+def _limbs_ishift_left(limbs: array, shift: int) -> None:
+    """Shift binary magnitude left in place
+
+    Whole limbs are moved at once and the remaining bits are shifted in a
+    single pass over the words.
+
+    Args:
+        limbs (array): Normalized binary limbs to update
+        shift (int): Non-negative number of bits
+    """
+    if not limbs:
+        return
+    count, bits = divmod(shift, BINARY_LIMB_DIGITS)
+    if bits:
+        back = BINARY_LIMB_DIGITS - bits
+        mask = BINARY_BASE - 1
+        limbs.append(limbs[-1] >> back)
+        for i in range(len(limbs) - 2, 0, -1):
+            limbs[i] = ((limbs[i] << bits) & mask) | (limbs[i - 1] >> back)
+        limbs[0] = (limbs[0] << bits) & mask
+        _limbs_normalize(limbs)
+    if count:
+        limbs[0:0] = array(LIMB_TYPECODE, [0]) * count
+
+
+def _limbs_ishift_right(limbs: array, shift: int) -> None:
+    """Shift binary magnitude right in place dropping the low bits
+
+    Args:
+        limbs (array): Normalized binary limbs to update
+        shift (int): Non-negative number of bits
+    """
+    count, bits = divmod(shift, BINARY_LIMB_DIGITS)
+    del limbs[:count]
+    if bits and limbs:
+        back = BINARY_LIMB_DIGITS - bits
+        mask = BINARY_BASE - 1
+        for i in range(len(limbs) - 1):
+            limbs[i] = (limbs[i] >> bits) | ((limbs[i + 1] << back) & mask)
+        limbs[-1] >>= bits
+        _limbs_normalize(limbs)
+
+
+def _limbs_isqrt(limbs: array) -> array:
+    """Integer square root of binary magnitude
+
+    The root of the leading 2 * k bits is extended to the root of the
+    leading 4 * k bits with one Newton step, one division of about k bits.
+
+    Args:
+        limbs (array): Normalized binary limbs
+
+    Returns:
+        array: Normalized limbs of the largest root not above the magnitude
+    """
+    if not limbs:
+        return array(LIMB_TYPECODE)
+    shift = (_significant_digits(limbs, True) - 1) // 2
+    root = array(LIMB_TYPECODE, [1])
+    done = 0
+    for step in range(shift.bit_length() - 1, -1, -1):
+        previous, done = done, shift >> step
+        quotient = _limbs_divmod(
+            _limbs_shift_right(limbs, 2 * shift - previous - done + 1),
+            root,
+            BINARY_BASE,
+        )[0]
+        root = _limbs_add(
+            _limbs_shift_left(root, done - previous - 1), quotient, BINARY_BASE
+        )
+    if _limbs_cmp(_limbs_square(root, BINARY_BASE), limbs) > 0:
+        root = _limbs_sub(root, array(LIMB_TYPECODE, [1]), BINARY_BASE)
+    return root
+
+
+def _limbs_low_bits(limbs: array, shift: int) -> bool:
+    """Check whether any of the low bits of binary magnitude is set
+
+    Args:
+        limbs (array): Normalized binary limbs
+        shift (int): Number of low bits to check
+
+    Returns:
+        bool: True if limbs % 2**shift is not zero
+    """
+    count, bits = divmod(shift, BINARY_LIMB_DIGITS)
+    if any(limbs[:count]):
+        return True
+    return count < len(limbs) and bool(limbs[count] & ((1 << bits) - 1))
+
+
+def _limbs_bitwise(
+    first: array,
+    first_positive: bool,
+    second: array,
+    second_positive: bool,
+    operation: object,
+) -> tuple:
+    """Apply bitwise operation to signed binary magnitudes
+
+    Negative numbers take part as infinite two's complement bit strings:
+    their limbs are those of magnitude - 1 inverted, padded with ones.
+
+    Args:
+        first (array): Normalized binary limbs of the first magnitude
+        first_positive (bool): Sign of the first number
+        second (array): Normalized binary limbs of the second magnitude
+        second_positive (bool): Sign of the second number
+        operation (callable): Bitwise operation on two limbs
+
+    Returns:
+        tuple: Normalized limbs of result magnitude and its sign
+    """
+    one = array(LIMB_TYPECODE, [1])
+    mask = BINARY_BASE - 1
+    first_fill = 0 if first_positive else mask
+    second_fill = 0 if second_positive else mask
+    if not first_positive:
+        first = _limbs_sub(first, one, BINARY_BASE)
+    if not second_positive:
+        second = _limbs_sub(second, one, BINARY_BASE)
+    fill = operation(first_fill, second_fill)
+    result = array(LIMB_TYPECODE, [0]) * max(len(first), len(second))
+    for i in range(len(result)):
+        first_limb = (first[i] if i < len(first) else 0) ^ first_fill
+        second_limb = (second[i] if i < len(second) else 0) ^ second_fill
+        result[i] = operation(first_limb, second_limb) ^ fill
+    result = _limbs_normalize(result)
+    if fill:
+        return _limbs_add(result, one, BINARY_BASE), False
+    return result, True
 
 
 if __name__ == "__main__":
@@ -0,0 +1,583 @@
+"""Batch arithmetic over many big integers at once.
+
+BigIntegerArray keeps binary limbs of all its numbers in one packed
+two-dimensional array, one row per limb position, so elementwise operations
+walk limb positions once and handle every number of the batch in a single
+vector step. NumPy is used when it is installed, otherwise limbs are kept in
+an array.array and processed with plain Python loops.
+"""
+import operator
+from array import array
+
+from big_integer import (
+    BINARY_BASE,
+    BINARY_LIMB_DIGITS,
+    LIMB_TYPECODE,
+    BigInteger,
+    _limbs_normalize,
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+LIMB_MASK = BINARY_BASE - 1
+
+
+class _Column:
+    """Limbs of all numbers at one position when NumPy is not available"""
+
+    __slots__ = ("values",)
+
+    def __init__(self, values: array) -> None:
+        self.values = values
+
+    def _apply(self, other: object, operation: object) -> "_Column":
+        if isinstance(other, _Column):
+            return _Column(array("Q", map(operation, self.values, other.values)))
+        return _Column(
+            array("Q", [operation(value, other) for value in self.values])
+        )
+
+    def __add__(self, other: object) -> "_Column":
+        return self._apply(other, operator.add)
+
+    def __sub__(self, other: object) -> "_Column":
+        return self._apply(other, operator.sub)
+
+    def __mul__(self, other: object) -> "_Column":
+        return self._apply(other, operator.mul)
+
+    def __and__(self, other: object) -> "_Column":
+        return self._apply(other, operator.and_)
+
+    def __or__(self, other: object) -> "_Column":
+        return self._apply(other, operator.or_)
+
+    def __xor__(self, other: object) -> "_Column":
+        return self._apply(other, operator.xor)
+
+    def __lshift__(self, other: object) -> "_Column":
+        return self._apply(other, operator.lshift)
+
+    def __rshift__(self, other: object) -> "_Column":
+        return self._apply(other, operator.rshift)
+
+
+class BigIntegerArray:
+    """Fixed-size batch of big integers with vectorized elementwise operations"""
+
+    def __init__(self, values: object = (), use_numpy: bool = None) -> None:
+        """Pack big integers into limb columns
+
+        Args:
+            values (iterable, optional): BigInteger, int or str values.
+                Defaults to empty batch.
+            use_numpy (bool, optional): Force NumPy on or off. Defaults to
+                using NumPy when it is installed.
+        """
+        if use_numpy is None:
+            use_numpy = numpy is not None
+        if use_numpy and numpy is None:
+            raise ImportError("NumPy is not installed")
+        self._numpy = use_numpy
+        integers = [
+            value if isinstance(value, BigInteger) else BigInteger(value)
+            for value in values
+        ]
+        self._count = len(integers)
+        self._binary = bool(integers) and all(value.is_binary for value in integers)
+        limbs = [value.to_bin()._limbs for value in integers]
+        width = max((len(value) for value in limbs), default=0)
+        self._signs = self._vector(
+            [int(not value.positive and bool(value._limbs)) for value in integers]
+        )
+        self._limbs = self._pack(
+            [
+                self._vector([value[j] if j < len(value) else 0 for value in limbs])
+                for j in range(width)
+            ]
+        )
+
+    def _vector(self, values: list) -> object:
+        """Build one column of limbs in the storage of the batch
+
+        Args:
+            values (list): Limb of every number of the batch
+
+        Returns:
+            numpy.ndarray | _Column: Column of limbs
+        """
+        if self._numpy:
+            return numpy.array(values, dtype=numpy.uint64)
+        return _Column(array("Q", values))
+
+    def _zeros(self) -> object:
+        """Build column of zero limbs
+
+        Returns:
+            numpy.ndarray | _Column: Column of zeros
+        """
+        if self._numpy:
+            return numpy.zeros(self._count, dtype=numpy.uint64)
+        return _Column(array("Q", bytes(8 * self._count)))
+
+    def _pack(self, columns: list) -> object:
+        """Pack limb columns into one two-dimensional array
+
+        Args:
+            columns (list): Columns of limbs, least significant first
+
+        Returns:
+            numpy.ndarray | array: Limbs with one row per limb position
+        """
+        while columns and not self._any(columns[-1]):
+            columns.pop()
+        if self._numpy:
+            if not columns:
+                return numpy.zeros((0, self._count), dtype=numpy.uint64)
+            return numpy.stack(columns)
+        packed = array("Q")
+        for column in columns:
+            packed.extend(column.values)
+        return packed
+
+    def _columns(self) -> list:
+        """Split packed limbs into columns
+
+        Returns:
+            list: Columns of limbs, least significant first
+        """
+        if self._numpy:
+            return list(self._limbs)
+        count = self._count
+        if not count:
+            return []
+        return [
+            _Column(self._limbs[start:start + count])
+            for start in range(0, len(self._limbs), count)
+        ]
+
+    def _any(self, column: object) -> bool:
+        """Check whether any limb of the column is not zero"""
+        if self._numpy:
+            return bool(column.any())
+        return any(column.values)
+
+    def _nonzero(self, column: object) -> object:
+        """Map every limb to 1 if it is not zero and to 0 otherwise"""
+        if self._numpy:
+            return (column != 0).astype(numpy.uint64)
+        return _Column(array("Q", [value != 0 for value in column.values]))
+
+    def _less(self, first: object, second: object) -> object:
+        """Map every pair of limbs to 1 if the first one is less"""
+        if self._numpy:
+            return (first < second).astype(numpy.uint64)
+        return _Column(array("Q", map(operator.lt, first.values, second.values)))
+
+    def _select(self, condition: object, first: object, second: object) -> object:
+        """Take limbs of the first column where condition is 1, else the second"""
+        if self._numpy:
+            return numpy.where(condition.astype(bool), first, second)
+        return _Column(
+            array(
+                "Q",
+                [
+                    one if flag else other
+                    for flag, one, other in zip(
+                        condition.values, first.values, second.values
+                    )
+                ],
+            )
+        )
+
+    def _result(self, columns: list, signs: object) -> "BigIntegerArray":
+        """Build batch of the same shape from result columns
+
+        Args:
+            columns (list): Columns of magnitudes, least significant first
+            signs (object): Column with 1 for negative numbers
+
+        Returns:
+            BigIntegerArray: New batch
+        """
+        result = BigIntegerArray.__new__(BigIntegerArray)
+        result._numpy = self._numpy
+        result._count = self._count
+        result._binary = self._binary
+        nonzero = self._zeros()
+        for column in columns:
+            nonzero = nonzero | column
+        result._signs = signs & self._nonzero(nonzero)
+        result._limbs = result._pack(columns)
+        return result
+
+    def _coerce(self, other: object) -> "BigIntegerArray":
+        """Check that another batch matches this one
+
+        Args:
+            other (BigIntegerArray): Another batch
+
+        Raises:
+            ValueError: Batches differ in size
+
+        Returns:
+            BigIntegerArray: Another batch in the storage of this one
+        """
+        if not isinstance(other, BigIntegerArray):
+            other = BigIntegerArray(other, use_numpy=self._numpy)
+        if len(other) != len(self):
+            raise ValueError(f"size mismatch: {len(self)} and {len(other)}")
+        if other._numpy != self._numpy:
+            other = BigIntegerArray(other.tolist(), use_numpy=self._numpy)
+        return other
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> BigInteger:
+        """Unpack one number of the batch
+
+        Args:
+            index (int): Position of the number
+
+        Returns:
+            BigInteger: Number at the position
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("BigIntegerArray index out of range")
+        if self._numpy:
+            limbs = self._limbs[:, index].tolist()
+            sign = int(self._signs[index])
+        else:
+            limbs = self._limbs[index::self._count]
+            sign = self._signs.values[index]
+        return self._unpack(_limbs_normalize(array(LIMB_TYPECODE, limbs)), not sign)
+
+    def _unpack(self, limbs: array, positive: bool) -> BigInteger:
+        """Build big integer in the radix of the batch from binary limbs"""
+        integer = BigInteger._from_limbs(limbs, positive, binary=True)
+        return integer if self._binary else integer.from_bin()
+
+    def tolist(self) -> list:
+        """Unpack all numbers of the batch
+
+        Returns:
+            list: BigInteger values in batch order
+        """
+        if self._numpy:
+            rows = self._limbs.T.tolist()
+            signs = self._signs.tolist()
+        else:
+            rows = [self._limbs[index::self._count] for index in range(self._count)]
+            signs = self._signs.values
+        return [
+            self._unpack(_limbs_normalize(array(LIMB_TYPECODE, row)), not sign)
+            for row, sign in zip(rows, signs)
+        ]
+
+    def __add__(self, other: object) -> "BigIntegerArray":
+        """Elementwise sum of two batches
+
+        Args:
+            other (BigIntegerArray | iterable): Another batch of the same size
+
+        Returns:
+            BigIntegerArray: Sums of numbers
+        """
+        other = self._coerce(other)
+        return self._add(other, other._signs)
+
+    def __sub__(self, other: object) -> "BigIntegerArray":
+        """Elementwise difference of two batches
+
+        Args:
+            other (BigIntegerArray | iterable): Another batch of the same size
+
+        Returns:
+            BigIntegerArray: Differences of numbers
+        """
+        other = self._coerce(other)
+        return self._add(other, other._signs ^ 1)
+
+    def _add(self, other: "BigIntegerArray", other_signs: object) -> object:
+        """Add another batch taken with the given signs
+
+        Both sums and differences of magnitudes are computed for every
+        number and the right one is selected per number, so no step depends
+        on the data.
+
+        Args:
+            other (BigIntegerArray): Another batch of the same size
+            other_signs (object): Column with 1 where another number is negative
+
+        Returns:
+            BigIntegerArray: Sums of numbers
+        """
+        first, second = self._columns(), other._columns()
+        width = max(len(first), len(second))
+        zero = self._zeros()
+        first += [zero] * (width - len(first))
+        second += [zero] * (width - len(second))
+        same = self._signs ^ other_signs ^ 1
+        less = self._magnitude_less(first, second)
+        total = self._add_columns(first, second)
+        difference = [
+            self._select(less, high, low)
+            for low, high in zip(
+                self._sub_columns(first, second), self._sub_columns(second, first)
+            )
+        ]
+        difference.append(zero)
+        columns = [
+            self._select(same, one, other) for one, other in zip(total, difference)
+        ]
+        signs = self._select(
+            same, self._signs, self._select(less, other_signs, self._signs)
+        )
+        return self._result(columns, signs)
+
+    def _magnitude_less(self, first: list, second: list) -> object:
+        """Compare magnitudes of numbers from the most significant limb
+
+        Args:
+            first (list): Columns of the first magnitudes, same width as second
+            second (list): Columns of the second magnitudes
+
+        Returns:
+            object: Column with 1 where the first magnitude is less
+        """
+        less = self._zeros()
+        decided = self._zeros()
+        for one, other in zip(reversed(first), reversed(second)):
+            undecided = decided ^ 1
+            less = less | (undecided & self._less(one, other))
+            decided = decided | self._nonzero(one ^ other)
+        return less
+
+    def _add_columns(self, first: list, second: list) -> list:
+        """Add magnitudes column by column carrying into the next limb
+
+        Args:
+            first (list): Columns of the first magnitudes, same width as second
+            second (list): Columns of the second magnitudes
+
+        Returns:
+            list: Columns of sums, one limb wider
+        """
+        result = []
+        carry = self._zeros()
+        for one, other in zip(first, second):
+            total = one + other + carry
+            result.append(total & LIMB_MASK)
+            carry = total >> BINARY_LIMB_DIGITS
+        result.append(carry)
+        return result
+
+    def _sub_columns(self, first: list, second: list) -> list:
+        """Subtract magnitudes column by column borrowing from the next limb
+
+        Rows where the first magnitude is less get meaningless values.
+
+        Args:
+            first (list): Columns of minuends, same width as second
+            second (list): Columns of subtrahends
+
+        Returns:
+            list: Columns of differences
+        """
+        result = []
+        borrow = self._zeros()
+        for one, other in zip(first, second):
+            difference = one + BINARY_BASE - other - borrow
+            result.append(difference & LIMB_MASK)
+            borrow = (difference >> BINARY_LIMB_DIGITS) ^ 1
+        return result
+
+    def __mul__(self, factor: int) -> "BigIntegerArray":
+        """Multiply every number by a machine-size integer
+
+        Args:
+            factor (int): Factor with absolute value below 2**32
+
+        Returns:
+            BigIntegerArray: Products of numbers
+        """
+        return self.mul_small(factor)
+
+    def mul_small(self, factor: int) -> "BigIntegerArray":
+        """Multiply every number by a machine-size integer
+
+        Args:
+            factor (int): Factor with absolute value below 2**32
+
+        Raises:
+            ValueError: Factor does not fit in one limb
+
+        Returns:
+            BigIntegerArray: Products of numbers
+        """
+        if abs(factor) >= BINARY_BASE:
+            raise ValueError("factor must fit in one limb")
+        multiplier = abs(factor)
+        result = []
+        carry = self._zeros()
+        for column in self._columns():
+            product = column * multiplier + carry
+            result.append(product & LIMB_MASK)
+            carry = product >> BINARY_LIMB_DIGITS
+        result.append(carry)
+        return self._result(result, self._signs ^ int(factor < 0))
+
+    def compare(self, other: object) -> object:
+        """Elementwise three-way comparison of two batches
+
+        Args:
+            other (BigIntegerArray | iterable): Another batch of the same size
+
+        Returns:
+            numpy.ndarray | array: -1, 0 or 1 for every pair of numbers
+        """
+        other = self._coerce(other)
+        first, second = self._columns(), other._columns()
+        width = max(len(first), len(second))
+        zero = self._zeros()
+        first += [zero] * (width - len(first))
+        second += [zero] * (width - len(second))
+        less = self._magnitude_less(first, second)
+        greater = self._magnitude_less(second, first)
+        # Negative numbers reverse the order of magnitudes, different signs
+        # decide on their own.
+        less, greater = (
+            self._select(self._signs, greater, less),
+            self._select(self._signs, less, greater),
+        )
+        differ = self._signs ^ other._signs
+        less = self._select(differ, self._signs, less)
+        greater = self._select(differ, other._signs, greater)
+        if self._numpy:
+            return greater.astype(numpy.int8) - less.astype(numpy.int8)
+        return array("b", map(operator.sub, greater.values, less.values))
+
+    def _bitwise(self, other: object, operation: object) -> "BigIntegerArray":
+        """Apply bitwise operation to two's complement forms of numbers
+
+        Args:
+            other (BigIntegerArray | iterable): Another batch of the same size
+            operation (callable): Bitwise operation on two columns
+
+        Returns:
+            BigIntegerArray: Results in binary radix
+        """
+        other = self._coerce(other)
+        first, first_fill = self._twos_complement()
+        second, second_fill = other._twos_complement()
+        width = max(len(first), len(second))
+        first += [first_fill] * (width - len(first))
+        second += [second_fill] * (width - len(second))
+        fill = operation(first_fill, second_fill)
+        signs = fill & 1
+        columns = [operation(one, other) ^ fill for one, other in zip(first, second)]
+        one = [signs] + [self._zeros()] * width
+        columns.append(self._zeros())
+        result = self._result(self._add_columns(columns, one)[:-1], signs)
+        result._binary = True
+        return result
+
+    def _twos_complement(self) -> tuple:
+        """Return limbs of numbers as two's complement columns
+
+        Returns:
+            tuple: Columns of limbs and column of infinite sign extension
+        """
+        columns = self._columns()
+        fill = self._signs * LIMB_MASK
+        one = [self._signs] + [self._zeros()] * (len(columns) - 1)
+        if columns:
+            columns = self._sub_columns(columns, one)
+        return [column ^ fill for column in columns], fill
+
+    def __or__(self, other: object) -> "BigIntegerArray":
+        """Elementwise bitwise OR of two batches"""
+        return self._bitwise(other, operator.or_)
+
+    def __and__(self, other: object) -> "BigIntegerArray":
+        """Elementwise bitwise AND of two batches"""
+        return self._bitwise(other, operator.and_)
+
+    def __xor__(self, other: object) -> "BigIntegerArray":
+        """Elementwise bitwise XOR of two batches"""
+        return self._bitwise(other, operator.xor)
+
+    def __lshift__(self, shift: int) -> "BigIntegerArray":
+        """Shift every number left by the same number of bits
+
+        Args:
+            shift (int): Shift amount
+
+        Returns:
+            BigIntegerArray: Shifted numbers in binary radix
+        """
+        if shift < 0:
+            return self >> -shift
+        count, bits = divmod(shift, BINARY_LIMB_DIGITS)
+        columns = self._columns()
+        zero = self._zeros()
+        if bits:
+            back = BINARY_LIMB_DIGITS - bits
+            columns = [
+                ((column << bits) & LIMB_MASK) | (lower >> back)
+                for column, lower in zip(columns + [zero], [zero] + columns)
+            ]
+        result = self._result([zero] * count + columns, self._signs)
+        result._binary = True
+        return result
+
+    def __rshift__(self, shift: int) -> "BigIntegerArray":
+        """Shift every number right by the same number of bits
+
+        Negative numbers are rounded towards negative infinity, as for
+        BigInteger.
+
+        Args:
+            shift (int): Shift amount
+
+        Returns:
+            BigIntegerArray: Shifted numbers in binary radix
+        """
+        if shift < 0:
+            return self << -shift
+        count, bits = divmod(shift, BINARY_LIMB_DIGITS)
+        columns = self._columns()
+        zero = self._zeros()
+        lost = zero
+        for column in columns[:count]:
+            lost = lost | column
+        columns = columns[count:]
+        if bits and columns:
+            lost = lost | (columns[0] & ((1 << bits) - 1))
+            back = BINARY_LIMB_DIGITS - bits
+            columns = [
+                (column >> bits) | ((higher << back) & LIMB_MASK)
+                for column, higher in zip(columns, columns[1:] + [zero])
+            ]
+        columns.append(zero)
+        round_down = [self._signs & self._nonzero(lost)]
+        round_down += [zero] * (len(columns) - 1)
+        result = self._result(
+            self._add_columns(columns, round_down)[:-1], self._signs
+        )
+        result._binary = True
+        return result
+
+    def __neg__(self) -> "BigIntegerArray":
+        """Negate every number of the batch"""
+        return self._result(self._columns(), self._signs ^ 1)
+
+    def __repr__(self) -> str:
+        values = ", ".join(str(value) for value in self.tolist())
+        return f"BigIntegerArray([{values}])"
@@ -0,0 +1,367 @@
+"""Asyncio-friendly arithmetic on big integers.
+
+AsyncArithmetic lets coroutines multiply, divide and convert big integers
+without stalling the event loop. Operands shorter than the cooperative
+threshold are handled synchronously, since scheduling would cost more than
+the work. Mid-size operations resume the step generators of the algorithms
+in big_integer on the loop, computing their products in chunks of bounded
+cost and giving control back to the loop between chunks, and huge
+operations run on an executor. Cancelling the awaiting task stops
+cooperative work at the next chunk; work already handed to an executor
+cannot be interrupted, so its result is dropped.
+"""
+import asyncio
+import operator
+from array import array
+
+from big_integer import (
+    DECIMAL_BASE,
+    BINARY_BASE,
+    LIMB_TYPECODE,
+    BigInteger,
+    _coerce,
+    _limbs_add,
+    _limbs_cmp,
+    _limbs_divmod,
+    _limbs_divmod_newton_steps,
+    _limbs_karatsuba_steps,
+    _limbs_mul,
+    _limbs_normalize,
+    _limbs_shift_limbs,
+    _limbs_sub,
+    _limbs_to_radix_steps,
+)
+
+# Size in limbs of the longer operand from which operations run in chunks.
+COOPERATIVE_THRESHOLD = 128
+# Size in limbs of the longer operand from which operations run on the executor.
+OFFLOAD_THRESHOLD = 4096
+# Size in limbs of the operands of sub-products computed between yields.
+COOPERATIVE_CHUNK = 128
+
+
+class AsyncArithmetic:
+    """Arithmetic on big integers for coroutines
+
+    Results are equal to those of the BigInteger operators.
+    """
+
+    def __init__(
+        self,
+        executor: object = None,
+        cooperative_threshold: int = COOPERATIVE_THRESHOLD,
+        offload_threshold: int = OFFLOAD_THRESHOLD,
+        chunk: int = COOPERATIVE_CHUNK,
+    ) -> None:
+        """Prepare arithmetic
+
+        Args:
+            executor (Executor, optional): Executor for huge operations. A
+                ProcessPoolExecutor avoids competing with the loop for the
+                GIL. Defaults to None, the default executor of the loop.
+            cooperative_threshold (int, optional): Size in limbs from which
+                operations run in chunks. Defaults to COOPERATIVE_THRESHOLD.
+            offload_threshold (int, optional): Size in limbs from which
+                operations run on the executor. Defaults to OFFLOAD_THRESHOLD.
+            chunk (int, optional): Size in limbs of the operands of work done
+                between yields. Defaults to COOPERATIVE_CHUNK.
+        """
+        self.executor = executor
+        self.cooperative_threshold = cooperative_threshold
+        self.offload_threshold = offload_threshold
+        self.chunk = chunk
+        # Limb products computed since control last went back to the loop.
+        self._work = 0
+
+    def _mode(self, *operands: BigInteger) -> str:
+        """Choose how to run an operation
+
+        Args:
+            *operands (BigInteger): Operands of the operation
+
+        Returns:
+            str: "sync", "cooperative" or "offload"
+        """
+        size = max(len(operand._limbs) for operand in operands)
+        if size >= self.offload_threshold:
+            return "offload"
+        if size >= self.cooperative_threshold:
+            return "cooperative"
+        return "sync"
+
+    async def _offload(self, function: object, *args: object) -> object:
+        """Run function on the executor
+
+        Args:
+            function (callable): Picklable function
+            *args (object): Picklable arguments
+
+        Returns:
+            object: Result of the function
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, function, *args)
+
+    async def _pause(self, work: int) -> None:
+        """Give control back to the loop once a chunk of work is done
+
+        Args:
+            work (int): Limb products computed since the last call
+        """
+        self._work += work
+        if self._work >= self.chunk * self.chunk:
+            self._work = 0
+            await asyncio.sleep(0)
+
+    async def _drive(self, steps: object, base: int) -> object:
+        """Run step generator on the loop computing its products
+
+        Args:
+            steps (generator): Step generator of an algorithm, see _limbs_drive
+            base (int): Limb base
+
+        Returns:
+            object: Result of the step generator
+        """
+        try:
+            pairs = next(steps)
+            while True:
+                products = []
+                for first, second in pairs:
+                    products.append(await self._mul_limbs(first, second, base))
+                # Joining products costs linear work in their size, so
+                # joins up the recursion do not pile up between yields.
+                await asyncio.sleep(0)
+                pairs = steps.send(products)
+        except StopIteration as stop:
+            return stop.value
+
+    async def _mul_limbs(self, first: array, second: array, base: int) -> array:
+        """Multiply magnitudes yielding to the loop between sub-products
+
+        Resumes _limbs_karatsuba_steps down to sub-products of chunk limbs,
+        which are computed synchronously.
+
+        Args:
+            first (array): Limbs of the first magnitude
+            second (array): Limbs of the second magnitude
+            base (int): Limb base
+
+        Returns:
+            array: Normalized limbs of the product
+        """
+        # Karatsuba halves of fewer than four limbs would not shrink.
+        size = max(len(first), len(second))
+        if not first or not second or size <= max(self.chunk, 3):
+            product = _limbs_mul(first, second, base)
+            await self._pause(len(first) * len(second))
+            return product
+        return await self._drive(_limbs_karatsuba_steps(first, second, base), base)
+
+    async def _divmod_limbs(self, first: array, second: array, base: int) -> tuple:
+        """Divide magnitudes yielding to the loop between quotient blocks
+
+        Divisors up to chunk limbs use long division, a block of quotient
+        limbs at a time sized so that every block costs about one product
+        of chunk limbs. Longer divisors resume _limbs_divmod_newton_steps
+        with products computed by _mul_limbs.
+
+        Args:
+            first (array): Normalized limbs of the dividend
+            second (array): Normalized non-zero limbs of the divisor
+            base (int): Limb base
+
+        Returns:
+            tuple: Normalized limbs of the quotient and the remainder
+        """
+        size = len(second)
+        if size <= self.chunk:
+            step = max(self.chunk * self.chunk // size, 1)
+            quotient = array(LIMB_TYPECODE, [0]) * len(first)
+            remainder = array(LIMB_TYPECODE)
+            for offset in range(len(first) - len(first) % step, -1, -step):
+                current = _limbs_add(
+                    _limbs_shift_limbs(remainder, step),
+                    _limbs_normalize(first[offset:offset + step]),
+                    base,
+                )
+                part, remainder = _limbs_divmod(current, second, base)
+                quotient[offset:offset + len(part)] = part
+                await asyncio.sleep(0)
+            return _limbs_normalize(quotient), remainder
+        return await self._drive(_limbs_divmod_newton_steps(first, second, base), base)
+
+    async def _to_radix(self, limbs: array, binary: bool) -> array:
+        """Convert magnitude between radixes yielding to the loop
+
+        Resumes _limbs_to_radix_steps with products computed by _mul_limbs.
+
+        Args:
+            limbs (array): Normalized limbs in source radix
+            binary (bool): Whether target radix is binary
+
+        Returns:
+            array: Normalized limbs in target radix
+        """
+        base = BINARY_BASE if binary else DECIMAL_BASE
+        return await self._drive(_limbs_to_radix_steps(limbs, binary), base)
+
+    async def _common_limbs(self, first: BigInteger, second: BigInteger) -> tuple:
+        """Return magnitudes of two big integers in a common radix
+
+        Args:
+            first (BigInteger): First big integer
+            second (BigInteger): Second big integer
+
+        Returns:
+            tuple: limbs of first, limbs of second, limb base and binary flag
+        """
+        if first.is_binary == second.is_binary:
+            return first._common_limbs(second)
+        limbs = []
+        for value in (first, second):
+            if value.is_binary:
+                limbs.append(await self._to_radix(value._limbs, False))
+            else:
+                limbs.append(value._limbs)
+        return limbs[0], limbs[1], DECIMAL_BASE, False
+
+    async def mul(self, first: object, second: object) -> BigInteger:
+        """Multiply two integers
+
+        Args:
+            first (BigInteger&quot; | str | int): First factor
+            second (BigInteger&quot; | str | int): Second factor
+
+        Returns:
+            BigInteger: Product of two integers
+        """
+        first, second = _coerce(first), _coerce(second)
+        mode = self._mode(first, second)
+        if mode == "sync":
+            return first * second
+        if mode == "offload":
+            return await self._offload(operator.mul, first, second)
+        first_limbs, second_limbs, base, binary = await self._common_limbs(
+            first, second
+        )
+        return BigInteger._from_limbs(
+            await self._mul_limbs(first_limbs, second_limbs, base),
+            first.positive == second.positive,
+            binary,
+        )
+
+    async def divmod(self, first: object, second: object) -> tuple:
+        """Floor quotient and remainder of two integers
+
+        Args:
+            first (BigInteger&quot; | str | int): Dividend
+            second (BigInteger&quot; | str | int): Divisor
+
+        Raises:
+            ZeroDivisionError: Division by zero
+
+        Returns:
+            tuple: Floor quotient and remainder with the sign of the divisor
+        """
+        first, second = _coerce(first), _coerce(second)
+        mode = self._mode(first, second)
+        if mode == "sync":
+            return divmod(first, second)
+        if mode == "offload":
+            return await self._offload(divmod, first, second)
+        dividend, divisor, base, binary = await self._common_limbs(first, second)
+        if not divisor:
+            raise ZeroDivisionError
+        if _limbs_cmp(dividend, divisor) < 0:
+            quotient, remainder = array(LIMB_TYPECODE), dividend
+        else:
+            quotient, remainder = await self._divmod_limbs(dividend, divisor, base)
+        if first.positive != second.positive and remainder:
+            quotient = _limbs_add(quotient, array(LIMB_TYPECODE, [1]), base)
+            remainder = _limbs_sub(divisor, remainder, base)
+        return (
+            BigInteger._from_limbs(quotient, first.positive == second.positive, binary),
+            BigInteger._from_limbs(remainder, second.positive, binary),
+        )
+
+    async def floordiv(self, first: object, second: object) -> BigInteger:
+        """Floor quotient of two integers
+
+        Args:
+            first (BigInteger&quot; | str | int): Dividend
+            second (BigInteger&quot; | str | int): Divisor
+
+        Raises:
+            ZeroDivisionError: Division by zero
+
+        Returns:
+            BigInteger: Floor quotient
+        """
+        return (await self.divmod(first, second))[0]
+
+    async def mod(self, first: object, second: object) -> BigInteger:
+        """Remainder of two integers
+
+        Args:
+            first (BigInteger&quot; | str | int): Dividend
+            second (BigInteger&quot; | str | int): Divisor
+
+        Raises:
+            ZeroDivisionError: Division by zero
+
+        Returns:
+            BigInteger: Remainder in range [0, |second|)
+        """
+        second = _coerce(second)
+        remainder = (await self.divmod(first, second))[1]
+        if not remainder.positive:
+            remainder = remainder + second.abs()
+        return remainder
+
+    async def to_bin(self, value: object) -> BigInteger:
+        """Convert integer to binary big integer
+
+        Args:
+            value (BigInteger&quot; | str | int): Integer
+
+        Returns:
+            BigInteger: Binary big integer
+        """
+        value = _coerce(value)
+        mode = self._mode(value)
+        if value.is_binary or mode == "sync":
+            return value.to_bin()
+        if mode == "offload":
+            return await self._offload(BigInteger.to_bin, value)
+        return BigInteger._from_limbs(
+            await self._to_radix(value._limbs, True), value.positive, binary=True
+        )
+
+    async def from_bin(self, value: BigInteger) -> BigInteger:
+        """Convert binary big integer to decimal big integer
+
+        Args:
+            value (BigInteger): Binary big integer
+
+        Returns:
+            BigInteger: Decimal big integer
+        """
+        mode = self._mode(value)
+        if not value.is_binary or mode == "sync":
+            return value.from_bin()
+        if mode == "offload":
+            return await self._offload(BigInteger.from_bin, value)
+        return BigInteger._from_limbs(
+            await self._to_radix(value._limbs, False), value.positive
+        )
+
+
+# Arithmetic with default thresholds on the default executor of the loop.
+default_arithmetic = AsyncArithmetic()
+amul = default_arithmetic.mul
+adivmod = default_arithmetic.divmod
+afloordiv = default_arithmetic.floordiv
+amod = default_arithmetic.mod
+ato_bin = default_arithmetic.to_bin
+afrom_bin = default_arithmetic.from_bin
@@ -0,0 +1,345 @@
+"""Lazy evaluation of BigInteger expressions.
+
+Operators on LazyInteger build an expression graph instead of computing
+intermediate numbers. The graph is evaluated at once on str(), comparison
+or evaluate(): shared subexpressions are computed once, temporaries with a
+single user are updated in place and released as soon as their last user
+is done, and the evaluator fuses multiply-add, quotient and remainder of
+the same operands and products reduced by a modulus used more than once.
+"""
+import operator
+
+from big_integer import BarrettContext, BigInteger, _coerce
+
+# Operations evaluated by calling BigInteger directly.
+_OPERATIONS = {
+    "add": operator.add,
+    "sub": operator.sub,
+    "mul": operator.mul,
+    "lshift": operator.lshift,
+    "rshift": operator.rshift,
+    "pow": pow,
+    "abs": BigInteger.abs,
+}
+# In-place forms used when the left operand is a temporary of the evaluation.
+_INPLACE_OPERATIONS = {"add": operator.iadd, "sub": operator.isub}
+# Operations sharing one division of the same operands.
+_DIVISIONS = ("floordiv", "mod", "rem")
+
+
+class LazyInteger:
+    """Node of expression graph over big integers"""
+
+    __slots__ = ("_operation", "_operands", "_value")
+
+    def __init__(self, value: object) -> None:
+        """Wrap integer as a leaf of expression graph
+
+        Args:
+            value (BigInteger&quot; | LazyInteger | str | int): Integer
+        """
+        if isinstance(value, LazyInteger):
+            self._operation = value._operation
+            self._operands = value._operands
+            self._value = value._value
+        else:
+            self._operation = None
+            self._operands = ()
+            self._value = _coerce(value)
+
+    @classmethod
+    def _node(cls, operation: str, *operands: object) -> "LazyInteger":
+        """Build unevaluated node of expression graph
+
+        Args:
+            operation (str): Name of the operation
+            *operands (LazyInteger | BigInteger | str | int): Operands
+
+        Returns:
+            LazyInteger: Node computing the operation on the operands
+        """
+        node = cls.__new__(cls)
+        node._operation = operation
+        node._operands = tuple(
+            operand if isinstance(operand, LazyInteger) else cls(operand)
+            for operand in operands
+        )
+        node._value = None
+        return node
+
+    def evaluate(self) -> BigInteger:
+        """Compute value of expression
+
+        Returns:
+            BigInteger: Value of expression, independent of the graph
+        """
+        return self._evaluated().copy()
+
+    def _evaluated(self) -> BigInteger:
+        """Compute value of expression once and keep it in the node
+
+        Returns:
+            BigInteger: Value of expression owned by the node
+        """
+        if self._value is None:
+            self._value = _Evaluation(self).run()
+        return self._value
+
+    def __str__(self) -> str:
+        return str(self._evaluated())
+
+    def __add__(self, __o: object) -> "LazyInteger":
+        return LazyInteger._node("add", self, __o)
+
+    def __radd__(self, __o: object) -> "LazyInteger":
+        return LazyInteger._node("add", __o, self)
+
+    def __sub__(self, __o: object) -> "LazyInteger":
+        return LazyInteger._node("sub", self, __o)
+
+    def __rsub__(self, __o: object) -> "LazyInteger":
+        return LazyInteger._node("sub", __o, self)
+
+    def __mul__(self, __o: object) -> "LazyInteger":
+        return LazyInteger._node("mul", self, __o)
+
+    def __rmul__(self, __o: object) -> "LazyInteger":
+        return LazyInteger._node("mul", __o, self)
+
+    def __floordiv__(self, __o: object) -> "LazyInteger":
+        return LazyInteger._node("floordiv", self, __o)
+
+    def __rfloordiv__(self, __o: object) -> "LazyInteger":
+        return LazyInteger._node("floordiv", __o, self)
+
+    def __mod__(self, __o: object) -> "LazyInteger":
+        return LazyInteger._node("mod", self, __o)
+
+    def __rmod__(self, __o: object) -> "LazyInteger":
+        return LazyInteger._node("mod", __o, self)
+
+    def __divmod__(self, __o: object) -> tuple:
+        """Quotient and remainder computed by one division on evaluation
+
+        Args:
+            __o (LazyInteger | BigInteger&quot; | str | int): Divisor
+
+        Returns:
+            tuple: Floor quotient and remainder with the sign of the divisor
+        """
+        __o = __o if isinstance(__o, LazyInteger) else LazyInteger(__o)
+        return (
+            LazyInteger._node("floordiv", self, __o),
+            LazyInteger._node("rem", self, __o),
+        )
+
+    def __lshift__(self, shift: object) -> "LazyInteger":
+        return LazyInteger._node("lshift", self, shift)
+
+    def __rshift__(self, shift: object) -> "LazyInteger":
+        return LazyInteger._node("rshift", self, shift)
+
+    def __pow__(self, exponent: object, modulus: object = None) -> "LazyInteger":
+        if modulus is None:
+            return LazyInteger._node("pow", self, exponent)
+        return LazyInteger._node("pow", self, exponent, modulus)
+
+    def abs(self) -> "LazyInteger":
+        return LazyInteger._node("abs", self)
+
+    def _operand(self, __o: object) -> object:
+        """Return comparable value of another operand
+
+        Args:
+            __o (LazyInteger | BigInteger&quot; | str | int): Another integer
+
+        Returns:
+            BigInteger | str | int: Evaluated operand
+        """
+        return __o._evaluated() if isinstance(__o, LazyInteger) else __o
+
+    def __eq__(self, __o: object) -> bool:
+        return self._evaluated() == self._operand(__o)
+
+    def __ne__(self, __o: object) -> bool:
+        return self._evaluated() != self._operand(__o)
+
+    def __lt__(self, __o: object) -> bool:
+        return self._evaluated() < self._operand(__o)
+
+    def __le__(self, __o: object) -> bool:
+        return self._evaluated() <= self._operand(__o)
+
+    def __gt__(self, __o: object) -> bool:
+        return self._evaluated() > self._operand(__o)
+
+    def __ge__(self, __o: object) -> bool:
+        return self._evaluated() >= self._operand(__o)
+
+
+def _key(node: LazyInteger) -> int:
+    """Identify value of node for sharing divisions and moduli
+
+    Args:
+        node (LazyInteger): Node of expression graph
+
+    Returns:
+        int: Identity of the value for evaluated nodes, of the node otherwise
+    """
+    return id(node._value) if node._value is not None else id(node)
+
+
+class _Evaluation:
+    """Single evaluation of expression graph"""
+
+    def __init__(self, root: LazyInteger) -> None:
+        """Plan evaluation of unevaluated nodes below the root
+
+        Args:
+            root (LazyInteger): Unevaluated node
+        """
+        self._root = root
+        # Unevaluated nodes in post-order, remaining uses of their values,
+        # values computed so far and which of them are free to update.
+        self._order = []
+        self._users = {}
+        self._values = {}
+        self._owned = set()
+        # Products evaluated by their modulo node and uses of each modulus.
+        self._fused = set()
+        self._moduli = {}
+        self._contexts = {}
+        self._divisions = {}
+        self._plan()
+
+    def _plan(self) -> None:
+        """Order nodes children first and choose fused products"""
+        stack = [(self._root, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if expanded:
+                self._order.append(node)
+                continue
+            if id(node) in self._users:
+                self._users[id(node)] += 1
+                continue
+            self._users[id(node)] = 1
+            stack.append((node, True))
+            for operand in reversed(node._operands):
+                if operand._value is None:
+                    stack.append((operand, False))
+        for node in self._order:
+            if node._operation != "mod":
+                continue
+            product, modulus = node._operands
+            if (
+                product._operation == "mul"
+                and product._value is None
+                and self._users[id(product)] == 1
+            ):
+                self._fused.add(id(product))
+                self._moduli[_key(modulus)] = self._moduli.get(_key(modulus), 0) + 1
+
+    def _take(self, node: LazyInteger) -> tuple:
+        """Use value of operand once
+
+        Args:
+            node (LazyInteger): Operand
+
+        Returns:
+            tuple: Value and whether it is a temporary with no other users
+        """
+        if node._value is not None:
+            return node._value, False
+        key = id(node)
+        value = self._values[key]
+        self._users[key] -= 1
+        if self._users[key]:
+            return value, False
+        del self._values[key]
+        return value, key in self._owned
+
+    def run(self) -> BigInteger:
+        """Evaluate planned nodes
+
+        Returns:
+            BigInteger: Value of the root
+        """
+        for node in self._order:
+            if id(node) not in self._fused:
+                self._values[id(node)] = self._compute(node)
+                self._owned.add(id(node))
+        return self._values.pop(id(self._root))
+
+    def _compute(self, node: LazyInteger) -> BigInteger:
+        """Evaluate one node from values of its operands
+
+        Args:
+            node (LazyInteger): Node with evaluated operands
+
+        Returns:
+            BigInteger: Value of the node
+        """
+        operation = node._operation
+        if operation in _DIVISIONS:
+            return self._divide(node)
+        values = [self._take(operand) for operand in node._operands]
+        if operation in _INPLACE_OPERATIONS:
+            (left, left_owned), (right, right_owned) = values
+            if left_owned:
+                return _INPLACE_OPERATIONS[operation](left, right)
+            if operation == "add" and right_owned:
+                return operator.iadd(right, left)
+        return _OPERATIONS[operation](*(value for value, _ in values))
+
+    def _divide(self, node: LazyInteger) -> BigInteger:
+        """Evaluate quotient or remainder sharing divisions of same operands
+
+        Args:
+            node (LazyInteger): Division node with evaluated operands
+
+        Returns:
+            BigInteger: Value of the node
+        """
+        dividend, divisor = node._operands
+        if node._operation == "mod" and id(dividend) in self._fused:
+            return self._mulmod(dividend, divisor)
+        key = (_key(dividend), _key(divisor))
+        first, _ = self._take(dividend)
+        second, _ = self._take(divisor)
+        division = self._divisions.get(key)
+        if division is None:
+            division = self._divisions[key] = divmod(first, second)
+        quotient, remainder = division
+        if node._operation == "floordiv":
+            return quotient.copy()
+        if node._operation == "rem" or remainder.positive:
+            return remainder.copy()
+        return remainder + second.abs()
+
+    def _mulmod(self, product: LazyInteger, modulus: LazyInteger) -> BigInteger:
+        """Evaluate product reduced by modulus
+
+        Moduli reducing more than one product of the graph get a Barrett
+        context, so each product is reduced with two multiplications
+        instead of a division.
+
+        Args:
+            product (LazyInteger): Fused multiplication node
+            modulus (LazyInteger): Modulus node
+
+        Returns:
+            BigInteger: Product modulo the modulus, in range [0, |modulus|)
+        """
+        first, _ = self._take(product._operands[0])
+        second, _ = self._take(product._operands[1])
+        divisor, _ = self._take(modulus)
+        if self._moduli[_key(modulus)] < 2 or not divisor._limbs:
+            return first * second % divisor
+        context = self._contexts.get(_key(modulus))
+        if context is None:
+            context = self._contexts[_key(modulus)] = BarrettContext(divisor)
+        result = context.mul(context.to_residue(first), context.to_residue(second))
+        if result.is_binary and not (first.is_binary and second.is_binary):
+            result = result.from_bin()
+        return result
@@ -0,0 +1,115 @@
+"""Aggregate memory accounting of big integers.
+
+MemoryTracker follows big integers through weak references, so tracking
+never keeps a number alive, and sums their sizeof reports. Storage shared
+by several numbers, such as limbs of copies or a loaded buffer that limbs
+are views of, is counted once.
+"""
+import weakref
+
+from big_integer import BigInteger, FrozenBigInteger, _limbs_storage
+
+# Fields of sizeof reports summed over numbers whose storage is distinct.
+_STORAGE_FIELDS = ("allocated", "used", "spare")
+
+
+class MemoryTracker:
+    """Weak collection of big integers with totals of their memory"""
+
+    def __init__(self) -> None:
+        # Weak references to tracked numbers keyed by identity.
+        self._numbers = {}
+
+    def track(self, *numbers: BigInteger) -> None:
+        """Start tracking numbers
+
+        Args:
+            *numbers (BigInteger): Numbers to follow until they are collected
+        """
+        for number in numbers:
+            key = id(number)
+            self._numbers[key] = weakref.ref(
+                number, lambda _, key=key: self._numbers.pop(key, None)
+            )
+
+    def untrack(self, number: BigInteger) -> None:
+        """Stop tracking number
+
+        Args:
+            number (BigInteger): Tracked number
+        """
+        self._numbers.pop(id(number), None)
+
+    def numbers(self) -> list:
+        """Return tracked numbers still alive
+
+        Returns:
+            list: Tracked big integers
+        """
+        numbers = (reference() for reference in list(self._numbers.values()))
+        return [number for number in numbers if number is not None]
+
+    def __len__(self) -> int:
+        return len(self.numbers())
+
+    def report(self) -> dict:
+        """Sum memory of tracked numbers
+
+        Returns:
+            dict: Count of numbers, bytes of objects, allocated, used and
+                spare bytes of distinct limb storage, bytes of cached
+                conversions, count of numbers with shared limbs, leading
+                zero digits and total bytes
+        """
+        totals = {
+            "count": 0,
+            "object": 0,
+            "allocated": 0,
+            "used": 0,
+            "spare": 0,
+            "cached": 0,
+            "shared": 0,
+            "leading_zeros": 0,
+        }
+        seen = set()
+        for number in self.numbers():
+            sizes = number.sizeof()
+            totals["count"] += 1
+            totals["object"] += sizes["object"]
+            totals["cached"] += sizes["cached"]
+            totals["shared"] += sizes["shared"]
+            totals["leading_zeros"] += sizes["leading_zeros"]
+            storage, _ = _limbs_storage(number._limbs)
+            if id(storage) not in seen:
+                seen.add(id(storage))
+                for field in _STORAGE_FIELDS:
+                    totals[field] += sizes[field]
+        totals["total"] = totals["object"] + totals["allocated"] + totals["cached"]
+        return totals
+
+    def largest(self, count: int = 10) -> list:
+        """Return numbers holding the most memory
+
+        Args:
+            count (int, optional): Number of entries. Defaults to 10.
+
+        Returns:
+            list: Pairs of bytes held and number, largest first
+        """
+        sizes = [(number.__sizeof__(), number) for number in self.numbers()]
+        sizes.sort(key=lambda entry: entry[0], reverse=True)
+        return sizes[:count]
+
+    def compact(self) -> int:
+        """Compact every tracked mutable number
+
+        Frozen numbers cannot change and are left as they are.
+
+        Returns:
+            int: Bytes released, as seen by the report
+        """
+        before = self.report()["total"]
+        for number in self.numbers():
+            if not isinstance(number, FrozenBigInteger):
+                number.compact()
+        return before - self.report()["total"]
@@ -0,0 +1,477 @@
+"""Parallel multiplication, division and radix conversion of huge big integers.
+
+ParallelArithmetic splits large operations into independent pieces and runs
+them on a process pool. Multiplication advances the Karatsuba step
+generators of big_integer through their top levels and runs the products
+they ask for as separate tasks. Radix conversion converts leaves of the
+split of big_integer separately, and division runs Newton division with
+both of them. Limbs travel to and
+from workers through shared memory blocks instead of being pickled, and
+operands below the size cutoff are handled in-process.
+"""
+import math
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+
+from big_integer import (
+    BINARY_BASE,
+    DECIMAL_BASE,
+    KARATSUBA_THRESHOLD,
+    LIMB_TYPECODE,
+    BigInteger,
+    _coerce,
+    _limbs_add,
+    _limbs_cmp,
+    _limbs_divmod,
+    _limbs_divmod_newton,
+    _limbs_drive,
+    _limbs_karatsuba_steps,
+    _limbs_mul,
+    _limbs_normalize,
+    _limbs_radix_join_steps,
+    _limbs_radix_split,
+    _limbs_sub,
+    _limbs_to_radix,
+)
+
+# Size in limbs of the shorter operand below which work stays in-process.
+PARALLEL_THRESHOLD = 2048
+
+LIMB_SIZE = array(LIMB_TYPECODE).itemsize
+
+
+def _read_limbs(block: shared_memory.SharedMemory, start: int, size: int) -> array:
+    """Copy limbs out of a shared memory block
+
+    Args:
+        block (SharedMemory): Attached block
+        start (int): Position of the first limb
+        size (int): Number of limbs
+
+    Returns:
+        array: Limbs read from the block
+    """
+    limbs = array(LIMB_TYPECODE)
+    with block.buf[start * LIMB_SIZE:(start + size) * LIMB_SIZE] as chunk:
+        limbs.frombytes(chunk)
+    return limbs
+
+
+def _write_limbs(block: shared_memory.SharedMemory, start: int, limbs: array) -> None:
+    """Copy limbs into a shared memory block
+
+    Args:
+        block (SharedMemory): Attached block
+        start (int): Position of the first limb
+        limbs (array): Limbs to write
+    """
+    with memoryview(limbs).cast("B") as chunk:
+        block.buf[start * LIMB_SIZE:start * LIMB_SIZE + len(chunk)] = chunk
+
+
+def _share_limbs(arrays: list) -> tuple:
+    """Pack limb arrays into one new shared memory block
+
+    An array passed several times is written to the block once.
+
+    Args:
+        arrays (list): Limb arrays
+
+    Returns:
+        tuple: Block and (start, size) span of every array in it
+    """
+    starts = {}
+    total = 0
+    for limbs in arrays:
+        if id(limbs) not in starts:
+            starts[id(limbs)] = total
+            total += len(limbs)
+    block = shared_memory.SharedMemory(create=True, size=max(total, 1) * LIMB_SIZE)
+    written = set()
+    for limbs in arrays:
+        if id(limbs) not in written:
+            written.add(id(limbs))
+            _write_limbs(block, starts[id(limbs)], limbs)
+    return block, [(starts[id(limbs)], len(limbs)) for limbs in arrays]
+
+
+def _mul_task(
+    input_name: str,
+    first_span: tuple,
+    second_span: tuple,
+    output_name: str,
+    output_start: int,
+    base: int,
+) -> int:
+    """Multiply two magnitudes from shared memory in a worker process
+
+    Args:
+        input_name (str): Name of the block holding operands
+        first_span (tuple): Start and size of the first operand
+        second_span (tuple): Start and size of the second operand
+        output_name (str): Name of the block receiving the product
+        output_start (int): Position of the product in the output block
+        base (int): Limb base
+
+    Returns:
+        int: Number of limbs of the product
+    """
+    inputs = shared_memory.SharedMemory(name=input_name)
+    try:
+        first = _read_limbs(inputs, *first_span)
+        second = _read_limbs(inputs, *second_span)
+    finally:
+        inputs.close()
+    product = _limbs_mul(first, second, base)
+    output = shared_memory.SharedMemory(name=output_name)
+    try:
+        _write_limbs(output, output_start, product)
+    finally:
+        output.close()
+    return len(product)
+
+
+def _radix_task(
+    input_name: str, span: tuple, output_name: str, output_start: int, binary: bool
+) -> int:
+    """Convert magnitude from shared memory to another radix in a worker
+
+    Args:
+        input_name (str): Name of the block holding the magnitude
+        span (tuple): Start and size of the magnitude
+        output_name (str): Name of the block receiving the result
+        output_start (int): Position of the result in the output block
+        binary (bool): Whether target radix is binary
+
+    Returns:
+        int: Number of limbs of the result
+    """
+    inputs = shared_memory.SharedMemory(name=input_name)
+    try:
+        limbs = _limbs_normalize(_read_limbs(inputs, *span))
+    finally:
+        inputs.close()
+    result = _limbs_to_radix(limbs, binary)
+    output = shared_memory.SharedMemory(name=output_name)
+    try:
+        _write_limbs(output, output_start, result)
+    finally:
+        output.close()
+    return len(result)
+
+
+class ParallelArithmetic:
+    """Process pool running arithmetic on huge big integers
+
+    Use it as a context manager, or call shutdown when done. Results are
+    equal to those of the BigInteger operators.
+    """
+
+    def __init__(
+        self, max_workers: int = None, threshold: int = PARALLEL_THRESHOLD
+    ) -> None:
+        """Prepare process pool
+
+        Args:
+            max_workers (int, optional): Number of worker processes.
+                Defaults to the number of processors.
+            threshold (int, optional): Size in limbs below which operations
+                run in-process. Defaults to PARALLEL_THRESHOLD.
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.threshold = threshold
+        self._executor = ProcessPoolExecutor(self.max_workers)
+
+    def __enter__(self) -> "ParallelArithmetic":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """Stop worker processes"""
+        self._executor.shutdown()
+
+    def _run(
+        self, task: object, operands: list, capacities: list, option: object
+    ) -> list:
+        """Run one task per operand group on the pool through shared memory
+
+        Args:
+            task (callable): _mul_task or _radix_task
+            operands (list): Tuples of limb arrays, one tuple per task
+            capacities (list): Upper bound of result size of every task
+            option (int | bool): Last argument of the task
+
+        Returns:
+            list: Result limbs of every task
+        """
+        inputs, spans = _share_limbs([limbs for group in operands for limbs in group])
+        output = shared_memory.SharedMemory(
+            create=True, size=max(sum(capacities), 1) * LIMB_SIZE
+        )
+        futures = []
+        try:
+            spans = iter(spans)
+            output_start = 0
+            for group, capacity in zip(operands, capacities):
+                futures.append(
+                    self._executor.submit(
+                        task,
+                        inputs.name,
+                        *[next(spans) for _ in group],
+                        output.name,
+                        output_start,
+                        option,
+                    )
+                )
+                output_start += capacity
+            results = []
+            output_start = 0
+            for future, capacity in zip(futures, capacities):
+                results.append(_read_limbs(output, output_start, future.result()))
+                output_start += capacity
+            return results
+        finally:
+            # After a failure other tasks may still be attached to the
+            # blocks, so pending ones are cancelled and running ones finish
+            # before the blocks go away.
+            for future in futures:
+                future.cancel()
+            wait(futures)
+            for block in (inputs, output):
+                block.close()
+                block.unlink()
+
+    def _plan_mul(
+        self, first: array, second: array, base: int, depth: int, leaves: list
+    ) -> object:
+        """Split product into independent products for the pool
+
+        Karatsuba steps are advanced to the products they ask for, which
+        are split further or become leaves.
+
+        Args:
+            first (array): Limbs of the first magnitude
+            second (array): Limbs of the second magnitude
+            base (int): Limb base
+            depth (int): Remaining Karatsuba levels to split
+            leaves (list): Operand pairs of the products, extended in place
+
+        Returns:
+            object: Index of a product in leaves, or the suspended steps and
+                plans of the products they ask for
+        """
+        if depth == 0 or min(len(first), len(second)) < 2 * KARATSUBA_THRESHOLD:
+            leaves.append((first, second))
+            return len(leaves) - 1
+        steps = _limbs_karatsuba_steps(first, second, base)
+        pairs = next(steps)
+        # Slices of unbalanced operands may already give every worker a task.
+        depth = 0 if len(pairs) >= self.max_workers else depth - 1
+        return steps, [self._plan_mul(a, b, base, depth, leaves) for a, b in pairs]
+
+    def _join_mul(self, plan: object, results: list) -> array:
+        """Join products of the pool following a plan of _plan_mul
+
+        Args:
+            plan (object): Plan returned by _plan_mul
+            results (list): Limbs of the products in order of leaves
+
+        Raises:
+            RuntimeError: Steps ask for products more than once
+
+        Returns:
+            array: Normalized limbs of the product
+        """
+        if isinstance(plan, int):
+            return results[plan]
+        steps, parts = plan
+        try:
+            steps.send([self._join_mul(part, results) for part in parts])
+        except StopIteration as stop:
+            return stop.value
+        raise RuntimeError("Karatsuba steps ask for products once")
+
+    def _mul_limbs(self, first: array, second: array, base: int) -> array:
+        """Multiply magnitudes on the pool when they are large enough
+
+        Args:
+            first (array): Limbs of the first magnitude
+            second (array): Limbs of the second magnitude
+            base (int): Limb base
+
+        Returns:
+            array: Normalized limbs of the product
+        """
+        if min(len(first), len(second)) < self.threshold or self.max_workers < 2:
+            return _limbs_mul(first, second, base)
+        depth = math.ceil(math.log(self.max_workers, 3))
+        leaves = []
+        plan = self._plan_mul(first, second, base, depth, leaves)
+        results = self._run(
+            _mul_task, leaves, [len(a) + len(b) for a, b in leaves], base
+        )
+        return self._join_mul(plan, results)
+
+    def _plan_radix(self, limbs: array, depth: int, leaves: list) -> object:
+        """Split radix conversion into independent conversions for the pool
+
+        Args:
+            limbs (array): Normalized limbs in source radix
+            depth (int): Remaining levels to split
+            leaves (list): Magnitudes to convert, extended in place
+
+        Returns:
+            object: Index of a magnitude in leaves, or a tuple of the split
+                size and plans of the high and the low part
+        """
+        if depth == 0 or len(limbs) <= self.threshold:
+            leaves.append((limbs,))
+            return len(leaves) - 1
+        count, high, low = _limbs_radix_split(limbs)
+        return (
+            count,
+            self._plan_radix(high, depth - 1, leaves),
+            self._plan_radix(low, depth - 1, leaves),
+        )
+
+    def _join_radix(self, plan: object, results: list, binary: bool) -> array:
+        """Join converted parts following a plan of _plan_radix
+
+        Args:
+            plan (object): Plan returned by _plan_radix
+            results (list): Converted limbs in order of leaves
+            binary (bool): Whether target radix is binary
+
+        Returns:
+            array: Normalized limbs in target radix
+        """
+        if isinstance(plan, int):
+            return results[plan]
+        base = BINARY_BASE if binary else DECIMAL_BASE
+        count, high, low = plan
+        steps = _limbs_radix_join_steps(
+            self._join_radix(high, results, binary),
+            self._join_radix(low, results, binary),
+            count,
+            binary,
+        )
+        return _limbs_drive(steps, self._mul_limbs, base)
+
+    def _to_radix(self, limbs: array, binary: bool) -> array:
+        """Convert magnitude between decimal and binary limbs on the pool
+
+        Args:
+            limbs (array): Normalized limbs in source radix
+            binary (bool): Whether target radix is binary
+
+        Returns:
+            array: Normalized limbs in target radix
+        """
+        if len(limbs) < 2 * self.threshold or self.max_workers < 2:
+            return _limbs_to_radix(limbs, binary)
+        leaves = []
+        plan = self._plan_radix(limbs, math.ceil(math.log2(self.max_workers)), leaves)
+        # A decimal limb holds 29.9 bits and a binary limb 9.6 decimal digits.
+        ratio = 0.94 if binary else 1.08
+        capacities = [int(len(limbs) * ratio) + 2 for (limbs,) in leaves]
+        results = self._run(_radix_task, leaves, capacities, binary)
+        return self._join_radix(plan, results, binary)
+
+    def mul(self, first: object, second: object) -> BigInteger:
+        """Multiply two integers
+
+        Args:
+            first (BigInteger&quot; | str | int): First factor
+            second (BigInteger&quot; | str | int): Second factor
+
+        Returns:
+            BigInteger: Product of two integers
+        """
+        first, second = _coerce(first), _coerce(second)
+        first_limbs, second_limbs, base, binary = first._common_limbs(second)
+        return BigInteger._from_limbs(
+            self._mul_limbs(first_limbs, second_limbs, base),
+            first.positive == second.positive,
+            binary,
+        )
+
+    def divmod(self, first: object, second: object) -> tuple:
+        """Floor quotient and remainder of two integers
+
+        Args:
+            first (BigInteger&quot; | str | int): Dividend
+            second (BigInteger&quot; | str | int): Divisor
+
+        Raises:
+            ZeroDivisionError: Division by zero
+
+        Returns:
+            tuple: Floor quotient and remainder with the sign of the divisor
+        """
+        first, second = _coerce(first), _coerce(second)
+        dividend, divisor, base, binary = first._common_limbs(second)
+        if not divisor:
+            raise ZeroDivisionError
+        if len(divisor) < self.threshold or _limbs_cmp(dividend, divisor) < 0:
+            quotient, remainder = _limbs_divmod(dividend, divisor, base)
+        else:
+            quotient, remainder = _limbs_divmod_newton(
+                dividend, divisor, base, self._mul_limbs
+            )
+        if first.positive != second.positive and remainder:
+            quotient = _limbs_add(quotient, array(LIMB_TYPECODE, [1]), base)
+            remainder = _limbs_sub(divisor, remainder, base)
+        return (
+            BigInteger._from_limbs(quotient, first.positive == second.positive, binary),
+            BigInteger._from_limbs(remainder, second.positive, binary),
+        )
+
+    def floordiv(self, first: object, second: object) -> BigInteger:
+        """Floor quotient of two integers
+
+        Args:
+            first (BigInteger&quot; | str | int): Dividend
+            second (BigInteger&quot; | str | int): Divisor
+
+        Raises:
+            ZeroDivisionError: Division by zero
+
+        Returns:
+            BigInteger: Floor quotient
+        """
+        return self.divmod(first, second)[0]
+
+    def to_bin(self, value: object) -> BigInteger:
+        """Convert integer to binary big integer
+
+        Args:
+            value (BigInteger&quot; | str | int): Integer
+
+        Returns:
+            BigInteger: Binary big integer
+        """
+        value = _coerce(value)
+        if value.is_binary:
+            return value
+        return BigInteger._from_limbs(
+            self._to_radix(value._limbs, True), value.positive, binary=True
+        )
+
+    def from_bin(self, value: object) -> BigInteger:
+        """Convert binary big integer to decimal big integer
+
+        Args:
+            value (BigInteger): Binary big integer
+
+        Returns:
+            BigInteger: Decimal big integer
+        """
+        if not value.is_binary:
+            return value
+        return BigInteger._from_limbs(
+            self._to_radix(value._limbs, False), value.positive
+        )
@@ -0,0 +1,292 @@
+"""Opt-in profiling of BigInteger operations.
+
+Profiler replaces the profiled methods of BigInteger with recording
+wrappers only while it is enabled, and puts the original methods back when
+it is disabled, so code runs untouched when nothing is profiled. Calls are
+grouped per operation into power of two buckets of operand size in decimal
+digits, which gives histograms of calls, time and memory, and a fitted
+exponent of time against size that shows which operations run in quadratic
+or worse regimes.
+"""
+import functools
+import json
+import math
+import time
+import tracemalloc
+
+from big_integer import BigInteger, FrozenBigInteger
+
+DEFAULT_OPERATIONS = (
+    "__add__",
+    "__sub__",
+    "__mul__",
+    "__floordiv__",
+    "__mod__",
+    "__divmod__",
+    "__pow__",
+    "__or__",
+    "__and__",
+    "__xor__",
+    "__invert__",
+    "__lshift__",
+    "__rshift__",
+    "__iadd__",
+    "__isub__",
+    "__imul__",
+    "__ilshift__",
+    "__irshift__",
+    "_compare",
+    "_abs_lt",
+    "to_bin",
+    "from_bin",
+    "__str__",
+)
+# Fitted exponents of time against operand size from which an operation is
+# reported as superlinear and as quadratic or worse.
+SUPERLINEAR_EXPONENT = 1.3
+QUADRATIC_EXPONENT = 1.8
+
+_LOG10_2 = math.log10(2)
+
+# Profiler currently patched into BigInteger.
+_active = None
+
+
+def _operand_digits(value: object) -> int:
+    """Estimate size of an operand in decimal digits
+
+    Args:
+        value (object): Argument of a profiled call
+
+    Returns:
+        int: Number of decimal digits, 0 for arguments that are not numbers
+    """
+    if isinstance(value, BigInteger):
+        if value.is_binary:
+            return math.ceil(value._length * _LOG10_2)
+        return value._length
+    if isinstance(value, int):
+        return math.ceil(abs(value).bit_length() * _LOG10_2)
+    return 0
+
+
+def fit_exponent(sizes: list, times: list) -> float:
+    """Fit exponent of power law time = c * size**exponent
+
+    Args:
+        sizes (list): Positive operand sizes
+        times (list): Positive mean times
+
+    Returns:
+        float: Least squares slope of log time over log size
+    """
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(value) for value in times]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+
+
+class Profiler:
+    """Recorder of calls, operand sizes, time and memory of operations"""
+
+    def __init__(
+        self, operations: tuple = DEFAULT_OPERATIONS, trace_memory: bool = False
+    ) -> None:
+        """Prepare empty profile
+
+        Args:
+            operations (tuple, optional): Names of BigInteger methods to
+                profile. Defaults to DEFAULT_OPERATIONS.
+            trace_memory (bool, optional): Whether to record peak memory
+                allocated by calls with tracemalloc. Defaults to False.
+        """
+        self.operations = tuple(operations)
+        self.trace_memory = trace_memory
+        # (operation, size bucket) -> [calls, nanoseconds, max ns, peak bytes]
+        self._buckets = {}
+        self._originals = []
+        self._depth = 0
+        self._started_tracing = False
+
+    def __enter__(self) -> "Profiler":
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.disable()
+
+    def enable(self) -> None:
+        """Patch profiled methods of BigInteger with recording wrappers
+
+        Raises:
+            RuntimeError: Another profiler is enabled
+        """
+        global _active
+        if _active is not None:
+            raise RuntimeError("another profiler is already enabled")
+        _active = self
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        for cls in (BigInteger, FrozenBigInteger):
+            for name in self.operations:
+                if name in cls.__dict__:
+                    original = cls.__dict__[name]
+                    self._originals.append((cls, name, original))
+                    setattr(cls, name, self._wrap(name, original))
+
+    def disable(self) -> None:
+        """Put original methods of BigInteger back"""
+        global _active
+        if _active is not self:
+            return
+        for cls, name, original in reversed(self._originals):
+            setattr(cls, name, original)
+        self._originals = []
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        _active = None
+
+    def reset(self) -> None:
+        """Drop recorded calls"""
+        self._buckets = {}
+
+    def _wrap(self, name: str, function: object) -> object:
+        """Build recording wrapper of a method
+
+        Args:
+            name (str): Name of the operation
+            function (callable): Original method
+
+        Returns:
+            callable: Method recording its calls into this profiler
+        """
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            digits = max(map(_operand_digits, args), default=0)
+            # Memory is measured for outermost calls only, since measuring
+            # a nested call resets the peak of the enclosing one.
+            measure = self.trace_memory and not self._depth
+            if measure:
+                tracemalloc.reset_peak()
+                before = tracemalloc.get_traced_memory()[0]
+            self._depth += 1
+            start = time.perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter_ns() - start
+                self._depth -= 1
+                memory = tracemalloc.get_traced_memory()[1] - before if measure else 0
+                self._record(name, digits, elapsed, memory)
+
+        return wrapper
+
+    def _record(self, name: str, digits: int, elapsed: int, memory: int) -> None:
+        """Add one call to its histogram bucket
+
+        Args:
+            name (str): Name of the operation
+            digits (int): Size of the largest operand in decimal digits
+            elapsed (int): Wall time of the call in nanoseconds
+            memory (int): Peak memory allocated by the call in bytes
+        """
+        bucket = 1 << (digits.bit_length() - 1) if digits else 0
+        stats = self._buckets.get((name, bucket))
+        if stats is None:
+            stats = self._buckets[(name, bucket)] = [0, 0, 0, 0]
+        stats[0] += 1
+        stats[1] += elapsed
+        stats[2] = max(stats[2], elapsed)
+        stats[3] = max(stats[3], memory)
+
+    def histograms(self) -> dict:
+        """Return recorded calls grouped by operation and operand size
+
+        Returns:
+            dict: Mapping of operation name to list of buckets, each with
+                lower bound of operand digits, calls, total, mean and
+                maximum seconds and peak memory in bytes
+        """
+        result = {}
+        for (name, bucket), (calls, total, longest, memory) in sorted(
+            self._buckets.items()
+        ):
+            result.setdefault(name, []).append(
+                {
+                    "digits": bucket,
+                    "calls": calls,
+                    "total_seconds": total / 1e9,
+                    "mean_seconds": total / calls / 1e9,
+                    "max_seconds": longest / 1e9,
+                    "peak_memory": memory,
+                }
+            )
+        return result
+
+    def export(self, file: object) -> None:
+        """Write histograms as JSON
+
+        Args:
+            file (io.TextIOBase): File-like object with write method
+        """
+        json.dump(self.histograms(), file, indent=2)
+
+    def exponents(self) -> dict:
+        """Fit exponent of mean time against operand size per operation
+
+        Returns:
+            dict: Mapping of operation name to exponent, for operations
+                recorded with at least three operand size buckets
+        """
+        result = {}
+        for name, buckets in self.histograms().items():
+            points = [
+                (bucket["digits"], bucket["mean_seconds"])
+                for bucket in buckets
+                if bucket["digits"] and bucket["mean_seconds"] > 0
+            ]
+            if len(points) >= 3:
+                result[name] = fit_exponent(*zip(*points))
+        return result
+
+    def report(self) -> str:
+        """Format table of operations with their complexity regime
+
+        Operations with a fitted exponent of QUADRATIC_EXPONENT or more are
+        flagged, they dominate run time as operands grow.
+
+        Returns:
+            str: Report, slowest operations first
+        """
+        exponents = self.exponents()
+        rows = []
+        for name, buckets in self.histograms().items():
+            calls = sum(bucket["calls"] for bucket in buckets)
+            total = sum(bucket["total_seconds"] for bucket in buckets)
+            largest = max(bucket["digits"] for bucket in buckets)
+            exponent = exponents.get(name)
+            if exponent is None:
+                regime = "unknown"
+            elif exponent >= QUADRATIC_EXPONENT:
+                regime = "QUADRATIC OR WORSE"
+            elif exponent >= SUPERLINEAR_EXPONENT:
+                regime = "superlinear"
+            else:
+                regime = "linear"
+            rows.append((total, name, calls, largest, exponent, regime))
+        lines = [
+            f"{'operation':>14} {'calls':>9} {'seconds':>10} {'max digits':>11} "
+            f"{'exponent':>9}  regime"
+        ]
+        for total, name, calls, largest, exponent, regime in sorted(rows, reverse=True):
+            shown = "-" if exponent is None else f"{exponent:.2f}"
+            lines.append(
+                f"{name:>14} {calls:>9} {total:>10.4f} {largest:>11} "
+                f"{shown:>9}  {regime}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,226 @@
+"""Bulk reductions over iterables of big integers.
+
+bigsum, bigprod and bigdot read their input once, item by item, so
+generators are never materialized. Sums and dot products add limbs into
+one buffer of unbounded column sums per radix and sign and propagate
+carries once at the end. Products are multiplied along a balanced tree,
+so fast multiplication sees operands of similar size.
+
+Results follow the radix rule of BigInteger operators: they are binary
+only when every item is a binary big integer, ints count as decimal.
+"""
+import itertools
+from array import array
+
+from big_integer import (
+    DECIMAL_BASE,
+    BINARY_BASE,
+    KARATSUBA_THRESHOLD,
+    LIMB_TYPECODE,
+    BigInteger,
+    _coerce,
+    _limbs_add,
+    _limbs_add_into,
+    _limbs_carry,
+    _limbs_cmp,
+    _limbs_from_int,
+    _limbs_mul,
+    _limbs_sub,
+    _limbs_to_radix,
+)
+
+# Marks the end of the shorter iterable of a dot product.
+_MISSING = object()
+
+
+class _Accumulator:
+    """Signed sum of terms kept as column sums without carrying"""
+
+    __slots__ = ("_columns", "_native", "_decimal")
+
+    def __init__(self) -> None:
+        # Column sums keyed by binary flag and sign of the terms, the sum of
+        # int terms and whether any term forces a decimal result.
+        self._columns = {}
+        self._native = 0
+        self._decimal = False
+
+    def _target(self, binary: bool, positive: bool, size: int) -> list:
+        """Return column sums for terms of a radix and sign
+
+        Args:
+            binary (bool): Whether terms are binary
+            positive (bool): Sign of terms
+            size (int): Number of columns the next term needs
+
+        Returns:
+            list: Column sums, extended to at least size columns
+        """
+        self._decimal = self._decimal or not binary
+        columns = self._columns.setdefault((binary, positive), [])
+        if len(columns) < size:
+            columns.extend([0] * (size - len(columns)))
+        return columns
+
+    def add(self, value: object) -> None:
+        """Add integer to the sum
+
+        Args:
+            value (BigInteger&quot; | str | int): Term
+        """
+        if isinstance(value, int):
+            self._native += value
+            self._decimal = True
+            return
+        value = _coerce(value)
+        limbs = value._limbs
+        columns = self._target(value._binary, value.positive, len(limbs))
+        _limbs_add_into(columns, limbs, 0)
+
+    def add_product(self, first: object, second: object) -> None:
+        """Add product of two integers to the sum
+
+        Short factors are multiplied limb by limb straight into the column
+        sums, longer ones are multiplied first.
+
+        Args:
+            first (BigInteger&quot; | str | int): First factor
+            second (BigInteger&quot; | str | int): Second factor
+        """
+        if isinstance(first, int) and isinstance(second, int):
+            self._native += first * second
+            self._decimal = True
+            return
+        first, second = _coerce(first), _coerce(second)
+        first_limbs, second_limbs, base, binary = first._common_limbs(second)
+        positive = first.positive == second.positive
+        size = len(first_limbs) + len(second_limbs)
+        columns = self._target(binary, positive, size)
+        if len(first_limbs) < len(second_limbs):
+            first_limbs, second_limbs = second_limbs, first_limbs
+        if len(second_limbs) >= KARATSUBA_THRESHOLD:
+            _limbs_add_into(columns, _limbs_mul(first_limbs, second_limbs, base), 0)
+            return
+        first_limbs = list(first_limbs)
+        for i, limb in enumerate(second_limbs):
+            if limb:
+                for j, other in enumerate(first_limbs, i):
+                    columns[j] += limb * other
+
+    def result(self) -> BigInteger:
+        """Carry column sums and combine them into one number
+
+        Returns:
+            BigInteger: Sum of all terms
+        """
+        binary = bool(self._columns) and not self._decimal
+        base = BINARY_BASE if binary else DECIMAL_BASE
+        totals = {True: array(LIMB_TYPECODE), False: array(LIMB_TYPECODE)}
+        for (term_binary, positive), columns in self._columns.items():
+            term_base = BINARY_BASE if term_binary else DECIMAL_BASE
+            limbs = _limbs_carry(columns, term_base)
+            if term_binary != binary:
+                limbs = _limbs_to_radix(limbs, binary)
+            totals[positive] = _limbs_add(totals[positive], limbs, base)
+        if self._native:
+            positive = self._native > 0
+            limbs = _limbs_from_int(abs(self._native), False)
+            totals[positive] = _limbs_add(totals[positive], limbs, base)
+        if _limbs_cmp(totals[True], totals[False]) >= 0:
+            limbs = _limbs_sub(totals[True], totals[False], base)
+            return BigInteger._from_limbs(limbs, True, binary)
+        limbs = _limbs_sub(totals[False], totals[True], base)
+        return BigInteger._from_limbs(limbs, False, binary)
+
+
+def _push(stack: list, value: object, size: object) -> None:
+    """Add factor to a balanced product tree
+
+    Factors on the stack shrink from the bottom up. A new factor is
+    multiplied with the ones below it while they are not longer, so equal
+    factors pair up like a binary counter.
+
+    Args:
+        stack (list): Partial products of the tree
+        value (BigInteger | int): Factor
+        size (callable): Size of a partial product
+    """
+    stack.append(value)
+    while len(stack) > 1 and size(stack[-2]) <= size(stack[-1]):
+        last = stack.pop()
+        stack[-1] = stack[-1] * last
+
+
+def _collapse(stack: list) -> object:
+    """Multiply remaining partial products, shortest first
+
+    Args:
+        stack (list): Non-empty partial products of the tree
+
+    Returns:
+        BigInteger | int: Product of the tree
+    """
+    result = stack.pop()
+    while stack:
+        result = stack.pop() * result
+    return result
+
+
+def bigsum(values: object) -> BigInteger:
+    """Sum of integers
+
+    Args:
+        values (iterable): BigIntegers, digit strings or ints
+
+    Returns:
+        BigInteger: Sum, zero for no values
+    """
+    accumulator = _Accumulator()
+    for value in values:
+        accumulator.add(value)
+    return accumulator.result()
+
+
+def bigprod(values: object) -> BigInteger:
+    """Product of integers
+
+    Ints are multiplied natively along a tree of their own and join the
+    product of big integers once at the end.
+
+    Args:
+        values (iterable): BigIntegers, digit strings or ints
+
+    Returns:
+        BigInteger: Product, one for no values
+    """
+    native, numbers = [], []
+    for value in values:
+        if isinstance(value, int):
+            _push(native, value, int.bit_length)
+        else:
+            _push(numbers, _coerce(value), lambda number: len(number._limbs))
+    if not numbers:
+        return BigInteger(_collapse(native) if native else 1)
+    result = _collapse(numbers)
+    return result * _collapse(native) if native else result.copy()
+
+
+def bigdot(first: object, second: object) -> BigInteger:
+    """Dot product of two sequences of integers
+
+    Args:
+        first (iterable): BigIntegers, digit strings or ints
+        second (iterable): As many BigIntegers, digit strings or ints
+
+    Raises:
+        ValueError: Iterables of different lengths
+
+    Returns:
+        BigInteger: Sum of products of items at the same positions
+    """
+    accumulator = _Accumulator()
+    for left, right in itertools.zip_longest(first, second, fillvalue=_MISSING):
+        if left is _MISSING or right is _MISSING:
+            raise ValueError("iterables of different lengths")
+        accumulator.add_product(left, right)
+    return accumulator.result()
@@ -1,5 +1,11 @@
 """Unittest module for big_integer module."""
+import copy
+import io
+import math
+import sys
 import unittest
+import weakref
+import big_integer
 from big_integer import BigInteger
 
 
@@ -53,6 +59,15 @@ class TestBigInteger(unittest.TestCase):
         self.minus_ten._remove_digit()
         self.assertEqual(str(self.minus_ten), "-1")
 
+    def test_limbs(self):
+        nines = BigInteger("999999999999999999")
+        self.assertEqual(str(nines + self.one), "1000000000000000000")
+        self.assertEqual(str(self.one - nines), "-999999999999999998")
+        self.assertEqual(str(self.large + self.large), "246913578024691357802469135780")
+        self.zeros._add_digit(7, False)
+        self.assertEqual(str(self.zeros), "7000001")
+        self.assertRaises(ValueError, lambda: BigInteger("12a"))
+
     def test_digits(self):
         self.assertEqual(self.empty._digits(), [])
         self.assertEqual(self.zero._digits(), [0])
@@ -61,10 +76,123 @@ class TestBigInteger(unittest.TestCase):
         self.assertEqual(self.minus_one._digits(), [1])
         self.assertEqual(self.minus_ten._digits(), [1, 0])
 
+    def test_to_file(self):
+        stream = io.StringIO()
+        (self.large * self.minus_ten).to_file(stream, chunk_limbs=1)
+        self.assertEqual(stream.getvalue(), "-1234567890123456789012345678900")
+        stream = io.StringIO()
+        self.zeros.to_file(stream)
+        self.assertEqual(stream.getvalue(), "000001")
+
+    def test_iter_chunks(self):
+        value = -int("98765432109876543210" * 60)
+        number = BigInteger(value)
+        for binary, from_binary, expected in (
+            (None, False, str(value)),
+            (True, None, format(value, "b")),
+        ):
+            chunks = list(number.iter_chunks(binary, chunk_limbs=3))
+            self.assertGreater(len(chunks), 2)
+            self.assertEqual("".join(chunks), expected)
+            reverse = number.to_bin().iter_chunks(from_binary, reverse=True)
+            self.assertEqual("".join(reverse), expected[::-1])
+        self.assertEqual(list(self.minus_ten.iter_chunks(encoded=True)), [b"-", b"10"])
+        self.assertEqual("".join(self.zeros.iter_chunks(reverse=True)), "100000")
+        self.assertEqual("".join(self.zero.iter_chunks(True)), "0")
+
+    def test_iter_digits(self):
+        self.assertEqual(list(self.zeros.iter_digits()), [0, 0, 0, 0, 0, 1])
+        self.assertEqual(list(self.minus_ten.iter_digits(reverse=True)), [0, 1])
+        self.assertEqual(list(self.minus_ten.iter_digits(True)), [1, 0, 1, 0])
+        self.assertEqual(list(self.binary.iter_digits(False)), [2, 1])
+
+    def test_from_file(self):
+        text = "-1234567890123456789012345678900\n"
+        integer = BigInteger.from_file(io.StringIO(text), chunk_size=4)
+        self.assertEqual(str(integer), text.strip())
+        binary = BigInteger.from_file(io.BytesIO(b"10101"), binary=True)
+        self.assertTrue(binary.is_binary)
+        self.assertEqual(binary, self.binary)
+        self.assertRaises(ValueError, lambda: BigInteger.from_file(io.StringIO("1x")))
+        self.assertRaises(ValueError, lambda: BigInteger.from_file(io.StringIO("")))
+        spaced = BigInteger.from_file(io.StringIO(" -1234567\r\n"), chunk_size=1)
+        self.assertEqual(str(spaced), "-1234567")
+        spaced = BigInteger.from_file(io.BytesIO(b"10101 \r\n"), True, chunk_size=5)
+        self.assertEqual(spaced, self.binary)
+        self.assertRaises(
+            ValueError, lambda: BigInteger.from_file(io.StringIO("12 3"), chunk_size=2)
+        )
+
+    def test_to_bytes(self):
+        for number in (self.zero, self.minus_ten, self.large, self.binary):
+            packed = number.to_bytes()
+            unpacked = BigInteger.from_bytes(packed)
+            self.assertEqual(str(unpacked), str(number))
+            self.assertEqual(unpacked.is_binary, number.is_binary)
+            shared = BigInteger.from_bytes(bytearray(packed), copy=False)
+            self.assertEqual(str(shared), str(number))
+        self.assertEqual(len(self.large.to_bytes()), 12 + 4 * 4)
+        self.assertRaises(ValueError, lambda: BigInteger.from_bytes(b"\x00"))
+        self.assertRaises(
+            ValueError, lambda: BigInteger.from_bytes(self.one.to_bytes() + b"\x00")
+        )
+
+    def test_iter_bytes(self):
+        numbers = [self.large, self.minus_one, self.binary, self.zero]
+        file = io.BytesIO()
+        for number in numbers:
+            number.write_bytes(file)
+        data = file.getvalue()
+        self.assertEqual(data, b"".join(number.to_bytes() for number in numbers))
+        file.seek(0)
+        expected = [str(number) for number in numbers]
+        self.assertEqual([str(n) for n in BigInteger.iter_bytes(file)], expected)
+        shared = list(BigInteger.iter_bytes(data, copy=False))
+        self.assertEqual([str(n) for n in shared], expected)
+        shared[0] += self.one
+        self.assertEqual(str(shared[0]), "123456789012345678901234567891")
+        self.assertEqual(data, file.getvalue())
+
+    @unittest.skipIf(sys.version_info < (3, 12), "buffer protocol needs Python 3.12")
+    def test_buffer(self):
+        view = memoryview(self.large)
+        self.assertEqual(view.format, big_integer.LIMB_TYPECODE)
+        self.assertTrue(view.readonly)
+        self.large += self.one
+        packed = BigInteger("123456789012345678901234567890").to_bytes()
+        self.assertEqual(view.tobytes(), packed[12:])
+
     def test_dump_integer(self):
         self.zeros.dump_integer()
         self.assertEqual(str(self.zeros), "1")
 
+    def test_sizeof(self):
+        sizes = self.zeros.sizeof()
+        self.assertEqual(sizes["used"], 4)
+        self.assertEqual(sizes["leading_zeros"], 5)
+        self.assertGreaterEqual(sys.getsizeof(self.large), self.large.__sizeof__())
+        nines = BigInteger("9" * 900)
+        self.assertGreater(nines.__sizeof__(), self.one.__sizeof__() + 300)
+        self.large.to_bin()
+        self.assertGreater(self.large.sizeof()["cached"], 0)
+        for result in (nines + nines, nines - self.one, nines >> 3, nines % 10**500):
+            self.assertEqual(result.sizeof()["spare"], 0)
+
+    def test_compact(self):
+        data = self.large.to_bytes() + BigInteger("9" * 9000).to_bytes()
+        view = next(BigInteger.iter_bytes(data, copy=False))
+        self.assertGreater(view.sizeof()["spare"], 3000)
+        self.assertIs(view.compact(), view)
+        self.assertEqual(view.sizeof()["spare"], 0)
+        self.assertFalse(view.sizeof()["shared"])
+        self.assertEqual(str(view), str(self.large))
+        self.large.to_bin()
+        self.large.compact()
+        self.assertEqual(self.large.sizeof()["cached"], 0)
+        self.assertEqual(str(self.zeros.compact()), "1")
+        frozen = self.large.freeze()
+        self.assertEqual(str(frozen.compact()), str(self.large))
+
     def test_abs(self):
         self.assertEqual(str(self.zero.abs()), "0")
         self.assertEqual(str(self.one.abs()), "1")
@@ -76,7 +204,51 @@ class TestBigInteger(unittest.TestCase):
 
     def test_copy(self):
         self.assertEqual(str(self.zero.copy()), "0")
-        self.assertNotEqual(self.zero, self.zero.copy())
+        self.assertEqual(self.zero, self.zero.copy())
+        self.assertIsNot(self.zero, self.zero.copy())
+
+    def test_copy_on_write(self):
+        copied = self.large.copy()
+        copied += self.one
+        copied._add_digit(5)
+        self.assertEqual(str(self.large), "123456789012345678901234567890")
+        self.assertEqual(str(copied), "1234567890123456789012345678915")
+        absolute = self.minus_ten.abs()
+        absolute <<= 2
+        self.assertEqual(str(self.minus_ten), "-10")
+        self.assertEqual(str(absolute), "101000")
+
+    def test_copy_module(self):
+        for duplicate in (copy.copy, copy.deepcopy):
+            original = BigInteger("123456789012345678901234567890")
+            duplicated = duplicate(original)
+            original += 1
+            self.assertEqual(str(duplicated), "123456789012345678901234567890")
+            duplicated.muladd_small(10, 5)
+            self.assertEqual(str(original), "123456789012345678901234567891")
+            self.assertEqual(str(duplicated), "1234567890123456789012345678905")
+        state = BigInteger.__new__(BigInteger)
+        state.__setstate__(self.large.__getstate__())
+        state += 1
+        self.assertEqual(str(self.large), "123456789012345678901234567890")
+        frozen = self.large.freeze()
+        self.assertIs(copy.copy(frozen), frozen)
+        self.assertIs(copy.deepcopy(frozen), frozen)
+
+    def test_freeze(self):
+        frozen = self.large.freeze()
+        self.assertIsInstance(frozen, big_integer.FrozenBigInteger)
+        self.assertEqual({frozen: 1}[BigInteger("123456789012345678901234567890")], 1)
+        self.assertRaises(TypeError, lambda: frozen._add_digit(1))
+        self.assertRaises(TypeError, lambda: setattr(frozen, "positive", False))
+        self.large._add_digit(1)
+        self.assertEqual(str(frozen), "123456789012345678901234567890")
+        total = frozen
+        total += 10
+        self.assertIsInstance(total, big_integer.FrozenBigInteger)
+        self.assertEqual(str(total), "123456789012345678901234567900")
+        self.assertEqual(str(frozen), "123456789012345678901234567890")
+        self.assertIs(frozen.copy(), frozen)
 
     def test_add(self):
         self.assertEqual(str(self.zero + self.zero), "0")
@@ -104,6 +276,64 @@ class TestBigInteger(unittest.TestCase):
         self.assertEqual(str(self.minus_one - self.ten), "-11")
         self.assertEqual(str(self.integ - 10), "0")
 
+    def test_iadd_isub(self):
+        total = self.zero
+        for _ in range(3):
+            total += self.large
+        self.assertIs(total, self.zero)
+        self.assertEqual(str(total), "370370367037037036703703703670")
+        total -= self.large * 4
+        self.assertEqual(str(total), "-123456789012345678901234567890")
+        total += total
+        self.assertEqual(str(total), "-246913578024691357802469135780")
+        self.minus_one += 1
+        self.assertEqual(str(self.minus_one), "0")
+        self.assertTrue(self.minus_one.positive)
+
+    def test_imul(self):
+        product = self.ten
+        product *= self.minus_ten
+        product *= 10
+        self.assertIs(product, self.ten)
+        self.assertEqual(str(product), "-1000")
+
+    def test_small_kernels(self):
+        value = int(str(self.large))
+        terms = ((7, 3), (-7, 3), (10**9, -5), (0, -4), (1, -(10**40)))
+        for multiplier, addend in terms:
+            for number in (value, -value):
+                for integer in (BigInteger(number), BigInteger(number).to_bin()):
+                    result = integer.muladd_small(multiplier, addend)
+                    self.assertIs(result, integer)
+                    self.assertEqual(int(result), number * multiplier + addend)
+                    self.assertEqual(result.positive, number * multiplier + addend >= 0)
+        accumulator = BigInteger(0)
+        for digit in "123456789012345678901234567890":
+            accumulator.muladd_small(10, int(digit))
+        self.assertEqual(str(accumulator), str(self.large))
+        self.assertEqual(str(self.ten.mul_small(-3)), "-30")
+        self.assertEqual(str(self.ten.add_small(31)), "1")
+        self.assertTrue(self.binary.add_small(1).is_binary)
+        self.assertEqual(str(self.binary), "10110")
+        for divisor in (7, -7, 2**32 - 1):
+            for number in (value, -value):
+                quotient, remainder = BigInteger(number).divmod_small(divisor)
+                self.assertEqual((int(quotient), remainder), divmod(number, divisor))
+        with self.assertRaises(ZeroDivisionError):
+            self.one.divmod_small(0)
+        with self.assertRaises(TypeError):
+            self.one.freeze().mul_small(2)
+
+    def test_ilshift_irshift(self):
+        shifted = self.binary
+        shifted <<= 40
+        self.assertIs(shifted, self.binary)
+        self.assertEqual(str(shifted), "10101" + "0" * 40)
+        shifted >>= 41
+        self.assertEqual(str(shifted), "1010")
+        self.minus_ten >>= 2
+        self.assertEqual(str(self.minus_ten), "-11")
+
     def test_mult(self):
         self.assertEqual(str(self.zero * self.zero), "0")
         self.assertEqual(str(self.zero * self.one), "0")
@@ -117,6 +347,14 @@ class TestBigInteger(unittest.TestCase):
         self.assertEqual(str(self.minus_one * self.ten), "-10")
         self.assertEqual(str(self.integ * 10), "100")
 
+    def test_mult_large(self):
+        first = int("98765432109876543210" * 60)
+        second = int("12345678901234567890" * 45)
+        for a, b in ((first, second), (-first, second), (first, -7), (second, first)):
+            self.assertEqual(str(BigInteger(a) * BigInteger(b)), str(a * b))
+        big = BigInteger(first)
+        self.assertEqual(str(big * big), str(first * first))
+
     def test_floordiv(self):
         self.assertRaises(ZeroDivisionError, lambda: self.zero // self.zero)
         self.assertRaises(ZeroDivisionError, lambda: self.one // self.zero)
@@ -131,6 +369,27 @@ class TestBigInteger(unittest.TestCase):
         self.assertEqual(str(self.integ // 10), "1")
         self.assertEqual(str(BigInteger("-101") // BigInteger("10")), "-11")
 
+    def test_divmod(self):
+        first = int("98765432109876543210" * 60)
+        second = int("12345678901234567890" * 25) + 1
+        for a, b in ((first, second), (-first, second), (first, -second), (first, 7)):
+            quotient, remainder = divmod(BigInteger(a), BigInteger(b))
+            self.assertEqual(str(quotient), str(a // b))
+            self.assertEqual(str(remainder), str(a % b))
+        self.assertRaises(ZeroDivisionError, lambda: divmod(self.one, self.zero))
+
+    def test_divmod_newton(self):
+        first = int("98765432109876543210" * 120)
+        second = int("12345678901234567890" * 50) + 1
+        saved = big_integer.NEWTON_DIVISION_THRESHOLD
+        big_integer.NEWTON_DIVISION_THRESHOLD = 2
+        try:
+            quotient, remainder = divmod(BigInteger(first), BigInteger(second))
+        finally:
+            big_integer.NEWTON_DIVISION_THRESHOLD = saved
+        self.assertEqual(str(quotient), str(first // second))
+        self.assertEqual(str(remainder), str(first % second))
+
     def test_mod(self):
         self.assertRaises(ZeroDivisionError, lambda: self.zero % self.zero)
         self.assertRaises(ZeroDivisionError, lambda: self.one % self.zero)
@@ -144,6 +403,95 @@ class TestBigInteger(unittest.TestCase):
         self.assertEqual(str(self.minus_one % self.ten), "9")
         self.assertEqual(str(self.integ % 10), "0")
 
+    def test_pow(self):
+        self.assertEqual(str(self.ten ** 3), "1000")
+        self.assertEqual(str(self.minus_two ** 3), "-8")
+        self.assertEqual(str(self.minus_two ** 2), "4")
+        self.assertEqual(str(self.large ** 0), "1")
+        self.assertEqual(str(self.binary ** 2), "110111001")
+        self.assertEqual(str(self.large ** 5), str(123456789012345678901234567890**5))
+        self.assertRaises(ValueError, lambda: self.ten ** -1)
+
+    def test_pow_mod(self):
+        modulus = int("12345678901234567890" * 10) + 1
+        value = int("98765432109876543210" * 12)
+        exponent = int("31415926535897932384" * 3)
+        for m in (modulus, modulus + 1, -modulus, 7, 1):
+            result = pow(BigInteger(value), BigInteger(exponent), BigInteger(m))
+            self.assertEqual(str(result), str(pow(value, exponent, abs(m))))
+        self.assertEqual(str(pow(self.minus_ten, 3, 7)), "1")
+        self.assertEqual(str(pow(self.binary, 2, self.an_binary)), "111")
+        self.assertRaises(ValueError, lambda: pow(self.ten, 2, self.zero))
+        self.assertEqual(str(pow(BigInteger(3), -2, 7)), "4")
+        self.assertEqual(
+            str(pow(BigInteger(value + 1), -exponent, modulus)),
+            str(pow(value + 1, -exponent, modulus)),
+        )
+        self.assertRaises(ValueError, lambda: pow(self.ten, -1, 4))
+
+    def test_gcd(self):
+        factor = int("31415926535897932384" * 4) + 7
+        first = int("98765432109876543210" * 11) * factor
+        second = int("12345678901234567890" * 9) * factor
+        divisor = math.gcd(first, second)
+        self.assertEqual(str(BigInteger(first).gcd(-second)), str(divisor))
+        self.assertEqual(
+            str(BigInteger(first).to_bin().gcd(BigInteger(second).to_bin())),
+            format(divisor, "b"),
+        )
+        self.assertEqual(str(self.large.gcd(self.zero)), str(self.large))
+        self.assertEqual(str(self.zero.gcd(self.minus_ten)), "10")
+        self.assertEqual(str(self.binary.gcd(self.an_binary)), "111")
+
+    def test_xgcd(self):
+        first = int("98765432109876543210" * 11)
+        second = -int("12345678901234567890" * 9) - 1
+        for a, b in ((first, second), (second, first), (7, 0), (0, -3), (12, 18)):
+            divisor, x, y = BigInteger(a).xgcd(b)
+            self.assertEqual(str(divisor), str(math.gcd(a, b)))
+            self.assertEqual(str(BigInteger(a) * x + BigInteger(b) * y), str(divisor))
+
+    def test_inverse(self):
+        modulus = int("12345678901234567890" * 10) + 1
+        value = int("98765432109876543210" * 12)
+        self.assertEqual(
+            str(BigInteger(value).inverse(modulus)), str(pow(value, -1, modulus))
+        )
+        self.assertEqual(
+            str(BigInteger(-value).inverse(-modulus)), str(pow(-value, -1, modulus))
+        )
+        self.assertEqual(str(self.zero.inverse(1)), "0")
+        self.assertRaises(ValueError, lambda: self.ten.inverse(15))
+        self.assertRaises(ZeroDivisionError, lambda: self.ten.inverse(0))
+
+    def test_isqrt(self):
+        value = int("98765432109876543210" * 17)
+        for n in (value, value**2, value**2 - 1, 0, 1, 3, 4, 99):
+            self.assertEqual(str(BigInteger(n).isqrt()), str(math.isqrt(n)))
+        self.assertEqual(
+            str(BigInteger(value).to_bin().isqrt()), format(math.isqrt(value), "b")
+        )
+        self.assertRaises(ValueError, self.minus_one.isqrt)
+
+    def test_modular_contexts(self):
+        modulus = int("12345678901234567890" * 5) + 1
+        first, second = 3**200 % modulus, 7**150 % modulus
+        contexts = [
+            big_integer.MontgomeryContext(modulus),
+            big_integer.BarrettContext(modulus),
+            big_integer.BarrettContext(modulus + 1),
+        ]
+        for context in contexts:
+            m = int(str(context.modulus))
+            product = context.mul(context.to_residue(first), context.to_residue(second))
+            self.assertEqual(
+                str(context.from_residue(product)), str(first * second % m)
+            )
+            self.assertEqual(
+                str(context.pow(-first, 65537)), str(pow(-first, 65537, m))
+            )
+        self.assertRaises(ValueError, lambda: big_integer.MontgomeryContext(10))
+
     def test_abs_lt(self):
         self.assertTrue(self.zero._abs_lt(self.one))
         self.assertTrue(self.one._abs_lt(self.ten))
@@ -160,6 +508,44 @@ class TestBigInteger(unittest.TestCase):
         self.assertTrue(self.minus_one < self.one)
         self.assertTrue(self.minus_one < self.ten)
         self.assertTrue(self.minus_one < self.large)
+        self.assertTrue(self.minus_ten < self.minus_one)
+        self.assertFalse(self.minus_one < self.minus_ten)
+
+    def test_le(self):
+        self.assertTrue(self.zero <= self.zero)
+        self.assertTrue(self.minus_ten <= self.minus_one)
+        self.assertFalse(self.minus_one <= self.minus_ten)
+        self.assertTrue(self.zeros <= self.one)
+        self.assertTrue(self.binary <= 21)
+
+    def test_gt_ge(self):
+        self.assertTrue(self.large > self.ten)
+        self.assertTrue(self.minus_one > self.minus_ten)
+        self.assertFalse(self.zero > self.zero)
+        self.assertTrue(self.zero >= self.zero)
+        self.assertFalse(self.minus_ten >= self.minus_one)
+
+    def test_eq(self):
+        self.assertEqual(self.zeros, self.one)
+        self.assertEqual(self.binary, BigInteger("21"))
+        self.assertEqual(self.integ, 10)
+        self.assertNotEqual(self.one, self.minus_one)
+        self.assertNotEqual(self.one, "x")
+        self.assertNotEqual(self.one, "1")
+        self.assertNotEqual(BigInteger(-5), "-5")
+        self.assertEqual(BigInteger("-0"), self.zero)
+
+    def test_hash(self):
+        self.assertEqual(hash(self.large), hash(123456789012345678901234567890))
+        self.assertEqual(hash(self.minus_one), hash(-1))
+        self.assertEqual(hash(self.binary), hash(21))
+        self.ten += 1
+        self.assertEqual(hash(self.ten), hash(11))
+        self.assertEqual(len({self.one, self.zeros, self.zero, self.binary}), 3)
+        self.assertEqual(
+            sorted([self.ten, self.minus_ten, self.zero]),
+            [self.minus_ten, self.zero, self.ten],
+        )
 
     def test_to_bin(self):
         self.assertEqual(str(self.zero.to_bin()), "0")
@@ -167,6 +553,89 @@ class TestBigInteger(unittest.TestCase):
         self.assertEqual(str(self.ten.to_bin()), "1010")
         self.assertEqual(str(self.binary), "10101")
 
+    def test_to_bin_large(self):
+        value = int("98765432109876543210" * 150)
+        binary = BigInteger(value).to_bin()
+        self.assertEqual(str(binary), format(value, "b"))
+        self.assertEqual(str(binary.from_bin()), str(value))
+        self.assertEqual(str(BigInteger(-value).to_bin()), "-" + format(value, "b"))
+
+    def test_conversion_cache(self):
+        cache = big_integer.conversion_cache
+        cache.clear()
+        value = BigInteger("98765432109876543210" * 20)
+        self.assertEqual(str(value | self.zero), str(value.to_bin()))
+        self.assertEqual(str(value | self.ten), str((value | self.zero) | self.ten))
+        self.assertGreater(cache.stats()["hits"], 0)
+        value._add_digit(7)
+        digits = "98765432109876543210" * 20 + "7"
+        self.assertEqual(str(value.to_bin().from_bin()), digits)
+        converted = value.to_bin()
+        converted += self.one
+        self.assertEqual(str(value.to_bin().from_bin()), str(value))
+        cache.resize(1)
+        self.assertLessEqual(cache.stats()["size"], 1)
+        cache.resize(big_integer.CONVERSION_CACHE_SIZE)
+
+    def test_conversion_cache_weak(self):
+        cache = big_integer.conversion_cache
+        cache.clear()
+        value = BigInteger("98765432109876543210" * 20)
+        self.assertEqual(str(value | self.zero), str(value.to_bin()))
+        self.assertEqual(len(cache.conversions(value)), 1)
+        reference = weakref.ref(value)
+        size = cache.stats()["size"]
+        del value
+        self.assertIsNone(reference())
+        self.assertEqual(cache.stats()["size"], size - 1)
+
+    def test_small_integers(self):
+        self.assertIs(big_integer._coerce(7), big_integer._coerce(7))
+        total = self.one + 7
+        total += 7
+        self.assertEqual(str(total), "15")
+        self.assertEqual(str(self.one + 7), "8")
+        self.assertEqual(str(BigInteger("7") % -10), "7")
+
+    def test_int(self):
+        self.assertEqual(str(BigInteger(0)), "0")
+        self.assertEqual(int(self.empty), 0)
+        self.assertEqual(int(self.minus_ten), -10)
+        self.assertEqual(int(self.binary), 21)
+        self.assertEqual(hex(self.an_binary), "0xe")
+        self.assertEqual([0, 1, 2][self.one], 1)
+        for value in (10**9 - 1, 10**9, -(2**64 + 7), 7**5000):
+            self.assertEqual(str(BigInteger(value)), str(value))
+            self.assertEqual(int(BigInteger(value)), value)
+            self.assertEqual(int(BigInteger(value).to_bin()), value)
+        self.assertEqual(str(self.one << BigInteger(40)), str(bin(1 << 40))[2:])
+
+    def test_int_operands(self):
+        value = int(str(self.large))
+        for small in (0, 1, -7, 999999999, -999999999, 10**9, -(10**20)):
+            for integer in (self.large, self.large.to_bin(), 0 - self.large):
+                number = int(integer)
+                self.assertEqual(str(integer + small), str(number + small))
+                self.assertEqual(str(small + integer), str(small + number))
+                self.assertEqual(str(integer - small), str(number - small))
+                self.assertEqual(str(small - integer), str(small - number))
+                self.assertEqual(str(integer * small), str(number * small))
+                self.assertEqual(str(small * integer), str(small * number))
+                self.assertEqual(integer < small, number < small)
+                self.assertEqual(small <= integer, small <= number)
+                self.assertEqual(str(small // integer), str(small // number))
+                self.assertEqual(str(small % integer), str(small % abs(number)))
+                if small:
+                    quotient, remainder = divmod(integer, small)
+                    self.assertEqual(str(quotient), str(number // small))
+                    self.assertEqual(str(remainder), str(number % small))
+                    self.assertEqual(str(integer % small), str(number % abs(small)))
+        self.assertFalse((self.binary * 3).is_binary)
+        self.assertEqual(str(value - self.large), "0")
+        self.assertTrue((value - self.large).positive)
+        with self.assertRaises(ZeroDivisionError):
+            self.large // 0
+
     def test_from_bin(self):
         self.assertEqual(str(self.zero.from_bin()), "0")
         self.assertEqual(str(self.one.from_bin()), "1")
@@ -184,6 +653,27 @@ class TestBigInteger(unittest.TestCase):
         self.assertEqual(str(self.binary | self.binary), "10101")
         self.assertEqual(str(self.binary | self.an_binary), "11111")
 
+    def test_logic_and(self):
+        self.assertEqual(str(self.binary & self.an_binary), "100")
+        self.assertEqual(str(self.ten & self.one), "0")
+        self.assertEqual(str(self.minus_one & self.ten), "1010")
+        self.assertEqual(str(self.minus_ten & self.binary), "10100")
+
+    def test_logic_xor(self):
+        self.assertEqual(str(self.binary ^ self.an_binary), "11011")
+        self.assertEqual(str(self.ten ^ self.ten), "0")
+        self.assertEqual(str(self.minus_one ^ self.binary), "-10110")
+
+    def test_invert(self):
+        self.assertEqual(str(~self.binary), "-10110")
+        self.assertEqual(str(~self.minus_one), "0")
+        self.assertEqual(str(~self.zero), "-1")
+
+    def test_binary_arithmetic(self):
+        self.assertEqual(str(self.binary + self.an_binary), "100011")
+        self.assertEqual(str(self.binary * self.an_binary), "100100110")
+        self.assertEqual(str(self.binary + self.one), "22")
+
     def test_lshift(self):
         self.assertEqual(str(self.binary << BigInteger("3")), "10101000")
         self.assertEqual(str(self.binary << 0), "10101")
@@ -195,6 +685,8 @@ class TestBigInteger(unittest.TestCase):
         self.assertEqual(str(self.binary >> 2), "101")
         self.assertEqual(str(self.binary >> 0), "10101")
         self.assertEqual(str(self.binary >> -1), "101010")
+        self.assertEqual(str(self.minus_ten >> 2), "-11")
+        self.assertEqual(str(BigInteger(2**100 + 5) >> 98), "100")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,80 @@
+"""Unittest module for big_integer_array module."""
+import unittest
+from big_integer import BigInteger
+from big_integer_array import BigIntegerArray, numpy
+
+
+class TestBigIntegerArray(unittest.TestCase):
+    use_numpy = False
+
+    def setUp(self) -> None:
+        self.values = [0, 1, -1, 10, -10, 2**100 + 7, -(2**70), 12345678901234567890]
+        self.others = [5, -1, -1, -10, -20, 2**100, 2**70, 1]
+        self.first = BigIntegerArray(self.values, use_numpy=self.use_numpy)
+        self.second = BigIntegerArray(self.others, use_numpy=self.use_numpy)
+
+    def assertValues(self, batch, expected, binary=False):
+        self.assertEqual(
+            [str(value) for value in batch.tolist()],
+            [format(value, "b") if binary else str(value) for value in expected],
+        )
+
+    def test_init(self):
+        self.assertEqual(len(self.first), 8)
+        self.assertValues(self.first, self.values)
+        self.assertEqual(str(self.first[3]), "10")
+        self.assertEqual(str(self.first[-2]), str(-(2**70)))
+        self.assertEqual(len(BigIntegerArray([], use_numpy=self.use_numpy)), 0)
+        self.assertRaises(IndexError, lambda: self.first[8])
+
+    def test_binary(self):
+        binary = BigInteger("101")
+        binary.is_binary = True
+        batch = BigIntegerArray([binary, binary], use_numpy=self.use_numpy)
+        self.assertEqual(
+            [str(value) for value in (batch + batch).tolist()], ["1010", "1010"]
+        )
+
+    def test_add(self):
+        self.assertValues(
+            self.first + self.second, [a + b for a, b in zip(self.values, self.others)]
+        )
+
+    def test_sub(self):
+        self.assertValues(
+            self.first - self.second, [a - b for a, b in zip(self.values, self.others)]
+        )
+        self.assertRaises(ValueError, lambda: self.first - self.second.tolist()[:3])
+
+    def test_mul_small(self):
+        self.assertValues(
+            self.first * 4000000000, [a * 4000000000 for a in self.values]
+        )
+        self.assertValues(self.first.mul_small(-3), [a * -3 for a in self.values])
+        self.assertRaises(ValueError, lambda: self.first * 2**32)
+
+    def test_compare(self):
+        self.assertEqual(
+            list(self.first.compare(self.second)),
+            [(a > b) - (a < b) for a, b in zip(self.values, self.others)],
+        )
+
+    def test_bitwise(self):
+        pairs = list(zip(self.values, self.others))
+        self.assertValues(self.first | self.second, [a | b for a, b in pairs], True)
+        self.assertValues(self.first & self.second, [a & b for a, b in pairs], True)
+        self.assertValues(self.first ^ self.second, [a ^ b for a, b in pairs], True)
+
+    def test_shift(self):
+        self.assertValues(self.first << 45, [a << 45 for a in self.values], True)
+        self.assertValues(self.first >> 3, [a >> 3 for a in self.values], True)
+        self.assertValues(self.first >> 64, [a >> 64 for a in self.values], True)
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestBigIntegerArrayNumpy(TestBigIntegerArray):
+    use_numpy = True
+
+
+if __name__ == "__main__":
+    unittest.main()
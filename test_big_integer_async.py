@@ -0,0 +1,103 @@
+"""Unittest module for big_integer_async module."""
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from big_integer import BigInteger
+from big_integer_async import AsyncArithmetic, adivmod, amul
+
+
+class TestAsyncArithmetic(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.first = int("98765432109876543210" * 40)
+        self.second = -int("12345678901234567890" * 15)
+        self.executor = ThreadPoolExecutor(1)
+        self.modes = (
+            AsyncArithmetic(),
+            AsyncArithmetic(cooperative_threshold=2, chunk=3),
+            AsyncArithmetic(self.executor, 2, 20, 5),
+        )
+
+    def tearDown(self) -> None:
+        self.executor.shutdown()
+
+    def operands(self) -> list:
+        values = []
+        for first_binary, second_binary in (
+            (False, False),
+            (True, True),
+            (True, False),
+        ):
+            first, second = BigInteger(self.first), BigInteger(self.second)
+            values.append(
+                (
+                    first.to_bin() if first_binary else first,
+                    second.to_bin() if second_binary else second,
+                )
+            )
+        return values
+
+    async def test_mul(self):
+        for arithmetic in self.modes:
+            for first, second in self.operands():
+                product = await arithmetic.mul(first, second)
+                self.assertEqual(str(product), str(first * second))
+                self.assertEqual(product.is_binary, (first * second).is_binary)
+        self.assertEqual(str(await amul(self.first, 3)), str(self.first * 3))
+
+    async def test_divmod(self):
+        for arithmetic in self.modes:
+            for first, second in self.operands():
+                for dividend, divisor in ((first, second), (second, first)):
+                    quotient, remainder = await arithmetic.divmod(dividend, divisor)
+                    expected = divmod(dividend, divisor)
+                    self.assertEqual(str(quotient), str(expected[0]))
+                    self.assertEqual(str(remainder), str(expected[1]))
+                    self.assertEqual(
+                        str(await arithmetic.floordiv(dividend, divisor)),
+                        str(dividend // divisor),
+                    )
+                    self.assertEqual(
+                        str(await arithmetic.mod(dividend, divisor)),
+                        str(dividend % divisor),
+                    )
+            with self.assertRaises(ZeroDivisionError):
+                await arithmetic.divmod(self.first, 0)
+        quotient, remainder = await adivmod(self.first, 7)
+        self.assertEqual(str(quotient), str(self.first // 7))
+        self.assertEqual(str(remainder), str(self.first % 7))
+
+    async def test_radix(self):
+        for arithmetic in self.modes:
+            for value in (BigInteger(self.first), BigInteger(self.second)):
+                binary = await arithmetic.to_bin(value)
+                self.assertTrue(binary.is_binary)
+                self.assertEqual(str(binary), str(value.to_bin()))
+                decimal = await arithmetic.from_bin(binary)
+                self.assertFalse(decimal.is_binary)
+                self.assertEqual(str(decimal), str(value))
+
+    async def test_cooperative(self):
+        arithmetic = AsyncArithmetic(cooperative_threshold=2, chunk=3)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        await arithmetic.mul(self.first, self.second)
+        self.assertGreater(ticks, 10)
+        task.cancel()
+        product = asyncio.create_task(arithmetic.mul(self.first, self.second))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        product.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await product
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,487 @@
+"""Differential and complexity regression tests for big_integer module.
+
+Random operands of many sizes, signs and radixes run through every operator
+and the results are checked against Python int. Complexity tests count limb
+products of the quadratic kernels over doubling sizes and fail when the
+fitted exponent of count over size grows past the exponent of the algorithm
+plus a tolerance. Wall-clock timing tests of the same kind are opt-in, set
+BIG_INTEGER_TIMING_TESTS=1 to run them.
+"""
+import contextlib
+import math
+import os
+import random
+import statistics
+import sys
+import time
+import unittest
+from unittest import mock
+
+import big_integer
+from big_integer import (
+    BINARY_LIMB_DIGITS,
+    DECIMAL_LIMB_DIGITS,
+    KARATSUBA_THRESHOLD,
+    NEWTON_DIVISION_THRESHOLD,
+    BigInteger,
+)
+from big_integer_profile import fit_exponent
+
+# Fixed seed, so a failing case reproduces. Messages name the round.
+FUZZ_SEED = 20240521
+FUZZ_ROUNDS = 60
+# Bit lengths of random operands: zero, one limb, a few limbs, around the
+# Karatsuba threshold of both radixes and past it.
+FUZZ_BITS = (
+    (0, 0),
+    (1, 31),
+    (32, 96),
+    (97, 640),
+    (1500, KARATSUBA_THRESHOLD * BINARY_LIMB_DIGITS + 200),
+)
+# Exponents of time over size of linear operations and of Karatsuba
+# multiplication, which bounds what builds on it. Fits may exceed them by
+# the tolerance: counts are exact but include schoolbook leaves, timings
+# are noisy.
+LINEAR_EXPONENT = 1.0
+KARATSUBA_EXPONENT = math.log2(3)
+COUNT_TOLERANCE = 0.15
+TIMING_TOLERANCE = 0.3
+# Limb products, or limb steps of linear kernels, done by one kernel call.
+KERNEL_PRODUCTS = {
+    "_limbs_mul_schoolbook": lambda first, second, base: len(first) * len(second),
+    "_limbs_square_schoolbook": lambda limbs, base: len(limbs) ** 2,
+    "_limbs_divmod_long": lambda first, second, base: (
+        (len(first) - len(second) + 1) * len(second)
+    ),
+    "_limbs_imuladd_small": lambda limbs, *args: len(limbs),
+}
+# Divisors of counted divisions exceed this many limbs, so they take the
+# Newton path at sizes that count quickly.
+COUNTED_NEWTON_THRESHOLD = 64
+# Wall-clock timing tests are opt-in, loaded machines disturb them.
+TIMING_TESTS = os.environ.get("BIG_INTEGER_TIMING_TESTS") == "1"
+# Minimum seconds of one timing run and number of runs, the median counts.
+TIMING_SECONDS = 0.01
+TIMING_REPEATS = 5
+
+
+def _value(number: object) -> object:
+    """Read result of BigInteger operation as Python value
+
+    Args:
+        number (BigInteger | tuple | object): Result
+
+    Returns:
+        int | tuple | object: Int of big integers, tuples item by item
+    """
+    if isinstance(number, BigInteger):
+        return int(str(number), 2 if number.is_binary else 10)
+    if isinstance(number, tuple):
+        return tuple(_value(item) for item in number)
+    return number
+
+
+def _random_int(rng: random.Random) -> int:
+    """Build random signed int of a random size class
+
+    A quarter of values are powers of a limb base or one less, so carries
+    and borrows run across every limb.
+
+    Args:
+        rng (random.Random): Source of randomness
+
+    Returns:
+        int: Random value
+    """
+    low, high = rng.choice(FUZZ_BITS)
+    sign = rng.choice((1, -1))
+    if high and rng.random() < 0.25:
+        limbs = rng.randint(1, max(1, high // BINARY_LIMB_DIGITS))
+        if rng.random() < 0.5:
+            power = 10 ** (DECIMAL_LIMB_DIGITS * limbs)
+        else:
+            power = 1 << (BINARY_LIMB_DIGITS * limbs)
+        return sign * (power - rng.randint(0, 1))
+    return sign * rng.getrandbits(rng.randint(low, high))
+
+
+def _big(value: int, binary: bool) -> BigInteger:
+    """Build big integer of the value in the radix
+
+    Args:
+        value (int): Value
+        binary (bool): Whether to store binary limbs
+
+    Returns:
+        BigInteger: Big integer
+    """
+    number = BigInteger(value)
+    return number.to_bin() if binary else number
+
+
+def _timed(call: object) -> float:
+    """Measure seconds of one call
+
+    Calls repeat until a run lasts TIMING_SECONDS, the median run of
+    TIMING_REPEATS counts.
+
+    Args:
+        call (callable): Call without arguments
+
+    Returns:
+        float: Seconds per call
+    """
+    runs = []
+    for _ in range(TIMING_REPEATS):
+        calls = 0
+        start = time.perf_counter()
+        while True:
+            call()
+            calls += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= TIMING_SECONDS:
+                break
+        runs.append(elapsed / calls)
+    return statistics.median(runs)
+
+
+def _counted(call: object) -> int:
+    """Count limb products of quadratic kernels done by one call
+
+    Conversion caches are cleared first, so cached radix powers are built
+    and counted on every call.
+
+    Args:
+        call (callable): Call without arguments
+
+    Returns:
+        int: Sum of KERNEL_PRODUCTS over kernel calls
+    """
+    count = 0
+
+    def counting(kernel: object, products: object) -> object:
+        def wrapper(*args):
+            nonlocal count
+            count += products(*args)
+            return kernel(*args)
+
+        return wrapper
+
+    with contextlib.ExitStack() as stack:
+        for name, products in KERNEL_PRODUCTS.items():
+            kernel = getattr(big_integer, name)
+            stack.enter_context(
+                mock.patch.object(big_integer, name, counting(kernel, products))
+            )
+        big_integer.conversion_cache.clear()
+        call()
+    return count
+
+
+class TestDifferential(unittest.TestCase):
+    """Operators of random big integers against Python int"""
+
+    def setUp(self) -> None:
+        sys.set_int_max_str_digits(0)
+        self.rng = random.Random(FUZZ_SEED)
+
+    def cases(self) -> object:
+        """Yield random operands in every pair of radixes
+
+        Yields:
+            tuple: Ints, big integers of them and a description
+        """
+        for index in range(FUZZ_ROUNDS):
+            first, second = _random_int(self.rng), _random_int(self.rng)
+            for radixes in ((False, False), (False, True), (True, False), (True, True)):
+                x, y = _big(first, radixes[0]), _big(second, radixes[1])
+                yield first, second, x, y, f"round {index}, binary {radixes}"
+
+    def assertMatches(self, result: object, expected: object, case: str) -> None:
+        self.assertEqual(_value(result), expected, case)
+
+    def assertOutcome(self, operation: object, expected: object, case: str) -> None:
+        """Assert operation has the int result or raises the same error
+
+        Args:
+            operation (callable): BigInteger operation without arguments
+            expected (callable): Int operation without arguments
+            case (str): Description of operands
+        """
+        try:
+            value = expected()
+        except (ZeroDivisionError, ValueError) as error:
+            with self.assertRaises(type(error), msg=case):
+                operation()
+            return
+        self.assertMatches(operation(), value, case)
+
+    def test_arithmetic(self):
+        for a, b, x, y, case in self.cases():
+            self.assertMatches(x + y, a + b, case)
+            self.assertMatches(x - y, a - b, case)
+            self.assertMatches(x * y, a * b, case)
+            self.assertEqual((x + y).is_binary, x.is_binary and y.is_binary, case)
+            self.assertEqual((x * y).is_binary, x.is_binary and y.is_binary, case)
+
+    def test_division(self):
+        for a, b, x, y, case in self.cases():
+            self.assertOutcome(lambda: x // y, lambda: a // b, case)
+            # Remainders lie in [0, |divisor|), unlike int which takes its sign.
+            self.assertOutcome(lambda: x % y, lambda: a % abs(b), case)
+            self.assertOutcome(lambda: divmod(x, y), lambda: divmod(a, b), case)
+
+    def test_bitwise(self):
+        for a, b, x, y, case in self.cases():
+            self.assertMatches(x | y, a | b, case)
+            self.assertMatches(x & y, a & b, case)
+            self.assertMatches(x ^ y, a ^ b, case)
+            self.assertMatches(~x, ~a, case)
+            self.assertTrue((x ^ y).is_binary, case)
+
+    def test_shifts(self):
+        for a, _, x, _, case in self.cases():
+            shift = self.rng.randint(0, 3 * BINARY_LIMB_DIGITS)
+            self.assertMatches(x << shift, a << shift, case)
+            self.assertMatches(x >> shift, a >> shift, case)
+            shifted = x.copy()
+            shifted <<= shift
+            self.assertMatches(shifted, a << shift, case)
+            shifted >>= 2 * shift
+            self.assertMatches(shifted, a >> shift, case)
+
+    def test_comparisons(self):
+        for a, b, x, y, case in self.cases():
+            self.assertEqual(x < y, a < b, case)
+            self.assertEqual(x <= y, a <= b, case)
+            self.assertEqual(x > y, a > b, case)
+            self.assertEqual(x >= y, a >= b, case)
+            self.assertEqual(x == y, a == b, case)
+            self.assertEqual(x != y, a != b, case)
+            self.assertTrue(x == a, case)
+            self.assertEqual(hash(x), hash(a), case)
+
+    def test_int_operands(self):
+        for a, b, x, _, case in self.cases():
+            self.assertMatches(x + b, a + b, case)
+            self.assertMatches(b + x, b + a, case)
+            self.assertMatches(x - b, a - b, case)
+            self.assertMatches(b - x, b - a, case)
+            self.assertMatches(x * b, a * b, case)
+            self.assertMatches(b * x, b * a, case)
+            self.assertOutcome(lambda: x // b, lambda: a // b, case)
+            self.assertOutcome(lambda: b // x, lambda: b // a, case)
+            self.assertOutcome(lambda: x % b, lambda: a % abs(b), case)
+            self.assertOutcome(lambda: b % x, lambda: b % abs(a), case)
+            self.assertOutcome(lambda: divmod(x, b), lambda: divmod(a, b), case)
+            self.assertOutcome(lambda: divmod(b, x), lambda: divmod(b, a), case)
+            small = self.rng.randint(-(10**9), 10**9)
+            self.assertMatches(x + small, a + small, case)
+            self.assertMatches(x * small, a * small, case)
+            self.assertOutcome(lambda: x // small, lambda: a // small, case)
+            self.assertEqual(x < small, a < small, case)
+
+    def test_in_place(self):
+        for a, b, x, y, case in self.cases():
+            number = x.copy()
+            number += y
+            self.assertMatches(number, a + b, case)
+            number -= y
+            number -= y
+            self.assertMatches(number, a - b, case)
+            number *= y
+            self.assertMatches(number, (a - b) * b, case)
+            self.assertMatches(x, a, case)
+            multiplier = self.rng.randint(-(10**9), 10**9)
+            addend = self.rng.randint(-(10**9), 10**9)
+            self.assertMatches(
+                x.copy().muladd_small(multiplier, addend), a * multiplier + addend, case
+            )
+            divisor = self.rng.choice((-1, 1)) * self.rng.randint(1, 10**9)
+            quotient, remainder = x.copy().divmod_small(divisor)
+            self.assertEqual((_value(quotient), remainder), divmod(a, divisor), case)
+
+    def test_power(self):
+        for a, b, x, y, case in self.cases():
+            exponent = self.rng.randint(0, 5)
+            self.assertMatches(x**exponent, a**exponent, case)
+            if abs(b).bit_length() > 640:
+                continue
+            exponent = self.rng.getrandbits(64)
+            self.assertOutcome(
+                lambda: pow(x, exponent, y), lambda: pow(a, exponent, abs(b)), case
+            )
+            self.assertOutcome(lambda: pow(x, -1, y), lambda: pow(a, -1, abs(b)), case)
+
+    def test_number_theory(self):
+        for a, b, x, y, case in self.cases():
+            self.assertMatches(x.gcd(y), math.gcd(a, b), case)
+            self.assertOutcome(lambda: x.isqrt(), lambda: math.isqrt(a), case)
+            divisor, first, second = _value(x.xgcd(y))
+            self.assertEqual(divisor, math.gcd(a, b), case)
+            self.assertEqual(a * first + b * second, divisor, case)
+
+    def test_conversions(self):
+        for a, _, x, _, case in self.cases():
+            self.assertEqual(int(x), a, case)
+            self.assertEqual(_value(BigInteger(str(a))), a, case)
+            self.assertMatches(x.to_bin(), a, case)
+            self.assertMatches(x.from_bin(), a, case)
+            self.assertTrue(x.to_bin().is_binary, case)
+            self.assertFalse(x.from_bin().is_binary, case)
+            self.assertMatches(BigInteger.from_bytes(x.to_bytes()), a, case)
+
+    def test_large(self):
+        # Operands past the Newton division threshold of both radixes.
+        bits = (NEWTON_DIVISION_THRESHOLD + 100) * BINARY_LIMB_DIGITS
+        for binary in (False, True):
+            case = f"large, binary {binary}"
+            a = self.rng.choice((1, -1)) * self.rng.getrandbits(2 * bits)
+            b = self.rng.choice((1, -1)) * self.rng.getrandbits(bits)
+            x, y = _big(a, binary), _big(b, binary)
+            self.assertMatches(x * y, a * b, case)
+            self.assertMatches(divmod(x, y), divmod(a, b), case)
+
+
+class ComplexityTestCase(unittest.TestCase):
+    """Fits of a cost of operations over operand sizes"""
+
+    def setUp(self) -> None:
+        sys.set_int_max_str_digits(0)
+        self.rng = random.Random(FUZZ_SEED)
+
+    def number(self, digits: int, binary: bool = False) -> BigInteger:
+        return _big(self.rng.randrange(10 ** (digits - 1), 10**digits), binary)
+
+    def cost(self, operation: object) -> float:
+        raise NotImplementedError
+
+    def assertExponent(
+        self,
+        operation: object,
+        sizes: tuple,
+        exponent: float,
+        tolerance: float,
+        divisor: int = 1,
+        binary: bool = False,
+    ) -> None:
+        """Assert cost of operation grows no faster than size**exponent
+
+        Args:
+            operation (callable): Operation on two big integers
+            sizes (tuple): At least four increasing digit counts of the
+                first operand
+            exponent (float): Exponent of the algorithm
+            tolerance (float): Allowed excess of the fitted exponent
+            divisor (int, optional): Ratio of the sizes of the first and
+                second operands. Defaults to 1.
+            binary (bool, optional): Whether operands are binary. Defaults
+                to False.
+        """
+        operands = [
+            (self.number(size, binary), self.number(size // divisor, binary))
+            for size in sizes
+        ]
+        costs = [self.cost(lambda: operation(*pair)) for pair in operands]
+        fitted = fit_exponent(list(sizes), costs)
+        self.assertLessEqual(
+            fitted,
+            exponent + tolerance,
+            f"exponent {fitted:.2f} exceeds {exponent:.2f} + {tolerance} "
+            f"for sizes {sizes}",
+        )
+
+
+class TestOperationCounts(ComplexityTestCase):
+    """Fitted exponents of limb products over operand size"""
+
+    sizes = (2000, 4000, 8000, 16000)
+
+    def cost(self, operation: object) -> float:
+        return _counted(operation)
+
+    def assertCounts(self, operation: object, **options) -> None:
+        self.assertExponent(
+            operation, self.sizes, KARATSUBA_EXPONENT, COUNT_TOLERANCE, **options
+        )
+
+    def test_counter(self):
+        # Schoolbook multiplication below the threshold counts every product.
+        first, second = self.number(200), self.number(100)
+        self.assertEqual(
+            _counted(lambda: first * second),
+            len(first._limbs) * len(second._limbs),
+        )
+
+    def test_multiplication(self):
+        self.assertCounts(lambda a, b: a * b)
+        self.assertCounts(lambda a, b: a * a)
+        self.assertCounts(lambda a, b: a * b, binary=True)
+
+    def test_conversions(self):
+        self.assertCounts(lambda a, b: a.to_bin())
+        self.assertCounts(lambda a, b: a.from_bin(), binary=True)
+
+    def test_division(self):
+        with mock.patch.object(
+            big_integer, "NEWTON_DIVISION_THRESHOLD", COUNTED_NEWTON_THRESHOLD
+        ):
+            self.assertCounts(lambda a, b: a // b, divisor=2)
+            self.assertCounts(lambda a, b: a % b, divisor=2, binary=True)
+
+
+@unittest.skipUnless(TIMING_TESTS, "set BIG_INTEGER_TIMING_TESTS=1 to run")
+class TestTiming(ComplexityTestCase):
+    """Fitted exponents of wall-clock time over operand size"""
+
+    def cost(self, operation: object) -> float:
+        return _timed(operation)
+
+    def assertLinear(self, operation: object, **options) -> None:
+        sizes = (4000, 8000, 16000, 32000)
+        self.assertExponent(
+            operation, sizes, LINEAR_EXPONENT, TIMING_TOLERANCE, **options
+        )
+
+    def assertKaratsuba(self, operation: object, sizes: tuple, **options) -> None:
+        self.assertExponent(
+            operation, sizes, KARATSUBA_EXPONENT, TIMING_TOLERANCE, **options
+        )
+
+    def test_linear(self):
+        self.assertLinear(lambda a, b: a + b)
+        self.assertLinear(lambda a, b: a - b)
+        self.assertLinear(lambda a, b: str(a))
+        self.assertLinear(lambda a, b: a < b)
+        # Binary operands, a decimal one would time its cached conversion.
+        self.assertLinear(lambda a, b: a << 1000, binary=True)
+        self.assertLinear(lambda a, b: a >> 1000, binary=True)
+
+    def test_multiplication(self):
+        sizes = (2000, 4000, 8000, 16000)
+        self.assertKaratsuba(lambda a, b: a * b, sizes)
+        self.assertKaratsuba(lambda a, b: a * a, sizes)
+
+    def test_conversions(self):
+        sizes = (2000, 4000, 8000, 16000)
+
+        def to_bin(a, b):
+            big_integer.conversion_cache.clear()
+            return a.to_bin()
+
+        self.assertKaratsuba(to_bin, sizes)
+        self.assertKaratsuba(lambda a, b: int(a), sizes)
+
+    def test_division(self):
+        # Below the Newton threshold division is quadratic by design, a lower
+        # threshold keeps Newton division of these sizes quick to time.
+        sizes = (4000, 8000, 16000, 32000)
+        with mock.patch.object(
+            big_integer, "NEWTON_DIVISION_THRESHOLD", COUNTED_NEWTON_THRESHOLD
+        ):
+            self.assertKaratsuba(lambda a, b: a // b, sizes, divisor=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""Unittest module for big_integer_lazy module."""
+import unittest
+from unittest import mock
+from big_integer import BigInteger
+from big_integer_lazy import LazyInteger
+
+
+class TestLazyInteger(unittest.TestCase):
+    def setUp(self) -> None:
+        self.first = int("98765432109876543210" * 6)
+        self.second = -int("12345678901234567890" * 4)
+        self.modulus = int("31415926535897932384" * 5) + 1
+
+    def test_evaluate(self):
+        a, b, m = self.first, self.second, self.modulus
+        first, second = LazyInteger(a), LazyInteger(BigInteger(b))
+        modulus = LazyInteger(str(m))
+        for expression, expected in (
+            ((first * second + 7) % modulus, (a * b + 7) % m),
+            (3 - first + second * 2, 3 - a + b * 2),
+            ((first - second).abs() // 12345, abs(a - b) // 12345),
+            (
+                pow(second, 3, modulus) + (first << 3) - (first >> 5),
+                pow(b, 3, m) + (a << 3) - (a >> 5),
+            ),
+            (10**30 // first + 10**30 % modulus, 10**30 // a + 10**30 % m),
+        ):
+            self.assertEqual(str(expression), str(expected))
+        self.assertTrue(first * 2 > first)
+        self.assertEqual(first - first, 0)
+        self.assertEqual(first * 2, LazyInteger(a) + a)
+
+    def test_binary(self):
+        first = BigInteger(self.first).to_bin()
+        second = BigInteger(self.second).to_bin()
+        value = (LazyInteger(first) * second + first).evaluate()
+        self.assertTrue(value.is_binary)
+        self.assertEqual(str(value), str(first * second + first))
+        value = (LazyInteger(first) * second % self.modulus).evaluate()
+        self.assertFalse(value.is_binary)
+        self.assertEqual(str(value), str(self.first * self.second % self.modulus))
+
+    def test_divmod(self):
+        dividend, divisor = LazyInteger(self.first), LazyInteger(self.second)
+        quotient, remainder = divmod(dividend, divisor)
+        total = quotient + remainder + dividend % divisor + dividend // divisor
+        divmod_original = BigInteger.__divmod__
+        with mock.patch.object(
+            BigInteger, "__divmod__", autospec=True, side_effect=divmod_original
+        ) as division:
+            value = total.evaluate()
+        self.assertEqual(division.call_count, 1)
+        q, r = divmod(self.first, self.second)
+        self.assertEqual(str(value), str(2 * q + r + self.first % -self.second))
+
+    def test_mulmod(self):
+        modulus = LazyInteger(self.modulus)
+        total = LazyInteger(1)
+        expected = 1
+        for value in (self.first, self.second, -self.first, 12345):
+            total = total * value % modulus + value * value % modulus
+            expected = expected * value % self.modulus + value * value % self.modulus
+        self.assertEqual(str(total), str(expected))
+
+    def test_shared_values(self):
+        leaf = BigInteger(self.first)
+        square = LazyInteger(leaf) * leaf
+        total = square + 1 + square
+        self.assertEqual(str(total), str(2 * self.first**2 + 1))
+        self.assertEqual(str(square), str(self.first**2))
+        result = total.evaluate()
+        result += 1
+        self.assertEqual(str(total), str(2 * self.first**2 + 1))
+        self.assertEqual(str(leaf), str(self.first))
+        chain = LazyInteger(0)
+        for i in range(5000):
+            chain = chain + i
+        self.assertEqual(str(chain), str(sum(range(5000))))
+
+
+if __name__ == "__main__":
+    unittest.main()
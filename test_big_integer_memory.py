@@ -0,0 +1,46 @@
+"""Unittest module for big_integer_memory module."""
+import gc
+import unittest
+from big_integer import BigInteger
+from big_integer_memory import MemoryTracker
+
+
+class TestMemoryTracker(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tracker = MemoryTracker()
+        self.large = BigInteger("123456789" * 300)
+
+    def test_report(self):
+        copy = self.large.copy()
+        padded = BigInteger("000042")
+        self.tracker.track(self.large, copy, padded)
+        report = self.tracker.report()
+        self.assertEqual(report["count"], 3)
+        self.assertEqual(report["shared"], 2)
+        self.assertEqual(report["leading_zeros"], 4)
+        self.assertEqual(report["used"], 4 * (len(self.large._limbs) + 1))
+        self.assertEqual(
+            report["total"],
+            report["object"] + report["allocated"] + report["cached"],
+        )
+        self.assertIs(self.tracker.largest(1)[0][1], self.large)
+        del copy, padded
+        gc.collect()
+        self.assertEqual(len(self.tracker), 1)
+        self.tracker.untrack(self.large)
+        self.assertEqual(self.tracker.report()["count"], 0)
+
+    def test_compact(self):
+        data = bytearray(self.large.to_bytes() + BigInteger(-5).to_bytes())
+        numbers = list(BigInteger.iter_bytes(data, copy=False))
+        self.tracker.track(*numbers, self.large.freeze())
+        self.large.to_bin()
+        self.assertGreater(self.tracker.report()["spare"], 0)
+        self.assertGreater(self.tracker.compact(), 0)
+        report = self.tracker.report()
+        self.assertEqual(report["spare"], 0)
+        self.assertEqual([str(number) for number in numbers], [str(self.large), "-5"])
+
+
+if __name__ == "__main__":
+    unittest.main()
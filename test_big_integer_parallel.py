@@ -0,0 +1,88 @@
+"""Unittest module for big_integer_parallel module."""
+import unittest
+from array import array
+from unittest import mock
+from big_integer import LIMB_TYPECODE, BigInteger
+from big_integer_parallel import ParallelArithmetic
+
+
+def _failing_task(*args) -> int:
+    raise ValueError("task failed")
+
+
+class TestParallelArithmetic(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.parallel = ParallelArithmetic(max_workers=2, threshold=40)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.parallel.shutdown()
+
+    def setUp(self) -> None:
+        # Operands above twice the Karatsuba threshold split into several
+        # tasks: first and second balanced, first and middle unbalanced.
+        self.first = int("98765432109876543210" * 130)
+        self.second = int("12345678901234567890" * 75) + 1
+        self.middle = int("27182818284590452353" * 60)
+        self.short = int("31415926535897932384" * 6)
+
+    def submitted(self) -> object:
+        return mock.patch.object(
+            self.parallel._executor, "submit", wraps=self.parallel._executor.submit
+        )
+
+    def test_mul(self):
+        for a, b in (
+            (self.first, self.second),
+            (-self.first, self.middle),
+            (-self.first, self.short),
+            (self.short, self.first),
+            (7, self.first),
+        ):
+            product = self.parallel.mul(BigInteger(a), BigInteger(b))
+            self.assertEqual(str(product), str(a * b))
+        product = self.parallel.mul(
+            BigInteger(self.first).to_bin(), BigInteger(self.second).to_bin()
+        )
+        self.assertEqual(str(product), format(self.first * self.second, "b"))
+
+    def test_mul_tasks(self):
+        for a, b in ((self.first, self.second), (self.first, self.middle)):
+            with self.submitted() as submit:
+                product = self.parallel.mul(BigInteger(a), BigInteger(b))
+            self.assertEqual(str(product), str(a * b))
+            self.assertGreater(submit.call_count, 1)
+
+    def test_divmod(self):
+        dividend = self.first * self.second + 12345
+        for a, b in ((dividend, self.second), (-dividend, self.second), (dividend, 7)):
+            quotient, remainder = self.parallel.divmod(BigInteger(a), BigInteger(b))
+            self.assertEqual(str(quotient), str(a // b))
+            self.assertEqual(str(remainder), str(a % b))
+        self.assertEqual(
+            str(self.parallel.floordiv(BigInteger(dividend), BigInteger(self.first))),
+            str(dividend // self.first),
+        )
+        self.assertRaises(
+            ZeroDivisionError, lambda: self.parallel.divmod(BigInteger(1), 0)
+        )
+
+    def test_to_bin(self):
+        value = self.first * self.second
+        with self.submitted() as submit:
+            binary = self.parallel.to_bin(BigInteger(-value))
+        self.assertGreater(submit.call_count, 1)
+        self.assertEqual(str(binary), "-" + format(value, "b"))
+        self.assertEqual(str(self.parallel.from_bin(binary)), str(-value))
+
+    def test_failed_task(self):
+        limbs = array(LIMB_TYPECODE, [1, 2, 3])
+        with self.assertRaises(ValueError):
+            self.parallel._run(_failing_task, [(limbs,)] * 4, [3] * 4, False)
+        product = self.parallel.mul(BigInteger(self.first), BigInteger(self.second))
+        self.assertEqual(str(product), str(self.first * self.second))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+"""Unittest module for big_integer_profile module."""
+import io
+import json
+import unittest
+from big_integer import BigInteger
+from big_integer_profile import Profiler, fit_exponent
+
+
+class TestProfiler(unittest.TestCase):
+    def test_context_manager(self):
+        add = BigInteger.__add__
+        first = BigInteger("12345678901234567890")
+        with Profiler(trace_memory=True) as profiler:
+            self.assertIsNot(BigInteger.__add__, add)
+            self.assertEqual(str(first + 1), "12345678901234567891")
+            self.assertEqual(str(first * first), str(12345678901234567890**2))
+            self.assertTrue(first > 5)
+            self.assertRaises(RuntimeError, Profiler().enable)
+        self.assertIs(BigInteger.__add__, add)
+        first + first
+        histograms = profiler.histograms()
+        self.assertEqual(histograms["__add__"][0]["digits"], 16)
+        self.assertEqual(histograms["__add__"][0]["calls"], 1)
+        self.assertEqual(histograms["__mul__"][0]["calls"], 1)
+        self.assertEqual(histograms["_compare"][0]["calls"], 1)
+        self.assertNotIn("__floordiv__", histograms)
+
+    def test_export(self):
+        with Profiler(operations=("__add__", "_abs_lt")) as profiler:
+            for digits in (1, 10, 100, 1000):
+                value = BigInteger("7" * digits)
+                value + value
+                value._abs_lt(value)
+        output = io.StringIO()
+        profiler.export(output)
+        exported = json.loads(output.getvalue())
+        self.assertEqual(sorted(exported), ["__add__", "_abs_lt"])
+        self.assertEqual(
+            [bucket["digits"] for bucket in exported["__add__"]], [1, 8, 64, 512]
+        )
+        self.assertIn("__add__", profiler.exponents())
+        profiler.reset()
+        self.assertEqual(profiler.histograms(), {})
+
+    def test_report(self):
+        self.assertAlmostEqual(fit_exponent([10, 100, 1000], [1, 100, 10000]), 2)
+        profiler = Profiler()
+        for digits in (64, 128, 256, 512):
+            profiler._record("__mul__", digits, digits * digits, 0)
+            profiler._record("__add__", digits, digits, 0)
+        profiler._record("to_bin", 64, 1, 0)
+        lines = profiler.report().splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(lines[1].split()[0], "__mul__")
+        self.assertTrue(lines[1].endswith("QUADRATIC OR WORSE"))
+        self.assertTrue(lines[2].endswith("linear"))
+        self.assertTrue(lines[3].endswith("unknown"))
+
+
+if __name__ == "__main__":
+    unittest.main()
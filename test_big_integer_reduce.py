@@ -0,0 +1,64 @@
+"""Unittest module for big_integer_reduce module."""
+import math
+import unittest
+from big_integer import BigInteger
+from big_integer_reduce import bigdot, bigprod, bigsum
+
+
+class TestReductions(unittest.TestCase):
+    def setUp(self) -> None:
+        self.values = [
+            int("98765432109876543210" * 3),
+            -int("12345678901234567890" * 2),
+            7,
+            -(10**9),
+            0,
+            int("31415926535897932384" * 40),
+        ]
+        self.numbers = [BigInteger(value) for value in self.values]
+
+    def test_bigsum(self):
+        expected = str(sum(self.values))
+        self.assertEqual(str(bigsum(self.numbers)), expected)
+        self.assertEqual(str(bigsum(iter(self.values))), expected)
+        mixed = [self.numbers[0].to_bin(), str(self.values[5]), *self.values[1:5]]
+        self.assertEqual(str(bigsum(number for number in mixed)), expected)
+        self.assertEqual(str(bigsum([])), "0")
+        self.assertEqual(str(bigsum([self.numbers[0], 0 - self.numbers[0]])), "0")
+        binary = bigsum(number.to_bin() for number in self.numbers)
+        self.assertTrue(binary.is_binary)
+        self.assertEqual(str(binary.from_bin()), expected)
+
+    def test_bigprod(self):
+        values = [value for value in self.values if value]
+        numbers = [BigInteger(value) for value in values]
+        expected = str(math.prod(values))
+        self.assertEqual(str(bigprod(numbers)), expected)
+        self.assertEqual(str(bigprod(iter(values))), expected)
+        self.assertEqual(str(bigprod(numbers[:2] + values[2:])), expected)
+        self.assertEqual(str(bigprod(self.numbers)), "0")
+        self.assertEqual(str(bigprod([])), "1")
+        self.assertEqual(str(bigprod(range(1, 300))), str(math.factorial(299)))
+        binary = bigprod(number.to_bin() for number in numbers)
+        self.assertTrue(binary.is_binary)
+        self.assertEqual(str(binary.from_bin()), expected)
+        single = bigprod([numbers[0]])
+        single += 1
+        self.assertEqual(str(numbers[0]), str(values[0]))
+
+    def test_bigdot(self):
+        factors = [3, -(10**20), 5, 11, 4, 10**2000]
+        second = [3, -(10**20), BigInteger(5).to_bin(), "11", 4, 10**2000]
+        expected = sum(value * factor for value, factor in zip(self.values, factors))
+        self.assertEqual(str(bigdot(self.numbers, iter(second))), str(expected))
+        self.assertEqual(
+            str(bigdot(self.values, self.values)),
+            str(sum(value * value for value in self.values)),
+        )
+        self.assertEqual(str(bigdot([], [])), "0")
+        with self.assertRaises(ValueError):
+            bigdot(self.numbers, self.numbers[1:])
+
+
+if __name__ == "__main__":
+    unittest.main()